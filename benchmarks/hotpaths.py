@@ -0,0 +1,272 @@
+from os import environ
+environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from objectmodel.objectmodel import ObjectModel
+from objectmodel.node import Node
+from objectmodel.undovaluechange import UndoValueChange
+from objectmodel.undoarrayinsert import UndoArrayInsert
+from objectmodel.undoarrayremove import UndoArrayRemove
+from typing import (
+    Self,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+from enum import (
+    Enum,
+    IntFlag,
+    auto,
+)
+from argparse import ArgumentParser
+from datetime import (
+    datetime,
+    timezone,
+)
+from subprocess import (
+    run,
+    DEVNULL,
+)
+from json import (
+    dump,
+    load,
+)
+from platform import (
+    platform,
+    python_version,
+)
+from sys import (
+    argv,
+    exit,
+)
+from time import perf_counter
+from PyQt6.QtCore import (
+    QModelIndex,
+    QFileInfo,
+    Qt,
+    PYQT_VERSION_STR,
+)
+from PyQt6.QtGui import QGuiApplication
+
+class Shading(Enum):
+    Flat = auto()
+    Smooth = auto()
+    Wireframe = auto()
+
+class Visibility(IntFlag):
+    Camera = auto()
+    Shadow = auto()
+    Reflection = auto()
+
+class Wide:
+    FieldCount: int = 32
+
+    def __init__(self: Self, index: int) -> None:
+        for field in range(Wide.FieldCount):
+            setattr(self, 'field{}'.format(field), index + field)
+
+class Chain:
+    def __init__(self: Self, index: int, depth: int) -> None:
+        self.value: int = index
+        self.next: Optional[Chain] = None if depth <= 1 else Chain(index + 1, depth - 1)
+
+class Mixed:
+    def __init__(self: Self, index: int) -> None:
+        self.name: str = 'object{}'.format(index)
+        self.scale: float = 0.5 * index
+        self.shading: Shading = list(Shading)[index % len(Shading)]
+        self.visibility: Visibility = Visibility(1 + index % 7)
+        self.enabled: bool = index % 2 == 0
+        self.texture: QFileInfo = QFileInfo('/textures/{}.png'.format(index % 16))
+
+class Scene:
+    def __init__(self: Self, items: List[Any]) -> None:
+        self.items: List[Any] = items
+
+ChainDepth: int = 64
+
+Shapes: Dict[str, Callable[[int], Scene]] = {
+    'wide': lambda nodeCount: Scene(list(map(Wide, range(max(1, nodeCount // (Wide.FieldCount + 1)))))),
+    'deep': lambda nodeCount: Scene(list(map(lambda index: Chain(index, ChainDepth), range(max(1, nodeCount // (2 * ChainDepth)))))),
+    'long': lambda nodeCount: Scene(list(map(float, range(max(1, nodeCount))))),
+    'mixed': lambda nodeCount: Scene(list(map(Mixed, range(max(1, nodeCount // 7))))),
+}
+
+Roles: List[int] = list(map(lambda role: role.value, Qt.ItemDataRole)) + [ObjectModel.ChangedRole]
+
+def viewport(model: ObjectModel, rowCount: int) -> List[QModelIndex]:
+    indices: List[QModelIndex] = []
+    pending: List[QModelIndex] = [QModelIndex()]
+    while len(pending) > 0 and len(indices) < rowCount:
+        parent: QModelIndex = pending.pop()
+        if model.canFetchMore(parent):
+            model.fetchMore(parent)
+        children: List[QModelIndex] = list(map(
+            lambda row: model.index(row, 0, parent),
+            range(min(model.rowCount(parent), rowCount - len(indices))),
+        ))
+        indices.extend(children)
+        pending.extend(reversed(children))
+    return indices[:rowCount]
+
+def sampleNodes(model: ObjectModel, name: str, count: int) -> List[Node]:
+    nodes: List[Node] = list(filter(
+        lambda node: not node.isRange,
+        model.nodeWithPath(name).nodeIndex.nodes(),
+    ))
+    step: int = max(1, len(nodes) // count)
+    return nodes[::step][:count]
+
+def timePerCall(calls: List[Callable[[], Any]], repeat: int = 1) -> float:
+    begin: float = perf_counter()
+    for _ in range(repeat):
+        for call in calls:
+            call()
+    return (perf_counter() - begin) / max(1, repeat * len(calls))
+
+def measure(shape: str, nodeCount: int, lazy: bool, chunkSize: Optional[int], viewportRows: int, operationCount: int) -> Dict[str, Any]:
+    scene: Scene = Shapes[shape](nodeCount)
+    model: ObjectModel = ObjectModel(lazy=lazy, chunkSize=chunkSize)
+
+    begin: float = perf_counter()
+    model.load('scene', scene)
+    metrics: Dict[str, float] = {'load': perf_counter() - begin}
+    result: Dict[str, Any] = {
+        'shape': shape,
+        'size': nodeCount,
+        'materializedNodes': len(model.nodeWithPath('scene').nodeIndex),
+        'lazy': lazy,
+        'chunkSize': chunkSize,
+        'metrics': metrics,
+    }
+
+    rows: List[QModelIndex] = viewport(model, viewportRows)
+    cells: List[QModelIndex] = [
+        index.siblingAtColumn(column)
+        for index in rows
+        for column in range(model.columnCount())
+    ]
+    begin = perf_counter()
+    for index in cells:
+        for role in Roles:
+            model.data(index, role)
+    metrics['dataSweep'] = perf_counter() - begin
+    metrics['data'] = metrics['dataSweep'] / max(1, len(cells) * len(Roles))
+
+    positions: List[Tuple[int, int, QModelIndex]] = list(map(
+        lambda index: (index.row(), index.column(), index.parent()),
+        cells,
+    ))
+    metrics['index'] = timePerCall(list(map(lambda position: lambda: model.index(*position), positions)), 10)
+    metrics['parent'] = timePerCall(list(map(lambda index: lambda: model.parent(index), cells)), 10)
+    metrics['rowCount'] = timePerCall(list(map(lambda index: lambda: model.rowCount(index), rows)), 10)
+
+    paths: List[str] = list(map(lambda node: node.path, sampleNodes(model, 'scene', 1000)))
+    metrics['indexWithPath'] = timePerCall(list(map(lambda path: lambda: model.indexWithPath(path), paths)))
+
+    itemsIndex: QModelIndex = model.indexWithPath('scene.items')
+    middle: int = len(scene.items) // 2
+    template: Any = scene.items[middle]
+    metrics['insert'] = timePerCall(list(map(
+        lambda _: lambda: model.insertArrayElements(itemsIndex, middle, [template]),
+        range(operationCount),
+    )))
+    metrics['remove'] = timePerCall(list(map(
+        lambda _: lambda: model.removeArrayElements(itemsIndex, middle, 1),
+        range(operationCount),
+    )))
+
+    leaves: List[Node] = list(filter(
+        lambda node: node.isInt or node.isFloat,
+        sampleNodes(model, 'scene', 4 * operationCount),
+    ))[:operationCount]
+    for leaf in leaves:
+        model.undoStack.push(UndoValueChange(model.indexOfNode(leaf, 1), leaf.value + 1))
+    for row in range(0, min(operationCount, len(scene.items)), 4):
+        model.undoStack.push(UndoArrayInsert(itemsIndex, row, [scene.items[row]]))
+        model.undoStack.push(UndoArrayRemove(itemsIndex, row, 1))
+    commandCount: int = model.undoStack.count()
+
+    begin = perf_counter()
+    while model.undoStack.canUndo():
+        model.undoStack.undo()
+    metrics['undo'] = (perf_counter() - begin) / max(1, commandCount)
+    begin = perf_counter()
+    while model.undoStack.canRedo():
+        model.undoStack.redo()
+    metrics['redo'] = (perf_counter() - begin) / max(1, commandCount)
+
+    return result
+
+def revision() -> Optional[str]:
+    try:
+        process = run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, stdin=DEVNULL)
+    except OSError:
+        return None
+    return process.stdout.strip() if process.returncode == 0 else None
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    baselineMetrics: Dict[Tuple[str, int, bool, Optional[int]], Dict[str, float]] = dict(map(
+        lambda result: ((result['shape'], result['size'], result['lazy'], result['chunkSize']), result['metrics']),
+        baseline['results'],
+    ))
+
+    regressions: List[str] = []
+    for result in results['results']:
+        previous: Optional[Dict[str, float]] = baselineMetrics.get((result['shape'], result['size'], result['lazy'], result['chunkSize']))
+        if previous is None:
+            continue
+        for metric, value in result['metrics'].items():
+            if previous.get(metric, 0) <= 0:
+                continue
+            ratio: float = value / previous[metric]
+            line: str = '{} {} {}: {:.3g}s -> {:.3g}s ({:.2f}x)'.format(result['shape'], result['size'], metric, previous[metric], value, ratio)
+            print(line)
+            if ratio > threshold:
+                regressions.append(line)
+    return regressions
+
+if __name__ == '__main__':
+    parser: ArgumentParser = ArgumentParser(description='Time ObjectModel hot paths on synthetic object graphs.')
+    parser.add_argument('--shapes', nargs='+', choices=list(Shapes), default=list(Shapes))
+    parser.add_argument('--sizes', nargs='+', type=int, default=[1000, 10000, 100000, 1000000])
+    parser.add_argument('--lazy', action='store_true', help='load the models lazily')
+    parser.add_argument('--chunk-size', type=int, default=None, help='array length above which rows are grouped into ranges (not grouped by default)')
+    parser.add_argument('--viewport', type=int, default=50, help='number of visible rows in the data() sweep')
+    parser.add_argument('--operations', type=int, default=20, help='number of inserts, removals and undo commands')
+    parser.add_argument('--output', default='benchmarks/hotpaths.json')
+    parser.add_argument('--compare', help='results of an earlier run to compare against')
+    parser.add_argument('--threshold', type=float, default=1.25, help='slowdown ratio reported as a regression')
+    arguments = parser.parse_args()
+
+    application: QGuiApplication = QGuiApplication(argv[:1])
+    results: Dict[str, Any] = {
+        'revision': revision(),
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'python': python_version(),
+        'pyqt': PYQT_VERSION_STR,
+        'platform': platform(),
+        'results': [],
+    }
+    for shape in arguments.shapes:
+        for size in arguments.sizes:
+            result: Dict[str, Any] = measure(shape, size, arguments.lazy, arguments.chunk_size, arguments.viewport, arguments.operations)
+            results['results'].append(result)
+            print('{} {} ({} materialized nodes): {}'.format(
+                shape,
+                size,
+                result['materializedNodes'],
+                ', '.join(map(lambda metric: '{} {:.3g}s'.format(*metric), result['metrics'].items())),
+            ))
+
+    with open(arguments.output, 'w') as file:
+        dump(results, file, indent=2)
+
+    if arguments.compare is not None:
+        with open(arguments.compare) as file:
+            regressions: List[str] = compare(results, load(file), arguments.threshold)
+        if len(regressions) > 0:
+            print('{} regressions above {:.2f}x'.format(len(regressions), arguments.threshold))
+            exit(1)
@@ -0,0 +1,88 @@
+from objectmodel.objectmodel import ObjectModel
+from objectmodel.node import Node
+from typing import (
+    Self,
+    List,
+)
+from sys import (
+    argv,
+    setrecursionlimit,
+)
+from time import perf_counter
+from tracemalloc import (
+    start,
+    stop,
+    get_traced_memory,
+)
+from PyQt6.QtCore import (
+    QCoreApplication,
+    QModelIndex,
+    Qt,
+)
+
+class Vertex:
+    def __init__(self: Self, index: int) -> None:
+        self.x: float = float(index)
+        self.y: float = 0.5 * index
+        self.label: str = 'v{}'.format(index)
+
+class Mesh:
+    def __init__(self: Self, vertexCount: int) -> None:
+        self.vertices: List[Vertex] = list(map(Vertex, range(vertexCount)))
+
+class Chain:
+    def __init__(self: Self, depth: int) -> None:
+        self.value: int = depth
+        if depth > 1:
+            self.next: Chain = Chain(depth - 1)
+
+class Scene:
+    def __init__(self: Self, chainCount: int, depth: int) -> None:
+        self.chains: List[Chain] = list(map(lambda _: Chain(depth), range(chainCount)))
+
+def measureMemory(mesh: Mesh) -> float:
+    start()
+    before, _ = get_traced_memory()
+    root: Node = Node(value=mesh, name='mesh')
+    after, _ = get_traced_memory()
+    stop()
+    return (after - before) / len(root.nodeIndex)
+
+def measureData(mesh: Mesh, sampleCount: int) -> float:
+    model: ObjectModel = ObjectModel()
+    model.load('mesh', mesh)
+
+    verticesIndex: QModelIndex = model.index(0, 0)
+    indices: List[QModelIndex] = []
+    for row in range(min(sampleCount, model.rowCount(verticesIndex))):
+        vertexIndex: QModelIndex = model.index(row, 0, verticesIndex)
+        for childRow in range(model.rowCount(vertexIndex)):
+            for column in range(model.columnCount()):
+                indices.append(model.index(childRow, column, vertexIndex))
+
+    roles: List[Qt.ItemDataRole] = [
+        Qt.ItemDataRole.DisplayRole,
+        Qt.ItemDataRole.BackgroundRole,
+        Qt.ItemDataRole.ForegroundRole,
+    ]
+    begin: float = perf_counter()
+    for index in indices:
+        for role in roles:
+            model.data(index, role)
+    return (perf_counter() - begin) / (len(indices) * len(roles))
+
+def measureDeepLoad(scene: Scene) -> float:
+    begin: float = perf_counter()
+    Node(value=scene, name='scene')
+    return perf_counter() - begin
+
+if __name__ == '__main__':
+    application: QCoreApplication = QCoreApplication(argv)
+    setrecursionlimit(10000)
+    vertexCount: int = int(argv[1]) if len(argv) > 1 else 250000
+    mesh: Mesh = Mesh(vertexCount)
+
+    print('nodes: {}'.format(1 + 1 + 4 * vertexCount))
+    print('memory per node: {:.0f} bytes'.format(measureMemory(mesh)))
+    print('data() per call: {:.2f} us'.format(1e6 * measureData(mesh, 20000)))
+    print('deep load (40 chains of depth 256): {:.2f} s'.format(measureDeepLoad(Scene(40, 256))))
@@ -105,14 +105,16 @@ if __name__ == '__main__':
         if index.internalPointer().parent is None:
             return
 
-        if index.internalPointer().parent.isArray:
+        if index.internalPointer().container.isArray:
             def insertArrayTriggered() -> None:
-                objectModel.undoStack.push(UndoArrayInsert(index))
+                node = index.internalPointer()
+                objectModel.undoStack.push(UndoArrayInsert(objectModel.indexOfNode(node.container), node.index, [node.type()]))
                 insertArrayElementAction.triggered.disconnect(insertArrayTriggered)
             insertArrayElementAction.triggered.connect(insertArrayTriggered)
 
             def removeArrayTriggered() -> None:
-                objectModel.undoStack.push(UndoArrayRemove(index))
+                node = index.internalPointer()
+                objectModel.undoStack.push(UndoArrayRemove(objectModel.indexOfNode(node.container), node.index))
                 removeArrayElementAction.triggered.disconnect(removeArrayTriggered)
             removeArrayElementAction.triggered.connect(removeArrayTriggered)
 
@@ -1,7 +1,30 @@
 from objectmodel.objectmodel import *
 from objectmodel.node import *
+from objectmodel.nodeindex import *
+from objectmodel.nodepath import *
+from objectmodel.nodekind import *
 from objectmodel.undovaluechange import *
+from objectmodel.undovaluebatch import *
 from objectmodel.undoarrayinsert import *
 from objectmodel.undoarrayremove import *
+from objectmodel.undomappinginsert import *
+from objectmodel.undomappingremove import *
 from objectmodel.objectitemdelegate import *
 from objectmodel.colormap import *
+from objectmodel.instrumentation import *
+from objectmodel.nodebuilder import *
+from objectmodel.bufferaccess import *
+from objectmodel.fieldlayout import *
+from objectmodel.typehandler import *
+from objectmodel.typeregistry import *
+from objectmodel.searchindex import *
+from objectmodel.objectfilterproxymodel import *
+from objectmodel.nodehash import *
+from objectmodel.nodediff import *
+from objectmodel.snapshotformat import *
+from objectmodel.snapshotrecord import *
+from objectmodel.snapshotarray import *
+from objectmodel.snapshotwriter import *
+from objectmodel.nodesnapshot import *
+from objectmodel.callstats import *
+from objectmodel.modelprofiler import *
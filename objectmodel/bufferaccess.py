@@ -0,0 +1,87 @@
+from typing import (
+    Any,
+    Optional,
+    Tuple,
+)
+from array import array
+
+try:
+    from numpy import ndarray
+except ImportError:
+    ndarray = None
+
+class BufferAccess:
+    NumericKinds = 'biuf'
+
+    @staticmethod
+    def isBuffer(value: Any) -> bool:
+        if ndarray is not None and isinstance(value, ndarray):
+            return True
+        if isinstance(value, array):
+            return True
+        if isinstance(value, memoryview):
+            return value.ndim <= 1 or value.c_contiguous
+        return False
+
+    @staticmethod
+    def shape(buffer: Any) -> Tuple[int, ...]:
+        if isinstance(buffer, array):
+            return (len(buffer),)
+        return tuple(buffer.shape)
+
+    @staticmethod
+    def length(buffer: Any) -> int:
+        shape: Tuple[int, ...] = BufferAccess.shape(buffer)
+        return shape[0] if len(shape) > 0 else 0
+
+    @staticmethod
+    def item(buffer: Any, index: int) -> Any:
+        if ndarray is not None and isinstance(buffer, ndarray):
+            if buffer.ndim > 1:
+                return buffer[index]
+            return buffer[index].item()
+
+        if isinstance(buffer, memoryview) and buffer.ndim > 1:
+            rowSize: int = buffer.nbytes // buffer.shape[0]
+            return buffer.cast('B')[index * rowSize:(index + 1) * rowSize].cast(buffer.format, buffer.shape[1:])
+
+        return buffer[index]
+
+    @staticmethod
+    def setItem(buffer: Any, index: int, value: Any) -> None:
+        buffer[index] = value
+
+    @staticmethod
+    def isWritable(buffer: Any) -> bool:
+        if ndarray is not None and isinstance(buffer, ndarray):
+            return buffer.flags.writeable
+        if isinstance(buffer, memoryview):
+            return not buffer.readonly
+        return True
+
+    @staticmethod
+    def typeName(buffer: Any) -> str:
+        if ndarray is not None and isinstance(buffer, ndarray):
+            format: str = str(buffer.dtype)
+        elif isinstance(buffer, array):
+            format = buffer.typecode
+        else:
+            format = buffer.format
+
+        return '{} {} {}'.format(
+            type(buffer).__name__,
+            format,
+            'x'.join(map(str, BufferAccess.shape(buffer))),
+        )
+
+    @staticmethod
+    def bounds(values: Any) -> Optional[Tuple[Any, Any]]:
+        if ndarray is not None and isinstance(values, ndarray):
+            if values.size == 0 or values.dtype.kind not in BufferAccess.NumericKinds:
+                return None
+            return values.min().item(), values.max().item()
+
+        try:
+            return min(values), max(values)
+        except (TypeError, ValueError, NotImplementedError):
+            return None
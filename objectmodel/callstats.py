@@ -0,0 +1,71 @@
+from typing import (
+    Self,
+    Any,
+    Dict,
+    List,
+)
+
+class CallStats:
+    SampleLimit: int = 4096
+
+    def __init__(self: Self) -> None:
+        self._count: int = 0
+        self._total: float = 0.0
+        self._maximum: float = 0.0
+        self._samples: List[float] = []
+
+    def clear(self: Self) -> None:
+        self._count = 0
+        self._total = 0.0
+        self._maximum = 0.0
+        self._samples.clear()
+
+    @property
+    def count(self: Self) -> int:
+        return self._count
+
+    @property
+    def total(self: Self) -> float:
+        return self._total
+
+    @property
+    def mean(self: Self) -> float:
+        return self._total / self._count if self._count > 0 else 0.0
+
+    @property
+    def maximum(self: Self) -> float:
+        return self._maximum
+
+    def add(self: Self, elapsed: float) -> None:
+        if len(self._samples) < CallStats.SampleLimit:
+            self._samples.append(elapsed)
+        else:
+            self._samples[self._count % CallStats.SampleLimit] = elapsed
+        self._count += 1
+        self._total += elapsed
+        if elapsed > self._maximum:
+            self._maximum = elapsed
+
+    def percentiles(self: Self, *percents: float) -> List[float]:
+        if len(self._samples) == 0:
+            return [0.0] * len(percents)
+        samples: List[float] = sorted(self._samples)
+        return list(map(
+            lambda percent: samples[min(len(samples) - 1, int(percent / 100 * len(samples)))],
+            percents,
+        ))
+
+    def percentile(self: Self, percent: float) -> float:
+        return self.percentiles(percent)[0]
+
+    def summary(self: Self) -> Dict[str, Any]:
+        p50, p90, p99 = self.percentiles(50, 90, 99)
+        return {
+            'count': self._count,
+            'total': self._total,
+            'mean': self.mean,
+            'p50': p50,
+            'p90': p90,
+            'p99': p99,
+            'max': self._maximum,
+        }
@@ -1,6 +1,13 @@
 from glm import vec3
-from typing import Self
-from PyQt6.QtGui import QColor
+from typing import (
+    Self,
+    List,
+)
+from PyQt6.QtGui import (
+    QColor,
+    QBrush,
+)
+from PyQt6.QtCore import Qt
 
 class ColorMap:
     @staticmethod
@@ -14,11 +21,42 @@ class ColorMap:
         c6: vec3 = vec3(6.14323, -2.36647, 47.7489)
             
         return c0+t*(c1+t*(c2+t*(c3+t*(c4+t*(c5+t*c6)))))
+
+    @staticmethod
+    def foreground(color: QColor) -> QBrush:
+        return QBrush(Qt.GlobalColor.black if 0.299 * color.redF() + 0.587 * color.greenF() + 0.114 * color.blueF() > 186.0 / 255. else Qt.GlobalColor.white)
     
     def __init__(self: Self, colorCount: int = 8) -> None:
+        self.build(colorCount)
+
+    def build(self: Self, colorCount: int) -> None:
         self._colorCount = colorCount
 
         self.colors = list(map(
             lambda colorIndex: QColor.fromRgbF(*ColorMap.cmap(float(colorIndex) / float(colorCount))),
             range(self._colorCount + 1),
         ))
+
+        backgroundColors: List[List[QColor]] = [
+            self.colors,
+            list(map(lambda color: color.lighter(115), self.colors)),
+        ]
+        self.backgrounds: List[List[QBrush]] = list(map(
+            lambda colors: list(map(QBrush, colors)),
+            backgroundColors,
+        ))
+        self.foregrounds: List[List[QBrush]] = list(map(
+            lambda colors: list(map(ColorMap.foreground, colors)),
+            backgroundColors,
+        ))
+
+    @property
+    def colorCount(self: Self) -> int:
+        return self._colorCount
+
+    def fitDepth(self: Self, depth: int) -> bool:
+        if depth < len(self.colors) and 2 * depth >= self._colorCount:
+            return False
+
+        self.build(max(depth, 1))
+        return True
@@ -0,0 +1,95 @@
+from typing import (
+    Self,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+from dataclasses import (
+    is_dataclass,
+    fields as dataclassFields,
+)
+from operator import (
+    attrgetter,
+    itemgetter,
+)
+
+class FieldLayout:
+    Layouts: Dict[type, Self] = {}
+
+    @staticmethod
+    def of(cls: type) -> Self:
+        layout: Optional[FieldLayout] = FieldLayout.Layouts.get(cls)
+        if layout is None:
+            layout = FieldLayout(cls)
+            FieldLayout.Layouts[cls] = layout
+        return layout
+
+    @staticmethod
+    def slotNames(cls: type) -> List[str]:
+        names: List[str] = []
+        for base in reversed(cls.__mro__):
+            slots: Any = base.__dict__.get('__slots__', ())
+            for name in [slots] if isinstance(slots, str) else slots:
+                if name in ('__dict__', '__weakref__'):
+                    continue
+                if name.startswith('__') and not name.endswith('__'):
+                    name = '_{}{}'.format(base.__name__.lstrip('_'), name)
+                names.append(name)
+        return names
+
+    def __init__(self: Self, cls: type) -> None:
+        self._readOnly: bool = False
+        self._accessors: List[Tuple[str, Callable[[Any], Any]]] = []
+
+        if issubclass(cls, tuple) and hasattr(cls, '_fields'):
+            self._readOnly = True
+            self._accessors = list(map(
+                lambda index: (cls._fields[index], itemgetter(index)),
+                range(len(cls._fields)),
+            ))
+        else:
+            self._readOnly = is_dataclass(cls) and cls.__dataclass_params__.frozen
+            names: List[str] = list(map(lambda field: field.name, dataclassFields(cls))) if is_dataclass(cls) else []
+            names.extend(filter(lambda name: name not in names, FieldLayout.slotNames(cls)))
+            self._accessors = list(map(lambda name: (name, attrgetter(name)), names))
+
+        self._names: Set[str] = set(map(lambda accessor: accessor[0], self._accessors))
+        self._hasDict: bool = any(map(lambda base: '__dict__' in base.__dict__, cls.__mro__))
+
+    @property
+    def readOnly(self: Self) -> bool:
+        return self._readOnly
+
+    @property
+    def hasFields(self: Self) -> bool:
+        return len(self._accessors) > 0 or self._hasDict
+
+    def fields(self: Self, value: Any) -> List[Tuple[str, Any]]:
+        result: List[Tuple[str, Any]] = []
+        for name, accessor in self._accessors:
+            try:
+                result.append((name, accessor(value)))
+            except AttributeError:
+                pass
+
+        if self._hasDict:
+            if len(self._names) == 0:
+                result.extend(value.__dict__.items())
+            else:
+                result.extend(filter(lambda field: field[0] not in self._names, value.__dict__.items()))
+
+        return result
+
+    def names(self: Self, value: Any) -> List[str]:
+        if len(self._accessors) == 0:
+            return list(value.__dict__) if self._hasDict else []
+        return list(map(lambda field: field[0], self.fields(value)))
+
+    def count(self: Self, value: Any) -> int:
+        if len(self._accessors) == 0:
+            return len(value.__dict__) if self._hasDict else 0
+        return len(self.fields(value))
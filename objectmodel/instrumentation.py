@@ -0,0 +1,203 @@
+from typing import (
+    Self,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+)
+from objectmodel.node import Node
+from objectmodel.nodeindex import NodeIndex
+
+class ObservableList(list):
+    __slots__ = (
+        '__weakref__',
+    )
+
+    Instrumentations: List[Any] = []
+
+    def changed(self: Self, change: str, start: int = 0, count: int = 0) -> None:
+        for instrumentation in ObservableList.Instrumentations:
+            instrumentation.objectChanged(self, (change, start, count))
+
+    def __setitem__(self: Self, key: Any, value: Any) -> None:
+        length: int = len(self)
+        super().__setitem__(key, value)
+        if isinstance(key, int):
+            self.changed('set', key % length, 1)
+        else:
+            self.changed('reset')
+
+    def __delitem__(self: Self, key: Any) -> None:
+        length: int = len(self)
+        super().__delitem__(key)
+        if isinstance(key, int):
+            self.changed('remove', key % length, 1)
+            return
+
+        start, stop, step = key.indices(length)
+        if step == 1:
+            self.changed('remove', start, max(stop - start, 0))
+        else:
+            self.changed('reset')
+
+    def __iadd__(self: Self, values: Any) -> Self:
+        length: int = len(self)
+        super().__iadd__(values)
+        self.changed('insert', length, len(self) - length)
+        return self
+
+    def __imul__(self: Self, count: int) -> Self:
+        super().__imul__(count)
+        self.changed('reset')
+        return self
+
+    def append(self: Self, value: Any) -> None:
+        super().append(value)
+        self.changed('insert', len(self) - 1, 1)
+
+    def extend(self: Self, values: Any) -> None:
+        length: int = len(self)
+        super().extend(values)
+        self.changed('insert', length, len(self) - length)
+
+    def insert(self: Self, index: int, value: Any) -> None:
+        length: int = len(self)
+        super().insert(index, value)
+        self.changed('insert', min(max(index + length if index < 0 else index, 0), length), 1)
+
+    def pop(self: Self, index: int = -1) -> Any:
+        length: int = len(self)
+        value: Any = super().pop(index)
+        self.changed('remove', index % length, 1)
+        return value
+
+    def remove(self: Self, value: Any) -> None:
+        index: int = self.index(value)
+        super().__delitem__(index)
+        self.changed('remove', index, 1)
+
+    def clear(self: Self) -> None:
+        length: int = len(self)
+        super().clear()
+        self.changed('remove', 0, length)
+
+    def sort(self: Self, *args: Any, **kwargs: Any) -> None:
+        super().sort(*args, **kwargs)
+        self.changed('reset')
+
+    def reverse(self: Self) -> None:
+        super().reverse()
+        self.changed('reset')
+
+class Instrumentation:
+    Classes: Dict[type, Optional[Callable[[Any, str, Any], None]]] = {}
+    Instrumentations: List[Self] = []
+
+    @staticmethod
+    def instrumentClass(cls: type) -> None:
+        if cls in Instrumentation.Classes or cls.__module__ == 'builtins':
+            return
+
+        originalSetattr: Callable[[Any, str, Any], None] = cls.__setattr__
+        if getattr(originalSetattr, 'instrumented', False):
+            return
+        ownSetattr: Optional[Callable[[Any, str, Any], None]] = cls.__dict__.get('__setattr__')
+
+        def __setattr__(self: Any, name: str, value: Any) -> None:
+            originalSetattr(self, name, value)
+            for instrumentation in Instrumentation.Instrumentations:
+                instrumentation.objectChanged(self, name)
+        __setattr__.instrumented = True
+
+        try:
+            cls.__setattr__ = __setattr__
+        except TypeError:
+            return
+        Instrumentation.Classes[cls] = ownSetattr
+
+    @staticmethod
+    def restoreClasses() -> None:
+        for cls, ownSetattr in Instrumentation.Classes.items():
+            if ownSetattr is None:
+                del cls.__setattr__
+            else:
+                cls.__setattr__ = ownSetattr
+        Instrumentation.Classes.clear()
+
+    @staticmethod
+    def isReplaceable(node: Node) -> bool:
+        container: Optional[Node] = node.container
+        if container is None or container.isArray or container.handler.readOnly:
+            return False
+        return not container.isObject or not container.layout.readOnly
+
+    def __init__(
+        self: Self,
+        nodeIndex: NodeIndex,
+        callback: Callable[[Node, Any], None],
+        lists: bool = False,
+    ) -> None:
+        self._nodeIndex: NodeIndex = nodeIndex
+        self._callback: Callable[[Node, Any], None] = callback
+        self._lists: bool = lists
+        self._installed: bool = False
+
+    @property
+    def lists(self: Self) -> bool:
+        return self._lists
+
+    @property
+    def installed(self: Self) -> bool:
+        return self._installed
+
+    def install(self: Self) -> None:
+        if self._installed:
+            return
+
+        self._installed = True
+        Instrumentation.Instrumentations.append(self)
+        if self._lists:
+            ObservableList.Instrumentations.append(self)
+
+        for node in list(self._nodeIndex.nodes()):
+            self.watch(node)
+
+    def watch(self: Self, node: Node) -> None:
+        if not self._installed:
+            return
+
+        nodes: List[Node] = [node]
+        while len(nodes) > 0:
+            node = nodes.pop()
+            if node.isObject:
+                Instrumentation.instrumentClass(node.type)
+            elif node.isArray and self._lists and type(node.value) is list and Instrumentation.isReplaceable(node):
+                value: list = node.value
+                try:
+                    node.value = ObservableList(value)
+                except (AttributeError, TypeError):
+                    node.updateValue(value)
+
+            if node.isMaterialized:
+                nodes.extend(node.children)
+
+    def remove(self: Self) -> None:
+        if not self._installed:
+            return
+
+        self._installed = False
+        Instrumentation.Instrumentations.remove(self)
+        if self._lists:
+            ObservableList.Instrumentations.remove(self)
+            for node in list(self._nodeIndex.nodes()):
+                if type(node.value) is ObservableList and Instrumentation.isReplaceable(node):
+                    node.value = list(node.value)
+
+        if len(Instrumentation.Instrumentations) == 0:
+            Instrumentation.restoreClasses()
+
+    def objectChanged(self: Self, object: Any, key: Any) -> None:
+        node: Optional[Node] = self._nodeIndex.nodeForObject(object)
+        if node is not None:
+            self._callback(node, key)
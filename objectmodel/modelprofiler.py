@@ -0,0 +1,268 @@
+from typing import (
+    Self,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+from logging import (
+    Logger,
+    getLogger,
+)
+from time import perf_counter
+from PyQt6.QtCore import (
+    QObject,
+    QModelIndex,
+    QTimer,
+    Qt,
+)
+from objectmodel.node import Node
+from objectmodel.callstats import CallStats
+
+class ModelProfiler(QObject):
+    Methods: List[str] = [
+        'data',
+        'setData',
+        'index',
+        'parent',
+        'rowCount',
+        'columnCount',
+        'hasChildren',
+        'flags',
+        'canFetchMore',
+        'fetchMore',
+        'headerData',
+        'indexWithPath',
+        'setValue',
+        'insertArrayElements',
+        'removeArrayElements',
+        'insertMappingItem',
+        'removeMappingItem',
+        'flushDataChanged',
+        'refresh',
+        'load',
+        'reload',
+    ]
+
+    UndoMethods: List[str] = [
+        'push',
+        'undo',
+        'redo',
+    ]
+
+    ColumnMethods: List[str] = [
+        'data',
+        'setData',
+        'flags',
+    ]
+
+    RoleArguments: Dict[str, Tuple[int, Qt.ItemDataRole]] = {
+        'data': (1, Qt.ItemDataRole.DisplayRole),
+        'setData': (2, Qt.ItemDataRole.EditRole),
+    }
+
+    Signals: List[str] = [
+        'dataChanged',
+        'headerDataChanged',
+        'layoutAboutToBeChanged',
+        'layoutChanged',
+        'modelAboutToBeReset',
+        'modelReset',
+        'rowsAboutToBeInserted',
+        'rowsInserted',
+        'rowsAboutToBeRemoved',
+        'rowsRemoved',
+        'rowsMoved',
+    ]
+
+    Active: List[Self] = []
+    NodeInit: Callable[..., None] = Node.__init__
+    Log: Logger = getLogger('objectmodel')
+
+    @staticmethod
+    def countingInit(node: Node, *args: Any, **kwargs: Any) -> None:
+        for profiler in ModelProfiler.Active:
+            profiler._nodeCount += 1
+        ModelProfiler.NodeInit(node, *args, **kwargs)
+
+    def __init__(self: Self, model: Any) -> None:
+        super().__init__(model)
+
+        self._model: Any = model
+        self._methods: Dict[str, CallStats] = {}
+        self._columns: Dict[Tuple[str, int], CallStats] = {}
+        self._roles: Dict[Tuple[str, str], CallStats] = {}
+        self._signals: Dict[str, int] = {}
+        self._nodeCount: int = 0
+        self._slots: List[Tuple[Any, Callable[..., None]]] = []
+        self._patched: List[Tuple[Any, str]] = []
+        self._logTimer: QTimer = QTimer(self)
+        self._logTimer.timeout.connect(lambda: ModelProfiler.Log.info(self.report()))
+
+    def roleName(self: Self, role: Any) -> str:
+        if role == self._model.ChangedRole:
+            return 'ChangedRole'
+        try:
+            return Qt.ItemDataRole(role).name
+        except ValueError:
+            return str(int(role))
+
+    @property
+    def isInstalled(self: Self) -> bool:
+        return self in ModelProfiler.Active
+
+    def install(self: Self) -> None:
+        if self.isInstalled:
+            return
+
+        for name in ModelProfiler.Methods:
+            self.patch(self._model, name, name)
+        for name in ModelProfiler.UndoMethods:
+            self.patch(self._model.undoStack, name, 'undoStack.{}'.format(name))
+
+        for name in ModelProfiler.Signals:
+            self.connectSignal(getattr(self._model, name), name)
+        self.connectSignal(self._model.undoStack.indexChanged, 'undoStack.indexChanged')
+
+        if len(ModelProfiler.Active) == 0:
+            Node.__init__ = ModelProfiler.countingInit
+        ModelProfiler.Active.append(self)
+
+    def remove(self: Self) -> None:
+        if not self.isInstalled:
+            return
+
+        ModelProfiler.Active.remove(self)
+        if len(ModelProfiler.Active) == 0:
+            Node.__init__ = ModelProfiler.NodeInit
+
+        for target, name in self._patched:
+            delattr(target, name)
+        self._patched.clear()
+
+        for signal, slot in self._slots:
+            signal.disconnect(slot)
+        self._slots.clear()
+
+        self._logTimer.stop()
+
+    def patch(self: Self, target: Any, name: str, key: str) -> None:
+        method: Callable[..., Any] = getattr(target, name)
+        stats: CallStats = self._methods.setdefault(key, CallStats())
+        roleArgument: Optional[Tuple[int, Qt.ItemDataRole]] = ModelProfiler.RoleArguments.get(name)
+        byColumn: bool = name in ModelProfiler.ColumnMethods and target is self._model
+
+        def profiled(*args: Any, **kwargs: Any) -> Any:
+            begin: float = perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                elapsed: float = perf_counter() - begin
+                stats.add(elapsed)
+                if byColumn and len(args) > 0 and isinstance(args[0], QModelIndex):
+                    self.cellStats(key, args[0].column(), None).add(elapsed)
+                    if roleArgument is not None:
+                        position, defaultRole = roleArgument
+                        role: Any = args[position] if len(args) > position else kwargs.get('role', defaultRole)
+                        self.cellStats(key, None, role).add(elapsed)
+
+        setattr(target, name, profiled)
+        self._patched.append((target, name))
+
+    def cellStats(self: Self, key: str, column: Optional[int], role: Any) -> CallStats:
+        if column is not None:
+            stats: Optional[CallStats] = self._columns.get((key, column))
+            if stats is None:
+                stats = self._columns[(key, column)] = CallStats()
+            return stats
+
+        roleKey: Tuple[str, str] = (key, self.roleName(role))
+        stats = self._roles.get(roleKey)
+        if stats is None:
+            stats = self._roles[roleKey] = CallStats()
+        return stats
+
+    def connectSignal(self: Self, signal: Any, name: str) -> None:
+        self._signals.setdefault(name, 0)
+
+        def count(*args: Any) -> None:
+            self._signals[name] += 1
+
+        signal.connect(count)
+        self._slots.append((signal, count))
+
+    def setLogInterval(self: Self, interval: Optional[int]) -> None:
+        if interval is None:
+            self._logTimer.stop()
+        else:
+            self._logTimer.start(interval)
+
+    @property
+    def logInterval(self: Self) -> Optional[int]:
+        return self._logTimer.interval() if self._logTimer.isActive() else None
+
+    @property
+    def nodeCount(self: Self) -> int:
+        return self._nodeCount
+
+    def reset(self: Self) -> None:
+        for stats in self._methods.values():
+            stats.clear()
+        self._columns.clear()
+        self._roles.clear()
+        for name in self._signals:
+            self._signals[name] = 0
+        self._nodeCount = 0
+
+    def stats(self: Self) -> Dict[str, Any]:
+        columns: Dict[str, Dict[int, Dict[str, Any]]] = {}
+        for (key, column), stats in sorted(self._columns.items()):
+            columns.setdefault(key, {})[column] = stats.summary()
+
+        roles: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for (key, role), stats in sorted(self._roles.items()):
+            roles.setdefault(key, {})[role] = stats.summary()
+
+        return {
+            'methods': dict(map(
+                lambda item: (item[0], item[1].summary()),
+                filter(lambda item: item[1].count > 0, self._methods.items()),
+            )),
+            'columns': columns,
+            'roles': roles,
+            'signals': dict(filter(lambda item: item[1] > 0, self._signals.items())),
+            'nodes': self._nodeCount,
+        }
+
+    def report(self: Self) -> str:
+        rows: List[Tuple[str, CallStats]] = sorted(
+            filter(lambda row: row[1].count > 0, list(self._methods.items()) + list(map(
+                lambda item: ('{}[column {}]'.format(*item[0]), item[1]),
+                self._columns.items(),
+            )) + list(map(
+                lambda item: ('{}[{}]'.format(*item[0]), item[1]),
+                self._roles.items(),
+            ))),
+            key=lambda row: row[1].total,
+            reverse=True,
+        )
+
+        lines: List[str] = ['{:<36} {:>9} {:>10} {:>10} {:>10} {:>10}'.format('method', 'calls', 'total ms', 'mean us', 'p90 us', 'p99 us')]
+        for name, stats in rows:
+            p90, p99 = stats.percentiles(90, 99)
+            lines.append('{:<36} {:>9} {:>10.2f} {:>10.2f} {:>10.2f} {:>10.2f}'.format(
+                name,
+                stats.count,
+                1e3 * stats.total,
+                1e6 * stats.mean,
+                1e6 * p90,
+                1e6 * p99,
+            ))
+        lines.append('signals: {}'.format(', '.join(map(
+            lambda item: '{} {}'.format(*item),
+            filter(lambda item: item[1] > 0, self._signals.items()),
+        )) or 'none'))
+        lines.append('nodes constructed: {}'.format(self._nodeCount))
+        return '\n'.join(lines)
@@ -1,78 +1,245 @@
 from typing import (
     Self,
     Any,
+    Callable,
+    Dict,
     List,
     Optional,
+    Tuple,
 )
-from enum import (
-    Enum,
-    Flag,
-)
-from inspect import isclass
+from itertools import islice
 from functools import reduce
-from PyQt6.QtCore import QFileInfo
+from objectmodel.nodeindex import NodeIndex
+from objectmodel.nodekind import NodeKind
+from objectmodel.bufferaccess import BufferAccess
+from objectmodel.fieldlayout import FieldLayout
+from objectmodel.typeregistry import TypeRegistry
+from objectmodel.typehandler import TypeHandler
+from objectmodel.nodehash import NodeHash
+from objectmodel.nodepath import NodePath
 
 class Node:
+    __slots__ = (
+        '_value',
+        '_parent',
+        '_name',
+        '_index',
+        '_kind',
+        '_depth',
+        '_displayText',
+        '_nodeIndex',
+        '_children',
+        '_childrenByName',
+        '_hash',
+    )
+
+    NoChildren = ()
+
+    ScalarKinds = frozenset((
+        NodeKind.Enum,
+        NodeKind.Flag,
+        NodeKind.Bool,
+        NodeKind.Int,
+        NodeKind.Float,
+        NodeKind.String,
+        NodeKind.FilePath,
+    ))
+
+    @staticmethod
+    def kindOf(value: Any) -> NodeKind:
+        return TypeRegistry.kindOf(value)
+
     def __init__(
         self: Self,
         value: Any,
         index: int = -1,
-        name: str = 'root',
+        name: Optional[str] = 'root',
         parent: Optional[Self] = None,
+        lazy: bool = False,
+        chunkSize: Optional[int] = None,
+        kind: Optional[NodeKind] = None,
     ) -> None:
         self._value: Any = value
         self._parent: Optional[Self] = parent
-        self._name: str = name
+        self._name: Optional[str] = name
         self._index: int = index
+        self._depth: int = 1 if parent is None else parent._depth + 1
+        self._displayText: Optional[str] = None
+        self._hash: Optional[bytes] = None
 
-        self._path: str = self._name if parent is None else '.'.join((parent.path, self._name)) 
-        self._type = type(value)
+        self._nodeIndex: NodeIndex = NodeIndex(lazy, chunkSize) if parent is None else parent._nodeIndex
+        self._kind: NodeKind = self.classify(value) if kind is None else kind
+        self._nodeIndex.add(self)
 
-        self.updateChildren()
+        self._children: Optional[List[Self]] = None
+        self._childrenByName: Optional[Dict[str, Self]] = None
+        if not self._nodeIndex.lazy and self._kind is not NodeKind.Range:
+            self.updateChildren()
 
     def updateChildren(self) -> None:
+        if self._hash is not None:
+            self.invalidateHash()
+        if self._children is not None:
+            for child in self._children:
+                child.unregister()
+        self._childrenByName = None
+
         if self.isObject:
+            fields: List[Tuple[str, Any]] = self.layout.fields(self._value)
             self._children = list(map(
-                lambda key: Node(
-                    value=getattr(self._value, key),
-                    name=key,
+                lambda index: Node(
+                    value=fields[index][1],
+                    name=fields[index][0],
                     parent=self,
-                    index=list(self._value.__dict__.keys()).index(key),
+                    index=index,
                 ),
-                self._value.__dict__.keys(),
+                range(len(fields)),
             ))
-        elif self.isArray:
+        elif self.isMapping:
+            items: List[Tuple[Any, Any]] = list(self._value.items())
             self._children = list(map(
                 lambda index: Node(
-                    value=self._value[index],
-                    name='[{}]'.format(index),
+                    value=items[index][1],
+                    name=items[index][0],
                     parent=self,
                     index=index,
                 ),
-                range(len(self._value)),
+                range(len(items)),
             ))
+        elif self.isArray or self.isBuffer or self.isRange:
+            self._children = None
+            self._children = list(map(self.createChild, range(self.childCount)))
         else:
-            self._children = []
+            self._children = Node.NoChildren
+
+    def createChild(self: Self, row: int) -> Self:
+        if self.isMapping:
+            return self.mappingChild(next(islice(iter(self._value), row, None)), row)
+
+        if self.isRange:
+            return Node(
+                value=self._parent.elementValue(self._value.start + row),
+                name=None,
+                parent=self,
+                index=self._value.start + row,
+            )
+
+        if self._nodeIndex.isGrouped(len(self._value)):
+            chunkSize: int = self._nodeIndex.chunkSize
+            return Node(
+                value=range(row * chunkSize, min(len(self._value), (row + 1) * chunkSize)),
+                name=None,
+                parent=self,
+                index=row,
+                kind=NodeKind.Range,
+            )
+
+        return Node(
+            value=self.elementValue(row),
+            name=None,
+            parent=self,
+            index=row,
+        )
+
+    def elementValue(self: Self, index: int) -> Any:
+        if self.isBuffer:
+            return BufferAccess.item(self._value, index)
+        return self._value[index]
+
+    def rowCountOf(self: Self, length: int) -> int:
+        if self._nodeIndex.isGrouped(length):
+            chunkSize: int = self._nodeIndex.chunkSize
+            return (length + chunkSize - 1) // chunkSize
+        return length
+
+    def unregister(self: Self) -> None:
+        self._nodeIndex.remove(self)
+        if self._children is not None:
+            for child in self._children:
+                child.unregister()
+
+    @property
+    def nodeIndex(self: Self) -> NodeIndex:
+        return self._nodeIndex
 
     @property
     def path(self: Self) -> str:
-        return self._path
+        components: List[str] = [self.pathName]
+        node: Optional[Self] = self.container
+        while node is not None:
+            components.append(node.pathName)
+            node = node.container
+        return NodePath.join(reversed(components))
 
     @property
     def children(self: Self) -> List[Self]:
+        if self._children is None:
+            self.updateChildren()
         return self._children
 
+    @property
+    def isMaterialized(self: Self) -> bool:
+        return self._children is not None
+
+    @property
+    def childCount(self: Self) -> int:
+        if self._children is not None:
+            return len(self._children)
+        if self.isObject:
+            return self.layout.count(self._value)
+        if self.isMapping:
+            return len(self._value)
+        if self.isArray:
+            return self.rowCountOf(len(self._value))
+        if self.isBuffer:
+            return self.rowCountOf(BufferAccess.length(self._value))
+        if self.isRange:
+            return len(self._value)
+        return 0
+
+    @property
+    def hasChildren(self: Self) -> bool:
+        return self.childCount > 0
+
     @property
     def name(self: Self) -> str:
+        if self._name.__class__ is str:
+            return self._name
+        if self._name is None:
+            if self.isRange:
+                return '[{}..{}]'.format(self._value.start, self._value.stop - 1)
+            return '[{}]'.format(self._index)
+        return repr(self._name)
+
+    @property
+    def pathName(self: Self) -> str:
+        if self._name is None:
+            return self.name
+        return NodePath.name(self._name)
+
+    @property
+    def key(self: Self) -> Any:
         return self._name
 
     @property
     def parent(self: Self) -> str:
         return self._parent
 
+    @property
+    def container(self: Self) -> Optional[Self]:
+        if self._parent is not None and self._parent.isRange:
+            return self._parent._parent
+        return self._parent
+
+    @property
+    def row(self: Self) -> int:
+        if self._parent is not None and self._parent.isRange:
+            return self._index - self._parent._value.start
+        return self._index
+
     @property
     def depth(self: Self) -> int:
-        return len(self._path.split('.'))
+        return self._depth
 
     @property
     def value(self: Self) -> Any:
@@ -80,14 +247,132 @@ class Node:
     
     @value.setter
     def value(self: Self, value: Any) -> None:
-        self._value = value
+        container: Optional[Self] = self.container
+        if container is not None and container.isBuffer:
+            BufferAccess.setItem(container.value, self._index, value)
+            self.updateValue(value if self.isBuffer else container.elementValue(self._index))
+            return
+
+        self.updateValue(value)
+
+        if container is None:
+            return
+        
+        if container.isArray:
+            container.value[self._index] = value
+        elif container.isMapping:
+            container.value[self._name] = value
+        else:
+            setattr(container.value, self._name, value)
+
+    @property
+    def displayText(self: Self) -> Optional[str]:
+        return self._displayText
+
+    @displayText.setter
+    def displayText(self: Self, displayText: Optional[str]) -> None:
+        self._displayText = displayText
+
+    def invalidateDisplayText(self: Self) -> None:
+        self._displayText = None
+
+    @property
+    def subtreeHash(self: Self) -> bytes:
+        if self._hash is not None:
+            return self._hash
+
+        if self.isLink:
+            self._hash = NodeHash.LinkHash
+        elif NodeHash.isScalar(self._kind, self._value):
+            self._hash = NodeHash.scalarHash(self._kind, self._value)
+        elif self._children is None:
+            self._hash = NodeHash.valueHash(
+                self._kind,
+                (self._parent._value, self._value) if self.isRange else self._value,
+                self._nodeIndex,
+                set(),
+            )
+        else:
+            self._hash = NodeHash.containerHash(self._kind, map(
+                lambda child: (child.pathName, child.subtreeHash),
+                self._children,
+            ))
+        return self._hash
 
-        if self._parent is not None:
-            setattr(self._parent.value, self._name, value)
+    def invalidateHash(self: Self) -> None:
+        node: Optional[Self] = self
+        while node is not None:
+            node._hash = None
+            node = node._parent
+
+    @property
+    def liveValue(self: Self) -> Any:
+        if self._parent is None or self.isRange:
+            return self._value
+        container: Self = self.container
+        if container.isBuffer:
+            return self._value if self.isBuffer else container.elementValue(self._index)
+        if container.isArray:
+            return container.value[self._index]
+        if container.isMapping:
+            return container.value[self._name]
+        return getattr(container.value, self._name)
+
+    def classify(self: Self, value: Any) -> NodeKind:
+        kind: NodeKind = Node.kindOf(value)
+        if not NodeIndex.isShareable(kind, value):
+            return kind
+
+        owner: Optional[Self] = self._nodeIndex.nodeForObject(value)
+        if owner is not None and owner is not self:
+            return NodeKind.Link
+        return kind
+
+    def updateValue(self: Self, value: Any) -> None:
+        self.invalidateHash()
+        if value is self._value or value.__class__ is self._value.__class__ and self._kind in Node.ScalarKinds:
+            self._value = value
+        else:
+            self._nodeIndex.removeObject(self)
+            self._value = value
+            self._kind = self.classify(value)
+            self._nodeIndex.addObject(self)
+        self._displayText = None
+        if self._nodeIndex.searchIndex is not None:
+            self._nodeIndex.searchIndex.add(self)
+        if self._parent is not None and self._parent.isRange:
+            self._parent._displayText = None
+
+    def promote(self: Self) -> None:
+        self.invalidateHash()
+        self._kind = Node.kindOf(self._value)
+        self._children = None
+        self._childrenByName = None
+        self._displayText = None
+
+    @property
+    def fieldNames(self: Self) -> List[str]:
+        if self.isObject:
+            return self.layout.names(self._value)
+        if self.isMapping:
+            return list(map(lambda key: key if key.__class__ is str else repr(key), self._value))
+        return []
+
+    @property
+    def layout(self: Self) -> FieldLayout:
+        return FieldLayout.of(type(self._value))
+
+    @property
+    def handler(self: Self) -> TypeHandler:
+        return TypeRegistry.handler(type(self._value))
 
     @property
     def type(self: Self) -> Any:
-        return self._type
+        return type(self._value)
+
+    @property
+    def kind(self: Self) -> NodeKind:
+        return self._kind
 
     @property
     def index(self: Self) -> int:
@@ -97,81 +382,284 @@ class Node:
     def maxDepth(self: Self) -> int:
         return reduce(
             lambda accumulator, addition: max(accumulator, addition),
-            map(lambda child: child.maxDepth, self.children),
+            map(lambda child: child.maxDepth, self._children or []),
             self.depth,
         )
 
     @property
     def isEnum(self: Self) -> bool:
-        return isinstance(self._value, Enum) and not isinstance(self._value, Flag)
+        return self._kind is NodeKind.Enum
     
     @property
     def isFlag(self: Self) -> bool:
-        return isinstance(self._value, Flag)
+        return self._kind is NodeKind.Flag
     
     @property
     def isArray(self: Self) -> bool:
-        return isinstance(self._value, list)
+        return self._kind is NodeKind.Array
     
     @property
     def isBool(self: Self) -> bool:
-        return isinstance(self._value, bool)
+        return self._kind is NodeKind.Bool
 
     @property
     def isObject(self: Self) -> bool:
-        return isclass(self._type) and not (
-            self.isEnum or \
-            self.isFlag or \
-            self.isArray or \
-            self.isFloat or \
-            self.isInt or \
-            self.isString or \
-            self.isBool or \
-            self.isFilePath
-        )
+        return self._kind is NodeKind.Object
 
     @property
     def isString(self: Self) -> bool:
-        return self._type == str
+        return self._kind is NodeKind.String
     
     @property
     def isInt(self: Self) -> bool:
-        return self._type == int
+        return self._kind is NodeKind.Int
     
     @property
     def isFloat(self: Self) -> bool:
-        return self._type == float
+        return self._kind is NodeKind.Float
     
     @property
     def isFilePath(self: Self) -> bool:
-        return isinstance(self._value, QFileInfo)
+        return self._kind is NodeKind.FilePath
+
+    @property
+    def isMapping(self: Self) -> bool:
+        return self._kind is NodeKind.Mapping
+
+    @property
+    def isBuffer(self: Self) -> bool:
+        return self._kind is NodeKind.Buffer
+
+    @property
+    def typeName(self: Self) -> str:
+        if self.isBuffer:
+            return BufferAccess.typeName(self._value)
+        typeFormatter: Optional[Callable[[Any], str]] = self.handler.typeFormatter
+        if typeFormatter is not None:
+            return typeFormatter(self._value)
+        return self.type.__name__
+
+    @property
+    def isRange(self: Self) -> bool:
+        return self._kind is NodeKind.Range
+
+    @property
+    def isGrouped(self: Self) -> bool:
+        return self._children is not None and len(self._children) > 0 and self._children[0].isRange
+
+    @property
+    def elementCount(self: Self) -> int:
+        if self._children is None:
+            return 0
+        if self.isGrouped:
+            return self._children[-1]._value.stop
+        return len(self._children)
+
+    def rangeForIndex(self: Self, index: int) -> Optional[Self]:
+        if not self.isGrouped or index < 0 or index >= self.elementCount:
+            return None
+        return self._children[index // self._nodeIndex.chunkSize]
+
+    def rangeForElement(self: Self, name: str) -> Optional[Self]:
+        if not self.isGrouped or not name.startswith('[') or not name.endswith(']'):
+            return None
+
+        try:
+            return self.rangeForIndex(int(name[1:-1]))
+        except ValueError:
+            return None
+
+    def elementNode(self: Self, index: int) -> Optional[Self]:
+        if index < 0 or index >= self.elementCount:
+            return None
+
+        group: Optional[Self] = self.rangeForIndex(index)
+        if group is None:
+            return self._children[index]
+        if group._children is None:
+            return None
+        return group._children[index - group._value.start]
 
     def childWithName(self: Self, name: str) -> Optional[Self]:
-        for child in self._children:
-            if child.name == name:
-                return child
-        return None
+        if self._children is None:
+            self.updateChildren()
 
-    def fromPath(self: Self, path: str) -> Optional[Self]:
-        if not path.startswith(self.name):
+        group: Optional[Self] = self.rangeForElement(name)
+        if group is not None and group._children is None:
+            group.updateChildren()
+
+        return self.materializedChild(name)
+
+    def materializedChild(self: Self, name: str) -> Optional[Self]:
+        if self._children is None:
+            return None
+
+        if self._childrenByName is None:
+            self._childrenByName = dict(map(lambda child: (child.pathName, child), self._children))
+        child: Optional[Self] = self._childrenByName.get(name)
+        if child is not None:
+            return child
+
+        group: Optional[Self] = self.rangeForElement(name)
+        if group is None or group._children is None:
             return None
+        return group._children[int(name[1:-1]) - group._value.start]
 
-        if self._name == path:
-            return self
+    @property
+    def isLink(self: Self) -> bool:
+        return self._kind is NodeKind.Link
 
-        pathComponents: List[str] = path.split('.')
+    @property
+    def linkTarget(self: Self) -> Optional[Self]:
+        if not self.isLink:
+            return None
+        return self._nodeIndex.nodeForObject(self._value)
 
-        if len(pathComponents) <= 1:
+    def fromPath(self: Self, path: str) -> Optional[Self]:
+        pathComponents: List[str] = NodePath.split(path)
+        if pathComponents[0] != self.pathName:
             return None
 
-        return self.childWithName(pathComponents[1]).fromPath('.'.join(pathComponents[1:]))
+        node: Optional[Self] = self
+        for pathComponent in pathComponents[1:]:
+            node = node.childWithName(pathComponent)
+            if node is None:
+                return None
+
+        return node
 
     def insertArrayElement(self: Self, at: int, value: Any) -> None:
-        if self.isArray:
-            self._value.insert(at, value)
-            self.updateChildren()
+        self.insertArrayElements(at, [value])
 
     def removeArrayElement(self: Self, at: int) -> None:
-        if self.isArray:
-            del self._value[at]
-            self.updateChildren()
+        self.removeArrayElements(at, 1)
+
+    def insertArrayElements(self: Self, at: int, values: List[Any]) -> None:
+        self.spliceArray(at, 0, values)
+
+    def removeArrayElements(self: Self, at: int, count: int) -> List[Any]:
+        return self.spliceArray(at, count, [])
+
+    def spliceArray(self: Self, at: int, count: int, values: List[Any]) -> List[Any]:
+        if not self.isArray:
+            return []
+
+        row, removedRows, insertedRows = self.childSplice(at, count, len(values), len(self._value))
+        self.removeChildren(row, removedRows)
+        removed: List[Any] = self.spliceValue(at, count, values)
+        self.insertChildren(row, insertedRows)
+
+        return removed
+
+    def spliceValue(self: Self, at: int, count: int, values: List[Any]) -> List[Any]:
+        removed: List[Any] = self._value[at:at + count]
+        if count > 0:
+            del self._value[at:at + count]
+        if len(values) > 0:
+            self._value[at:at] = values
+        return removed
+
+    def childSplice(
+        self: Self,
+        at: int,
+        removedCount: int,
+        insertedCount: int,
+        length: int,
+    ) -> Tuple[int, int, int]:
+        newLength: int = length - removedCount + insertedCount
+        grouped: bool = self._nodeIndex.isGrouped(length)
+        newGrouped: bool = self._nodeIndex.isGrouped(newLength)
+        if grouped and newGrouped:
+            row: int = at // self._nodeIndex.chunkSize
+            return row, self.rowCountOf(length) - row, self.rowCountOf(newLength) - row
+        if grouped or newGrouped:
+            return 0, self.rowCountOf(length), self.rowCountOf(newLength)
+        return at, removedCount, insertedCount
+
+    def mappingChild(self: Self, key: Any, row: int) -> Self:
+        return Node(
+            value=self._value[key],
+            name=key,
+            parent=self,
+            index=row,
+        )
+
+    def mappingRow(self: Self, key: Any) -> int:
+        child: Optional[Self] = self.materializedChild(NodePath.name(key))
+        if child is not None:
+            return child._index
+        return list(self._value).index(key)
+
+    def insertMappingItem(self: Self, key: Any, value: Any, at: Optional[int] = None) -> int:
+        if not self.isMapping:
+            return -1
+
+        if at is None or at >= len(self._value):
+            self._value[key] = value
+            at = len(self._value) - 1
+        else:
+            items: List[Tuple[Any, Any]] = list(self._value.items())
+            items.insert(at, (key, value))
+            self._value.clear()
+            self._value.update(items)
+
+        self.invalidateHash()
+        if self._children is not None:
+            self.placeChildren(at, [self.mappingChild(key, at)])
+        return at
+
+    def removeMappingItem(self: Self, key: Any) -> Tuple[int, Any]:
+        if not self.isMapping:
+            return -1, None
+
+        row: int = self.mappingRow(key)
+        value: Any = self._value.pop(key)
+        self.removeChildren(row, 1)
+        return row, value
+
+    def insertChildren(self: Self, at: int, count: int) -> None:
+        self.invalidateHash()
+        if self._children is None or count == 0:
+            return
+
+        self.placeChildren(at, list(map(self.createChild, range(at, at + count))))
+
+    def placeChildren(self: Self, at: int, children: List[Self]) -> None:
+        if self._childrenByName is not None:
+            if self.isMapping:
+                self._childrenByName.update(map(lambda child: (child.pathName, child), children))
+            else:
+                self._childrenByName = None
+        self._children[at:at] = children
+        self.renumberChildren(at + len(children))
+
+    def removeChildren(self: Self, at: int, count: int) -> None:
+        self.invalidateHash()
+        if self._children is None or count == 0:
+            return
+
+        for child in self._children[at:at + count]:
+            child.unregister()
+            if self._childrenByName is not None and self.isMapping:
+                del self._childrenByName[child.pathName]
+        if not self.isMapping:
+            self._childrenByName = None
+        del self._children[at:at + count]
+        self.renumberChildren(at)
+
+    def releaseChildren(self: Self) -> None:
+        if self._children is None:
+            return
+
+        for child in self._children:
+            child.unregister()
+        self._children = None
+        self._childrenByName = None
+
+    def renumberChildren(self: Self, start: int) -> None:
+        searchIndex: Optional[Any] = self._nodeIndex.searchIndex
+        for index in range(start, len(self._children)):
+            child: Self = self._children[index]
+            child._index = index
+            if searchIndex is not None and child._name is None:
+                searchIndex.add(child)
@@ -0,0 +1,75 @@
+from PyQt6.QtCore import (
+    QThread,
+    QObject,
+    pyqtSignal,
+)
+from typing import (
+    Self,
+    Any,
+    List,
+    Optional,
+    Set,
+)
+from objectmodel.node import Node
+
+class NodeBuilder(QThread):
+    ProgressInterval: int = 1000
+    Running: Set[QThread] = set()
+
+    progress = pyqtSignal(int)
+    built = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    def __init__(
+        self: Self,
+        name: str,
+        object: Any,
+        lazy: bool = False,
+        parent: Optional[QObject] = None,
+        chunkSize: Optional[int] = None,
+    ) -> None:
+        super().__init__(parent)
+
+        self._name: str = name
+        self._object: Any = object
+        self._lazy: bool = lazy
+        self._chunkSize: Optional[int] = chunkSize
+        self.finished.connect(self.release)
+
+    def start(self: Self) -> None:
+        NodeBuilder.Running.add(self)
+        super().start()
+
+    def cancel(self: Self) -> None:
+        self.requestInterruption()
+
+    def release(self: Self) -> None:
+        NodeBuilder.Running.discard(self)
+        self.deleteLater()
+
+    def run(self: Self) -> None:
+        try:
+            rootNode: Node = Node(value=self._object, name=self._name, lazy=True, chunkSize=self._chunkSize)
+            nodes: List[Node] = [rootNode]
+            nodeCount: int = 0
+            while len(nodes) > 0:
+                if self.isInterruptionRequested():
+                    return
+
+                node: Node = nodes.pop()
+                node.updateChildren()
+                nodeCount += 1
+                if nodeCount % NodeBuilder.ProgressInterval == 0:
+                    self.progress.emit(nodeCount)
+
+                if not self._lazy:
+                    nodes.extend(filter(lambda child: not child.isRange, node.children))
+
+            rootNode.nodeIndex.lazy = self._lazy
+            self.progress.emit(nodeCount)
+        except Exception as exception:
+            self.failed.emit(str(exception))
+            return
+
+        if not self.isInterruptionRequested():
+            self.built.emit(rootNode)
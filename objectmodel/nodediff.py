@@ -0,0 +1,52 @@
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+from objectmodel.node import Node
+from objectmodel.nodehash import NodeHash
+
+class NodeDiff:
+    Changed: str = 'changed'
+    Added: str = 'added'
+    Removed: str = 'removed'
+
+    @staticmethod
+    def diff(
+        left: Node,
+        right: Node,
+        fetchLeft: Optional[Callable[[Node], None]] = None,
+        fetchRight: Optional[Callable[[Node], None]] = None,
+    ) -> List[Tuple[str, Optional[Node], Optional[Node]]]:
+        changes: List[Tuple[str, Optional[Node], Optional[Node]]] = []
+        pairs: List[Tuple[Node, Node]] = [(left, right)]
+        while len(pairs) > 0:
+            leftNode, rightNode = pairs.pop()
+            if leftNode.subtreeHash == rightNode.subtreeHash:
+                continue
+
+            if leftNode.kind is not rightNode.kind or leftNode.kind not in NodeHash.ContainerKinds:
+                changes.append((NodeDiff.Changed, leftNode, rightNode))
+                continue
+
+            if fetchLeft is not None and not leftNode.isMaterialized:
+                fetchLeft(leftNode)
+            if fetchRight is not None and not rightNode.isMaterialized:
+                fetchRight(rightNode)
+
+            rightChildren: Dict[str, Node] = dict(map(lambda child: (child.pathName, child), rightNode.children))
+            childPairs: List[Tuple[Node, Node]] = []
+            for leftChild in leftNode.children:
+                rightChild: Optional[Node] = rightChildren.pop(leftChild.pathName, None)
+                if rightChild is None:
+                    changes.append((NodeDiff.Removed, leftChild, None))
+                else:
+                    childPairs.append((leftChild, rightChild))
+            pairs.extend(reversed(childPairs))
+
+            for rightChild in rightChildren.values():
+                changes.append((NodeDiff.Added, None, rightChild))
+
+        return changes
@@ -0,0 +1,134 @@
+from typing import (
+    Any,
+    Iterable,
+    List,
+    Set,
+    Tuple,
+)
+from hashlib import blake2b
+from PyQt6.QtCore import QFileInfo
+from objectmodel.nodekind import NodeKind
+from objectmodel.nodeindex import NodeIndex
+from objectmodel.nodepath import NodePath
+from objectmodel.bufferaccess import BufferAccess
+from objectmodel.fieldlayout import FieldLayout
+from objectmodel.typeregistry import TypeRegistry
+
+class NodeHash:
+    DigestSize: int = 16
+    LinkHash: bytes = blake2b(repr(NodeKind.Link.value).encode(), digest_size=DigestSize).digest()
+
+    ExactTypes = {
+        bool,
+        int,
+        float,
+        complex,
+        str,
+        bytes,
+        type(None),
+    }
+
+    ContainerKinds = {
+        NodeKind.Object,
+        NodeKind.Mapping,
+        NodeKind.Array,
+        NodeKind.Buffer,
+        NodeKind.Range,
+    }
+
+    @staticmethod
+    def valueKey(value: Any) -> str:
+        if value.__class__ in NodeHash.ExactTypes:
+            return repr(value)
+        if isinstance(value, QFileInfo):
+            return value.absoluteFilePath()
+        try:
+            return '{!r} {}'.format(value, hash(value))
+        except TypeError:
+            return repr(value)
+
+    @staticmethod
+    def isScalar(kind: NodeKind, value: Any) -> bool:
+        if kind is NodeKind.Object:
+            return not FieldLayout.of(type(value)).hasFields
+        return kind not in NodeHash.ContainerKinds
+
+    @staticmethod
+    def scalarHash(kind: NodeKind, value: Any) -> bytes:
+        return blake2b(
+            '{} {} {}'.format(kind.value, type(value).__name__, NodeHash.valueKey(value)).encode('utf-8', 'surrogatepass'),
+            digest_size=NodeHash.DigestSize,
+        ).digest()
+
+    @staticmethod
+    def containerHash(kind: NodeKind, entries: Iterable[Tuple[str, bytes]]) -> bytes:
+        digest: blake2b = blake2b(repr(kind.value).encode(), digest_size=NodeHash.DigestSize)
+        for name, childHash in entries:
+            digest.update(repr(name).encode())
+            digest.update(childHash)
+        return digest.digest()
+
+    @staticmethod
+    def childKind(value: Any, nodeIndex: NodeIndex, seen: Set[int]) -> NodeKind:
+        kind: NodeKind = TypeRegistry.kindOf(value)
+        if NodeIndex.isShareable(kind, value) and (id(value) in seen or nodeIndex.nodeForObject(value) is not None):
+            return NodeKind.Link
+        return kind
+
+    @staticmethod
+    def elements(value: Any, indices: Iterable[int], nodeIndex: NodeIndex, seen: Set[int]) -> List[Tuple[str, Any, NodeKind]]:
+        isBuffer: bool = BufferAccess.isBuffer(value)
+        return list(map(
+            lambda element: ('[{}]'.format(element[0]), element[1], NodeHash.childKind(element[1], nodeIndex, seen)),
+            map(
+                lambda index: (index, BufferAccess.item(value, index) if isBuffer else value[index]),
+                indices,
+            ),
+        ))
+
+    @staticmethod
+    def entries(kind: NodeKind, value: Any, nodeIndex: NodeIndex, seen: Set[int]) -> List[Tuple[str, Any, NodeKind]]:
+        if kind is NodeKind.Object:
+            return list(map(
+                lambda field: (NodePath.name(field[0]), field[1], NodeHash.childKind(field[1], nodeIndex, seen)),
+                FieldLayout.of(type(value)).fields(value),
+            ))
+
+        if kind is NodeKind.Mapping:
+            return list(map(
+                lambda item: (NodePath.name(item[0]), item[1], NodeHash.childKind(item[1], nodeIndex, seen)),
+                value.items(),
+            ))
+
+        if kind is NodeKind.Range:
+            container, indices = value
+            return NodeHash.elements(container, indices, nodeIndex, seen)
+
+        length: int = BufferAccess.length(value) if kind is NodeKind.Buffer else len(value)
+        if not nodeIndex.isGrouped(length):
+            return NodeHash.elements(value, range(length), nodeIndex, seen)
+
+        chunkSize: int = nodeIndex.chunkSize
+        return list(map(
+            lambda start: (
+                '[{}..{}]'.format(start, min(length, start + chunkSize) - 1),
+                (value, range(start, min(length, start + chunkSize))),
+                NodeKind.Range,
+            ),
+            range(0, length, chunkSize),
+        ))
+
+    @staticmethod
+    def valueHash(kind: NodeKind, value: Any, nodeIndex: NodeIndex, seen: Set[int]) -> bytes:
+        if kind is NodeKind.Link:
+            return NodeHash.LinkHash
+        if NodeHash.isScalar(kind, value):
+            return NodeHash.scalarHash(kind, value)
+
+        if NodeIndex.isShareable(kind, value):
+            seen.add(id(value))
+
+        return NodeHash.containerHash(kind, map(
+            lambda entry: (entry[0], NodeHash.valueHash(entry[2], entry[1], nodeIndex, seen)),
+            NodeHash.entries(kind, value, nodeIndex, seen),
+        ))
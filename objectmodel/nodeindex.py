@@ -0,0 +1,134 @@
+from typing import (
+    Self,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Iterable,
+)
+from objectmodel.nodekind import NodeKind
+from objectmodel.fieldlayout import FieldLayout
+from objectmodel.nodepath import NodePath
+
+class NodeIndex:
+    @staticmethod
+    def isShareable(kind: NodeKind, value: Any) -> bool:
+        if kind is NodeKind.Object:
+            return FieldLayout.of(type(value)).hasFields
+        return kind is NodeKind.Array or kind is NodeKind.Mapping
+
+    def __init__(self: Self, lazy: bool = False, chunkSize: Optional[int] = None) -> None:
+        self.lazy: bool = lazy
+        self.chunkSize: Optional[int] = chunkSize
+        self._nodes: Dict[Any, None] = {}
+        self._depthCounts: List[int] = [0]
+        self._objects: Dict[int, Any] = {}
+        self._links: Dict[int, Dict[Any, None]] = {}
+        self._promoted: List[Any] = []
+        self.searchIndex: Optional[Any] = None
+        self.root: Optional[Any] = None
+
+    def __len__(self: Self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self: Self, path: str) -> bool:
+        return self.get(path) is not None
+
+    def get(self: Self, path: str) -> Optional[Any]:
+        if self.root is None:
+            return None
+
+        pathComponents: List[str] = NodePath.split(path)
+        if pathComponents[0] != self.root.pathName:
+            return None
+
+        node: Optional[Any] = self.root
+        for pathComponent in pathComponents[1:]:
+            node = node.materializedChild(pathComponent)
+            if node is None:
+                return None
+
+        return node
+
+    def isGrouped(self: Self, length: int) -> bool:
+        return self.chunkSize is not None and length > self.chunkSize
+
+    def hasNode(self: Self, node: Any) -> bool:
+        return node in self._nodes
+
+    def nodes(self: Self) -> Iterable[Any]:
+        return self._nodes.keys()
+
+    def nodeForObject(self: Self, object: Any) -> Optional[Any]:
+        return self._objects.get(id(object))
+
+    @property
+    def maxDepth(self: Self) -> int:
+        return len(self._depthCounts) - 1
+
+    def add(self: Self, node: Any) -> None:
+        if node in self._nodes:
+            return
+
+        self._nodes[node] = None
+        if node.parent is None:
+            self.root = node
+
+        depth: int = node.depth
+        while len(self._depthCounts) <= depth:
+            self._depthCounts.append(0)
+        self._depthCounts[depth] += 1
+
+        self.addObject(node)
+        if self.searchIndex is not None:
+            self.searchIndex.add(node)
+
+    def remove(self: Self, node: Any) -> None:
+        if node not in self._nodes:
+            return
+
+        del self._nodes[node]
+
+        self._depthCounts[node.depth] -= 1
+        while len(self._depthCounts) > 1 and self._depthCounts[-1] == 0:
+            self._depthCounts.pop()
+
+        self.removeObject(node)
+        if self.searchIndex is not None:
+            self.searchIndex.remove(node)
+
+    def addObject(self: Self, node: Any) -> None:
+        if node.isLink:
+            self._links.setdefault(id(node.value), {})[node] = None
+        elif NodeIndex.isShareable(node.kind, node.value):
+            self._objects.setdefault(id(node.value), node)
+
+    def removeObject(self: Self, node: Any) -> None:
+        key: int = id(node.value)
+        links: Optional[Dict[Any, None]] = self._links.get(key)
+        if node.isLink:
+            if links is not None:
+                links.pop(node, None)
+                if len(links) == 0:
+                    del self._links[key]
+            return
+
+        if self._objects.get(key) is not node:
+            return
+
+        del self._objects[key]
+        if links is None:
+            return
+
+        link: Any = next(iter(links))
+        del links[link]
+        if len(links) == 0:
+            del self._links[key]
+        self._objects[key] = link
+        link.promote()
+        self._promoted.append(link)
+
+    def takePromoted(self: Self) -> List[Any]:
+        promoted: List[Any] = list(filter(self.hasNode, self._promoted))
+        self._promoted.clear()
+        return promoted
@@ -0,0 +1,19 @@
+from enum import (
+    Enum,
+    auto,
+)
+
+class NodeKind(Enum):
+    Object = auto()
+    Array = auto()
+    Enum = auto()
+    Flag = auto()
+    Bool = auto()
+    Int = auto()
+    Float = auto()
+    String = auto()
+    FilePath = auto()
+    Link = auto()
+    Range = auto()
+    Buffer = auto()
+    Mapping = auto()
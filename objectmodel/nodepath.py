@@ -0,0 +1,67 @@
+from typing import (
+    Any,
+    Iterable,
+    List,
+)
+
+class NodePath:
+    Separator: str = '.'
+    Escape: str = '\\'
+    KeyMarker: str = '#'
+
+    @staticmethod
+    def escape(name: str) -> str:
+        if NodePath.Separator not in name and NodePath.Escape not in name:
+            return name
+        return name.replace(NodePath.Escape, NodePath.Escape * 2).replace(NodePath.Separator, NodePath.Escape + NodePath.Separator)
+
+    @staticmethod
+    def unescape(component: str) -> str:
+        if NodePath.Escape not in component:
+            return component
+        if component.startswith(NodePath.Escape + NodePath.KeyMarker):
+            component = component[2:]
+
+        characters: List[str] = []
+        escaped: bool = False
+        for character in component:
+            if escaped or character != NodePath.Escape:
+                characters.append(character)
+                escaped = False
+            else:
+                escaped = True
+        return ''.join(characters)
+
+    @staticmethod
+    def name(key: Any) -> str:
+        if key.__class__ is str:
+            return NodePath.escape(key)
+        return NodePath.Escape + NodePath.KeyMarker + NodePath.escape(repr(key))
+
+    @staticmethod
+    def join(components: Iterable[str]) -> str:
+        return NodePath.Separator.join(components)
+
+    @staticmethod
+    def append(path: str, component: str) -> str:
+        return NodePath.Separator.join((path, component))
+
+    @staticmethod
+    def split(path: str) -> List[str]:
+        if NodePath.Escape not in path:
+            return path.split(NodePath.Separator)
+
+        components: List[str] = []
+        start: int = 0
+        index: int = 0
+        while index < len(path):
+            character: str = path[index]
+            if character == NodePath.Escape:
+                index += 2
+                continue
+            if character == NodePath.Separator:
+                components.append(path[start:index])
+                start = index + 1
+            index += 1
+        components.append(path[start:])
+        return components
@@ -0,0 +1,183 @@
+from typing import (
+    Self,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+from mmap import (
+    mmap,
+    ACCESS_READ,
+)
+from functools import reduce
+from ast import literal_eval
+from operator import mul
+from struct import calcsize
+import sys
+from PyQt6.QtCore import QFileInfo
+from objectmodel.nodekind import NodeKind
+from objectmodel.snapshotformat import SnapshotFormat
+from objectmodel.nodepath import NodePath
+from objectmodel.snapshotrecord import SnapshotRecord
+from objectmodel.snapshotarray import SnapshotArray
+
+class NodeSnapshot:
+    def __init__(self: Self, fileName: str) -> None:
+        with open(fileName, 'rb') as file:
+            self._map: mmap = mmap(file.fileno(), 0, access=ACCESS_READ)
+        self._view: memoryview = memoryview(self._map)
+
+        magic: bytes = SnapshotFormat.Magic
+        trailerOffset: int = len(self._map) - len(magic) - SnapshotFormat.Entry.size - SnapshotFormat.Trailer.size
+        if trailerOffset < len(magic) or self._map[:len(magic)] != magic or self._map[-len(magic):] != magic:
+            self._view.release()
+            self._map.close()
+            raise ValueError('{} is not an object model snapshot.'.format(fileName))
+
+        stringsOffset, stringCount, intsOffset, intCount, floatsOffset, floatCount, expandedOffset, expandedCount = SnapshotFormat.Trailer.unpack_from(self._map, trailerOffset)
+        self._stringOffsets: memoryview = self._view[stringsOffset:stringsOffset + 8 * (stringCount + 1)].cast('Q')
+        self._stringData: int = stringsOffset + 8 * (stringCount + 1)
+        self._ints: memoryview = self._view[intsOffset:intsOffset + 8 * intCount].cast('q')
+        self._floats: memoryview = self._view[floatsOffset:floatsOffset + 8 * floatCount].cast('d')
+        self._expanded: memoryview = self._view[expandedOffset:expandedOffset + 4 * expandedCount].cast('I')
+        self._views: List[memoryview] = [self._stringOffsets, self._ints, self._floats, self._expanded]
+
+        self._strings: Dict[int, str] = {}
+        self._types: Dict[int, Optional[type]] = {}
+        self._values: Dict[int, Any] = {}
+
+        rootEntry: Tuple[int, int, int, int] = SnapshotFormat.Entry.unpack_from(self._map, trailerOffset + SnapshotFormat.Trailer.size)
+        self._name: str = self.string(rootEntry[0])
+        self._root: Any = self.valueOf(rootEntry)
+
+    def close(self: Self) -> None:
+        self._values = {}
+        self._root = None
+        for view in self._views:
+            view.release()
+        self._view.release()
+        self._map.close()
+
+    @property
+    def closed(self: Self) -> bool:
+        return self._map.closed
+
+    @property
+    def name(self: Self) -> str:
+        return self._name
+
+    @property
+    def root(self: Self) -> Any:
+        return self._root
+
+    @property
+    def expandedPaths(self: Self) -> List[str]:
+        return list(map(self.string, self._expanded))
+
+    def string(self: Self, stringId: int) -> str:
+        text: Optional[str] = self._strings.get(stringId)
+        if text is None:
+            start: int = self._stringData + self._stringOffsets[stringId]
+            text = str(self._view[start:self._stringData + self._stringOffsets[stringId + 1]], 'utf-8')
+            self._strings[stringId] = text
+        return text
+
+    def typeName(self: Self, typeId: int) -> str:
+        return self.string(typeId).rsplit('.', 1)[-1].rsplit(':', 1)[-1]
+
+    def typeOf(self: Self, typeId: int) -> Optional[type]:
+        if typeId in self._types:
+            return self._types[typeId]
+
+        moduleName, qualifiedName = self.string(typeId).split(':', 1)
+        try:
+            cls: Optional[type] = reduce(getattr, qualifiedName.split('.'), sys.modules[moduleName])
+        except (KeyError, AttributeError):
+            cls = None
+        self._types[typeId] = cls
+        return cls
+
+    def literal(self: Self, typeId: int, text: str) -> Any:
+        try:
+            value: Any = literal_eval(text)
+        except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+            return text
+        return value if SnapshotFormat.typeKey(type(value)) == self.string(typeId) else text
+
+    def count(self: Self, offset: int) -> int:
+        return SnapshotFormat.Count.unpack_from(self._map, offset)[0]
+
+    def entry(self: Self, offset: int, row: int) -> Tuple[int, int, int, int]:
+        return SnapshotFormat.Entry.unpack_from(self._map, offset + SnapshotFormat.Count.size + row * SnapshotFormat.Entry.size)
+
+    def buffer(self: Self, offset: int) -> memoryview:
+        formatId, ndim = SnapshotFormat.Buffer.unpack_from(self._map, offset)
+        offset += SnapshotFormat.Buffer.size
+        shape: List[int] = list(map(
+            lambda dimension: SnapshotFormat.Dimension.unpack_from(self._map, offset + dimension * SnapshotFormat.Dimension.size)[0],
+            range(ndim),
+        ))
+        offset += ndim * SnapshotFormat.Dimension.size
+        offset += SnapshotFormat.padding(offset)
+
+        format: str = self.string(formatId)
+        size: int = reduce(mul, shape, calcsize(format))
+        view: memoryview = self._view[offset:offset + size].cast(format, shape)
+        self._views.append(view)
+        return view
+
+    def valueOf(self: Self, entry: Tuple[int, int, int, int]) -> Any:
+        _, kindValue, typeId, payload = entry
+        kind: NodeKind = NodeKind(kindValue)
+
+        if kind is NodeKind.Int:
+            return self._ints[payload]
+        if kind is NodeKind.Float:
+            return self._floats[payload]
+        if kind is NodeKind.Bool:
+            return payload != 0
+        if kind is NodeKind.String:
+            if typeId != SnapshotFormat.NoString:
+                return self.literal(typeId, self.string(payload))
+            return self.string(payload)
+        if kind is NodeKind.FilePath:
+            return QFileInfo(self.string(payload))
+        if kind is NodeKind.Link:
+            path: str = self.string(payload)
+            target: Any = self.valueAt(path)
+            return path if target is None else target
+
+        if kind is NodeKind.Enum:
+            cls: Optional[type] = self.typeOf(typeId)
+            name: str = self.string(payload)
+            return '{}.{}'.format(self.typeName(typeId), name) if cls is None else cls[name]
+        if kind is NodeKind.Flag:
+            cls = self.typeOf(typeId)
+            return self._ints[payload] if cls is None else cls(self._ints[payload])
+
+        value: Any = self._values.get(payload)
+        if value is None:
+            if kind is NodeKind.Buffer:
+                value = self.buffer(payload)
+            elif kind is NodeKind.Array:
+                value = SnapshotArray(self, payload, typeId)
+            else:
+                value = SnapshotRecord(self, payload, typeId)
+            self._values[payload] = value
+        return value
+
+    def valueAt(self: Self, path: str) -> Any:
+        names: List[str] = list(map(NodePath.unescape, NodePath.split(path)))
+        if names[0] != self._name:
+            return None
+
+        value: Any = self._root
+        for name in names[1:]:
+            if isinstance(value, SnapshotArray) and name.startswith('[') and name.endswith(']'):
+                value = value[int(name[1:-1])]
+            elif isinstance(value, SnapshotRecord) and name in value:
+                value = value[name]
+            else:
+                return None
+        return value
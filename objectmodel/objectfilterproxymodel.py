@@ -0,0 +1,78 @@
+from PyQt6.QtCore import (
+    QSortFilterProxyModel,
+    QModelIndex,
+    QObject,
+    QTimer,
+)
+from typing import (
+    Self,
+    Optional,
+    Set,
+)
+from objectmodel.node import Node
+
+class ObjectFilterProxyModel(QSortFilterProxyModel):
+    def __init__(
+        self: Self,
+        parent: Optional[QObject] = None,
+    ) -> None:
+        super().__init__(parent)
+
+        self._searchText: str = ''
+        self._visibleNodes: Optional[Set[Node]] = None
+        self._updatePending: bool = False
+
+    @property
+    def searchText(self: Self) -> str:
+        return self._searchText
+
+    @property
+    def visibleNodes(self: Self) -> Optional[Set[Node]]:
+        return self._visibleNodes
+
+    def setSourceModel(self: Self, sourceModel: QObject) -> None:
+        if self.sourceModel() is not None:
+            self.sourceModel().dataChanged.disconnect(self.scheduleUpdate)
+            self.sourceModel().rowsInserted.disconnect(self.scheduleUpdate)
+            self.sourceModel().rowsRemoved.disconnect(self.scheduleUpdate)
+            self.sourceModel().modelReset.disconnect(self.scheduleUpdate)
+
+        super().setSourceModel(sourceModel)
+
+        if sourceModel is not None:
+            sourceModel.dataChanged.connect(self.scheduleUpdate)
+            sourceModel.rowsInserted.connect(self.scheduleUpdate)
+            sourceModel.rowsRemoved.connect(self.scheduleUpdate)
+            sourceModel.modelReset.connect(self.scheduleUpdate)
+
+        self.updateVisibleNodes()
+
+    def setSearchText(self: Self, searchText: str) -> None:
+        self._searchText = searchText
+        self.updateVisibleNodes()
+
+    def scheduleUpdate(self: Self) -> None:
+        if self._updatePending or self._visibleNodes is None:
+            return
+
+        self._updatePending = True
+        QTimer.singleShot(0, self.updateVisibleNodes)
+
+    def updateVisibleNodes(self: Self) -> None:
+        self._updatePending = False
+        if self._searchText == '' or self.sourceModel() is None:
+            self._visibleNodes = None
+        else:
+            self._visibleNodes = set()
+            for node in self.sourceModel().search(self._searchText):
+                while node is not None and node not in self._visibleNodes:
+                    self._visibleNodes.add(node)
+                    node = node.parent
+
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self: Self, sourceRow: int, sourceParent: QModelIndex) -> bool:
+        if self._visibleNodes is None:
+            return True
+
+        return self.sourceModel().index(sourceRow, 0, sourceParent).internalPointer() in self._visibleNodes
@@ -2,21 +2,20 @@ from PyQt6.QtWidgets import (
     QStyledItemDelegate,
     QStyleOptionViewItem,
     QWidget,
-    QComboBox,
-    QFileDialog,
 )
 from PyQt6.QtCore import (
     QObject,
     QModelIndex,
     QAbstractItemModel,
     Qt,
-    QFileInfo,
 )
 from typing import (
     Optional,
     Self,
+    Any,
 )
 from objectmodel.node import Node
+from objectmodel.typehandler import TypeHandler
 
 class ObjectItemDelegate(QStyledItemDelegate):
     def __init__(self,
@@ -35,22 +34,9 @@ class ObjectItemDelegate(QStyledItemDelegate):
             return super().createEditor(parent, option, index)
 
         if index.column() == 1:
-            if node.isEnum:
-                comboBox = QComboBox(parent)
-                comboBox.addItems([enumKey.name for enumKey in node.type])
-                return comboBox
-            
-            elif node.isBool:
-                comboBox = QComboBox(parent)
-                comboBox.addItems(['True', 'False'])
-                return comboBox
-            
-            elif node.isFilePath:
-                dialog = QFileDialog()
-                dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
-                dialog.setDirectory(node._value.path())
-                dialog.setWindowTitle('Change {}'.format(node.name))
-                return dialog
+            handler: TypeHandler = node.handler
+            if handler.editorFactory is not None:
+                return handler.editorFactory(parent, node)
 
         return super().createEditor(parent, option, index)
 
@@ -66,11 +52,9 @@ class ObjectItemDelegate(QStyledItemDelegate):
             return
         
         if index.column() == 1:
-            if node.isEnum:
-                editor.setCurrentText(node.value.name)
-            
-            elif node.isBool:
-                editor.setCurrentText(str(node.value))
+            handler: TypeHandler = node.handler
+            if handler.editorSetter is not None:
+                handler.editorSetter(editor, node)
 
         super().setEditorData(editor, index)
 
@@ -87,40 +71,13 @@ class ObjectItemDelegate(QStyledItemDelegate):
             return
         
         if index.column() == 1:
-            if node.isEnum:
-                model.setData(index, getattr(node.type, editor.currentText()), Qt.ItemDataRole.EditRole)
-                return
-
-            if node.isFloat:
+            handler: TypeHandler = node.handler
+            if handler.parser is not None:
                 try:
-                    model.setData(index, float(editor.text()), Qt.ItemDataRole.EditRole)
-                except:
-                    pass
-                return
-
-            if node.isInt:
-                try:
-                    model.setData(index, int(editor.text()), Qt.ItemDataRole.EditRole)
-                except:
-                    pass
-                return
-            
-            if node.isBool:
-                try:
-                    model.setData(index, editor.currentText() == 'True', Qt.ItemDataRole.EditRole)
-                except:
-                    pass
-                return
-            
-            if node.isFilePath:
-                try:
-                    if editor.result() == QFileDialog.DialogCode.Rejected:
-                        return
-
-                    selectedFiles = editor.selectedFiles()
-                    model.setData(index, QFileInfo(selectedFiles[0]), Qt.ItemDataRole.EditRole)
+                    value: Any = handler.parser(editor, node)
                 except:
-                    pass
+                    return
+                model.setData(index, value, Qt.ItemDataRole.EditRole)
                 return
 
         super().setModelData(editor, model, index)
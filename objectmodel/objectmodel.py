@@ -3,21 +3,50 @@ from typing import (
     Self,
     Any,
     List,
+    Dict,
+    Set,
+    Iterator,
+    Callable,
+    Tuple,
+    Iterable,
 )
 from PyQt6.QtCore import (
     QModelIndex,
     QObject,
     QAbstractItemModel,
     Qt,
+    QTimer,
+    pyqtSignal,
 )
 from PyQt6.QtGui import (
     QUndoStack,
+    QUndoCommand,
+    QBrush,
     QColor,
 )
 from objectmodel.node import Node
+from objectmodel.nodeindex import NodeIndex
+from objectmodel.nodepath import NodePath
 from objectmodel.undovaluechange import UndoValueChange
+from objectmodel.undovaluebatch import UndoValueBatch
+from objectmodel.undoarrayinsert import UndoArrayInsert
+from objectmodel.undoarrayremove import UndoArrayRemove
+from objectmodel.undomappinginsert import UndoMappingInsert
+from objectmodel.undomappingremove import UndoMappingRemove
 from objectmodel.colormap import ColorMap
+from objectmodel.instrumentation import Instrumentation
+from objectmodel.nodebuilder import NodeBuilder
+from objectmodel.bufferaccess import BufferAccess
+from objectmodel.typeregistry import TypeRegistry
+from objectmodel.searchindex import SearchIndex
+from objectmodel.nodediff import NodeDiff
+from objectmodel.nodehash import NodeHash
+from objectmodel.nodesnapshot import NodeSnapshot
+from objectmodel.snapshotwriter import SnapshotWriter
+from objectmodel.modelprofiler import ModelProfiler
 from copy import deepcopy
+from contextlib import contextmanager
+from time import perf_counter
 
 class ObjectModel(QAbstractItemModel):
     HeaderNames = [
@@ -26,28 +55,270 @@ class ObjectModel(QAbstractItemModel):
         'Type',
     ]
 
+    MaterializedRangeLimit = 64
+
+    ChangedRole = Qt.ItemDataRole.UserRole + 1
+    ChangedBrush = QBrush(QColor(255, 140, 0))
+
+    loadProgress = pyqtSignal(int)
+    loadFinished = pyqtSignal()
+    loadFailed = pyqtSignal(str)
+
+    ValueRoles = [
+        Qt.ItemDataRole.DisplayRole,
+        Qt.ItemDataRole.EditRole,
+    ]
+
     def __init__(
         self: Self,
         undoStack: Optional[QUndoStack] = None,
         parent: Optional[QObject] = None,
+        lazy: bool = False,
+        chunkSize: Optional[int] = None,
     ) -> None:
         super().__init__(parent)
 
+        self._lazy: bool = lazy
+        self._chunkSize: Optional[int] = chunkSize
+        self._materializedRanges: Dict[Node, None] = {}
+        self._searchIndex: Optional[SearchIndex] = None
+        self._changedNodes: Set[Node] = set()
+        self._snapshot: Optional[NodeSnapshot] = None
+        self._profiler: Optional[ModelProfiler] = None
         self._rootNode = Node(value='Empty')
         self._undoStack = QUndoStack() if undoStack is None else undoStack
+        self._colorMap: ColorMap = ColorMap()
+        self._formatters: Dict[type, Callable[[Any], str]] = {}
+        self._pendingDataChanges: Dict[Node, Set[Node]] = {}
+        self._transactionDepth: int = 0
+        self._valueBatch: Optional[UndoValueBatch] = None
+        self._replaying: bool = False
+        self._refreshQueue: List[Node] = []
+        self._instrumentation: Optional[Instrumentation] = None
+        self._nodeBuilder: Optional[NodeBuilder] = None
+        self._refreshBudget: Optional[float] = None
+        self._pollTimer: QTimer = QTimer(self)
+        self._pollTimer.timeout.connect(lambda: self.refresh(self._refreshBudget))
+
+    @property
+    def lazy(self: Self) -> bool:
+        return self._lazy
+
+    @property
+    def chunkSize(self: Self) -> Optional[int]:
+        return self._chunkSize
+
+    @property
+    def maxDepth(self: Self) -> int:
+        return self._rootNode.nodeIndex.maxDepth
 
     @property
     def undoStack(self: Self) -> QUndoStack:
         return self._undoStack
 
     def load(self: Self, name: str, object: Any) -> None:
+        self.cancelLoad()
+        rootNode: Node = Node(value=object, name=name, lazy=self._lazy, chunkSize=self._chunkSize)
+        if not rootNode.isMaterialized:
+            rootNode.updateChildren()
+        self.setRootNode(rootNode)
+
+    def saveSnapshot(self: Self, fileName: str, expandedPaths: Iterable[str] = ()) -> None:
+        SnapshotWriter.save(fileName, self._rootNode, expandedPaths)
+
+    def loadSnapshot(self: Self, fileName: str) -> NodeSnapshot:
+        snapshot: NodeSnapshot = NodeSnapshot(fileName)
+        self.load(snapshot.name, snapshot.root)
+        self._snapshot = snapshot
+        return snapshot
+
+    @property
+    def snapshot(self: Self) -> Optional[NodeSnapshot]:
+        return self._snapshot
+
+    def loadAsync(self: Self, name: str, object: Any) -> None:
+        self.cancelLoad()
+        self._nodeBuilder = NodeBuilder(name, object, self._lazy, None, self._chunkSize)
+        self._nodeBuilder.progress.connect(self.loadProgress)
+        self._nodeBuilder.built.connect(self.nodeBuilderFinished)
+        self._nodeBuilder.failed.connect(self.loadFailed)
+        self.destroyed.connect(self._nodeBuilder.cancel)
+        self._nodeBuilder.start()
+
+    def cancelLoad(self: Self) -> None:
+        if self._nodeBuilder is None:
+            return
+
+        nodeBuilder: NodeBuilder = self._nodeBuilder
+        self._nodeBuilder = None
+        nodeBuilder.progress.disconnect()
+        nodeBuilder.built.disconnect()
+        nodeBuilder.failed.disconnect()
+        nodeBuilder.cancel()
+
+    @property
+    def isLoading(self: Self) -> bool:
+        return self._nodeBuilder is not None
+
+    def nodeBuilderFinished(self: Self, rootNode: Node) -> None:
+        if self.sender() is not self._nodeBuilder:
+            return
+
+        self._nodeBuilder = None
+        self.setRootNode(rootNode)
+        self.loadFinished.emit()
+
+    def setRootNode(self: Self, rootNode: Node) -> None:
+        self.removeInstrumentation()
         self.beginResetModel()
+        self._pendingDataChanges.clear()
+        self._refreshQueue.clear()
+        self._materializedRanges.clear()
+        self._changedNodes.clear()
+        snapshot: Optional[NodeSnapshot] = self._snapshot
+        self._snapshot = None
         self._undoStack.clear()
         self._undoStack.setClean()
-        self._rootNode = Node(value=object, name=name)
-        self._colorMap = ColorMap(self._rootNode.maxDepth)
+        self._rootNode.nodeIndex.searchIndex = None
+        self._rootNode = rootNode
+        self._colorMap = ColorMap(self.maxDepth)
+        if self._searchIndex is not None:
+            self.enableSearch()
         self.endResetModel()
 
+        if snapshot is not None:
+            snapshot.close()
+
+    def diff(self: Self, other: Self) -> List[Tuple[str, Optional[Node], Optional[Node]]]:
+        return NodeDiff.diff(
+            self._rootNode,
+            other._rootNode,
+            lambda node: self.fetchMore(self.indexOfNode(node)),
+            lambda node: other.fetchMore(other.indexOfNode(node)),
+        )
+
+    def compareWith(self: Self, other: Optional[Self]) -> None:
+        changedNodes: Set[Node] = set() if other is None else set(filter(
+            lambda node: node is not None,
+            map(lambda change: change[1], self.diff(other)),
+        ))
+
+        for node in self._changedNodes ^ changedNodes:
+            self.notifyDataChanged(node)
+        self._changedNodes = changedNodes
+
+    def enableSearch(self: Self) -> None:
+        if self._searchIndex is None:
+            self._searchIndex = SearchIndex()
+        self._searchIndex.clear()
+
+        nodeIndex: NodeIndex = self._rootNode.nodeIndex
+        nodeIndex.searchIndex = self._searchIndex
+        for node in nodeIndex.nodes():
+            self._searchIndex.add(node)
+
+    def disableSearch(self: Self) -> None:
+        self._rootNode.nodeIndex.searchIndex = None
+        self._searchIndex = None
+
+    @property
+    def isSearchEnabled(self: Self) -> bool:
+        return self._searchIndex is not None
+
+    def enableProfiling(self: Self, logInterval: Optional[int] = None) -> ModelProfiler:
+        if self._profiler is None:
+            self._profiler = ModelProfiler(self)
+            self._profiler.install()
+        self._profiler.setLogInterval(logInterval)
+        return self._profiler
+
+    def disableProfiling(self: Self) -> None:
+        if self._profiler is None:
+            return
+
+        self._profiler.remove()
+        self._profiler = None
+
+    @property
+    def isProfiling(self: Self) -> bool:
+        return self._profiler is not None
+
+    @property
+    def profiler(self: Self) -> Optional[ModelProfiler]:
+        return self._profiler
+
+    def search(self: Self, text: str) -> List[Node]:
+        if self._searchIndex is None:
+            self.enableSearch()
+        return self._searchIndex.search(text)
+
+    def prefixSearch(self: Self, prefix: str) -> List[Node]:
+        if self._searchIndex is None:
+            self.enableSearch()
+        return self._searchIndex.prefixSearch(prefix)
+
+    def reload(self: Self, object: Any) -> None:
+        self.cancelLoad()
+        lists: Optional[bool] = None if self._instrumentation is None else self._instrumentation.lists
+        self.removeInstrumentation()
+        self._refreshQueue.clear()
+        self._undoStack.clear()
+        self._undoStack.setClean()
+
+        self.reloadNode(self._rootNode, object)
+        self.flushDataChanged()
+
+        if lists is not None:
+            self.instrument(lists)
+
+    def reloadNode(self: Self, node: Node, value: Any) -> None:
+        if node.isRange:
+            node.invalidateDisplayText()
+            self.notifyDataChanged(node)
+            if node.isMaterialized:
+                for child in node.children:
+                    self.reloadNode(child, child.liveValue)
+            return
+
+        if type(value) is not node.type:
+            self.rebuildNode(node, value)
+            return
+
+        if node.isBuffer:
+            if value is not node.value:
+                self.rebuildNode(node, value)
+            elif node.isMaterialized:
+                for child in list(node.children):
+                    self.reloadNode(child, child.liveValue)
+            return
+
+        if not node.isObject and not node.isMapping and not node.isArray and not node.isLink:
+            if value is not node.value:
+                changed: bool = value != node.value
+                node.updateValue(value)
+                if changed:
+                    self.notifyDataChanged(node)
+            return
+
+        node.updateValue(value)
+        if not node.isMaterialized:
+            return
+
+        if node.isLink:
+            if len(node.children) > 0:
+                self.rebuildNode(node, value)
+            return
+
+        if (node.isObject or node.isMapping) and node.fieldNames != list(map(lambda child: child.name, node.children)):
+            self.rebuildNode(node, value)
+            return
+
+        if node.isArray:
+            self.syncArrayLength(node)
+
+        for child in list(node.children):
+            self.reloadNode(child, child.liveValue)
+
     def index(
         self: Self,
         row: int,
@@ -68,13 +339,62 @@ class ObjectModel(QAbstractItemModel):
         if parentNode == self._rootNode or parentNode is None:
             return QModelIndex()
 
-        return self.createIndex(parentNode.index, 0, parentNode)
+        return self.createIndex(parentNode.row, 0, parentNode)
 
     def rowCount(self: Self, parent: QModelIndex = QModelIndex()) -> int:
         if parent.column() > 0:
             return 0
 
-        return len(self.parentNode(parent).children)
+        node: Node = self.parentNode(parent)
+        if not node.isMaterialized:
+            return 0
+
+        return len(node.children)
+
+    def hasChildren(self: Self, parent: QModelIndex = QModelIndex()) -> bool:
+        if parent.column() > 0:
+            return False
+
+        return self.parentNode(parent).hasChildren
+
+    def canFetchMore(self: Self, parent: QModelIndex) -> bool:
+        if parent.column() > 0:
+            return False
+
+        node: Node = self.parentNode(parent)
+        return not node.isMaterialized and node.hasChildren
+
+    def fetchMore(self: Self, parent: QModelIndex) -> None:
+        if not self.canFetchMore(parent):
+            return
+
+        node: Node = self.parentNode(parent)
+        self.beginInsertRows(parent, 0, node.childCount - 1)
+        node.updateChildren()
+        self.endInsertRows()
+
+        self._colorMap.fitDepth(self.maxDepth)
+        self.watch(node)
+
+        if node.isRange:
+            self._materializedRanges.pop(node, None)
+            self._materializedRanges[node] = None
+            while len(self._materializedRanges) > ObjectModel.MaterializedRangeLimit:
+                self.releaseRange(next(iter(self._materializedRanges)))
+
+    def releaseRange(self: Self, node: Node) -> None:
+        self._materializedRanges.pop(node, None)
+        if not node.isMaterialized or not self.isAttached(node):
+            return
+
+        self.beginRemoveRows(self.indexOfNode(node), 0, len(node.children) - 1)
+        node.releaseChildren()
+        self.endRemoveRows()
+        self.promoteLinks()
+
+    def releaseRanges(self: Self) -> None:
+        for node in list(self._materializedRanges):
+            self.releaseRange(node)
 
     def parentNode(self: Self, index: QModelIndex) -> Node:
         return index.internalPointer() if index.isValid() else self._rootNode
@@ -97,32 +417,77 @@ class ObjectModel(QAbstractItemModel):
                 return node.name
 
             elif index.column() == 1:
-                if node.isArray:
+                if node.isRange:
+                    if node.displayText is None:
+                        node.displayText = self.summarizeRange(node)
+                    return node.displayText
+                if node.isArray or node.isBuffer:
                     return None
-                if node.isObject:
+                if node.isMapping or (node.isObject and node.layout.hasFields):
                     return None
-                if node.isEnum:
-                    return node.value.name
-                if node.isFilePath:
-                    return '/'.join(map(lambda component: component[0] if len(component) > 0 else '', node.value.path().split('/'))) + '/' + node.value.fileName()
+                if node.isLink:
+                    target: Optional[Node] = node.linkTarget
+                    return '-> {}'.format('?' if target is None else target.path)
 
-                return str(node.value)
+                displayText: Optional[str] = node.displayText
+                if displayText is None:
+                    displayText = self.formatValue(node)
+                    node.displayText = displayText
+                return displayText
 
             elif index.column() == 2:
-                return node.type.__name__
+                return node.typeName
             
         elif role == Qt.ItemDataRole.BackgroundRole:
-            useDarkPalette: bool = index.row() % 2 == 0
-            color: QColor = self._colorMap.colors[node.depth]
-            return color if useDarkPalette else color.lighter(115)
+            if len(self._changedNodes) > 0 and node in self._changedNodes:
+                return ObjectModel.ChangedBrush
+            return self._colorMap.backgrounds[index.row() & 1][node.depth]
         
         elif role == Qt.ItemDataRole.ForegroundRole:
-            useDarkPalette: bool = index.row() % 2 == 0
-            color: QColor = self._colorMap.colors[node.depth]
-            return QColor(Qt.GlobalColor.black if 0.299 * color.redF() + 0.587 * color.greenF() + 0.114 * color.blueF() > 186.0 / 255. else Qt.GlobalColor.white)
+            return self._colorMap.foregrounds[index.row() & 1][node.depth]
+
+        elif role == ObjectModel.ChangedRole:
+            return node in self._changedNodes
 
         return None
 
+    def formatValue(self: Self, node: Node) -> str:
+        formatter: Optional[Callable[[Any], str]] = self._formatters.get(node.type)
+        if formatter is None:
+            formatter = TypeRegistry.handler(node.type).formatter
+        if formatter is not None:
+            return formatter(node.value)
+
+        return str(node.value)
+
+    def summarizeRange(self: Self, node: Node) -> str:
+        values: Any = node.parent.value[node.value.start:node.value.stop]
+        bounds: Optional[Tuple[Any, Any]] = BufferAccess.bounds(values)
+        if bounds is None:
+            return 'len {}'.format(len(node.value))
+        return 'len {}, min {}, max {}'.format(len(node.value), *bounds)
+
+    def setFormatter(
+        self: Self,
+        type: type,
+        formatter: Optional[Callable[[Any], str]],
+    ) -> None:
+        if formatter is None:
+            self._formatters.pop(type, None)
+        else:
+            self._formatters[type] = formatter
+
+        self.refreshDisplay()
+
+    def refreshDisplay(self: Self, index: QModelIndex = QModelIndex()) -> None:
+        nodes: List[Node] = [self.parentNode(index)]
+        while len(nodes) > 0:
+            node: Node = nodes.pop()
+            node.invalidateDisplayText()
+            self.notifyDataChanged(node)
+            if node.isMaterialized:
+                nodes.extend(node.children)
+
     def setData(
         self: Self,
         index: QModelIndex,
@@ -133,23 +498,382 @@ class ObjectModel(QAbstractItemModel):
             return False
 
         if role == Qt.ItemDataRole.EditRole:
+            if self.inTransaction:
+                self.valueBatch().append(index.internalPointer(), value)
+                return True
+
             self._undoStack.push(UndoValueChange(index, value))
             return True
 
         return False
     
+    @contextmanager
+    def transaction(self: Self, text: str = 'Transaction') -> Iterator[Self]:
+        if self.inTransaction:
+            yield self
+            return
+
+        self._transactionDepth += 1
+        self._undoStack.beginMacro(text)
+        succeeded: bool = False
+        try:
+            yield self
+            succeeded = True
+        finally:
+            self._valueBatch = None
+            self._undoStack.endMacro()
+            self._transactionDepth -= 1
+
+            macro: QUndoCommand = self._undoStack.command(self._undoStack.index() - 1)
+            if not succeeded:
+                macro.undo()
+            if not succeeded or macro.childCount() == 0:
+                macro.setObsolete(True)
+                self._undoStack.undo()
+            self.flushDataChanged()
+
+    @property
+    def inTransaction(self: Self) -> bool:
+        return self._transactionDepth > 0
+
+    def setValue(self: Self, path: str, value: Any) -> bool:
+        node: Optional[Node] = self.nodeWithPath(path)
+        if node is None:
+            return False
+
+        if self.inTransaction:
+            self.valueBatch().append(node, value, path)
+            return True
+
+        return self.setData(self.indexOfNode(node), value)
+
+    def assignValue(self: Self, node: Node, value: Any) -> None:
+        rebuild: bool = node.kind in NodeHash.ContainerKinds or node.isLink or Node.kindOf(value) in NodeHash.ContainerKinds
+        node.value = value
+        if rebuild:
+            self.rebuildNode(node, node.value)
+        else:
+            self.notifyDataChanged(node)
+
+    def valueBatch(self: Self) -> UndoValueBatch:
+        if self._valueBatch is None:
+            self._valueBatch = UndoValueBatch(self)
+            self._undoStack.push(self._valueBatch)
+        return self._valueBatch
+
+    def closeValueBatch(self: Self) -> None:
+        self._valueBatch = None
+
+    @property
+    def isRecording(self: Self) -> bool:
+        return not self._replaying
+
+    def record(self: Self, command: QUndoCommand) -> None:
+        self.closeValueBatch()
+        self._undoStack.push(command)
+
+    def replay(self: Self, change: Callable[[], Any]) -> Any:
+        replaying: bool = self._replaying
+        self._replaying = True
+        try:
+            return change()
+        finally:
+            self._replaying = replaying
+
+    def notifyDataChanged(self: Self, node: Node) -> None:
+        if node.parent is None:
+            return
+
+        if len(self._pendingDataChanges) == 0 and not self.inTransaction:
+            QTimer.singleShot(0, self.flushDataChanged)
+
+        self._pendingDataChanges.setdefault(node.parent, set()).add(node)
+        if node.parent.isRange:
+            self.notifyDataChanged(node.parent)
+
+    def flushDataChanged(self: Self) -> None:
+        if self.inTransaction:
+            return
+
+        pendingDataChanges: Dict[Node, Set[Node]] = self._pendingDataChanges
+        self._pendingDataChanges = {}
+
+        for parentNode, nodes in pendingDataChanges.items():
+            if not parentNode.isMaterialized or not self.isAttached(parentNode):
+                continue
+
+            children: List[Node] = parentNode.children
+            rows: List[int] = sorted(filter(
+                lambda row: row < len(children) and children[row] in nodes,
+                map(lambda node: node.row, nodes),
+            ))
+            if len(rows) == 0:
+                continue
+
+            first: int = rows[0]
+            for previous, row in zip(rows, rows[1:] + [None]):
+                if row == previous + 1:
+                    continue
+
+                self.dataChanged.emit(
+                    self.createIndex(first, 1, children[first]),
+                    self.createIndex(previous, 2, children[previous]),
+                    ObjectModel.ValueRoles,
+                )
+                first = row
+
+    def instrument(self: Self, lists: bool = False) -> None:
+        self.removeInstrumentation()
+        self._instrumentation = Instrumentation(self._rootNode.nodeIndex, self.objectChanged, lists)
+        self._instrumentation.install()
+
+    def removeInstrumentation(self: Self) -> None:
+        if self._instrumentation is None:
+            return
+
+        self._instrumentation.remove()
+        self._instrumentation = None
+
+    @property
+    def isInstrumented(self: Self) -> bool:
+        return self._instrumentation is not None
+
+    def watch(self: Self, node: Node) -> None:
+        if self._instrumentation is not None:
+            self._instrumentation.watch(node)
+
+    def objectChanged(self: Self, node: Node, key: Any) -> None:
+        if not node.isMaterialized:
+            return
+
+        if not node.isArray:
+            child: Optional[Node] = node.childWithName(NodePath.name(key))
+            self.syncNode(node if child is None else child)
+            return
+
+        change, start, count = key
+        if change == 'set':
+            for index in range(start, start + count):
+                child: Optional[Node] = node.elementNode(index)
+                if child is not None:
+                    self.syncNode(child)
+        elif change == 'insert' and count > 0 and self.isAttached(node):
+            self.spliceRows(node, *node.childSplice(start, 0, count, len(node.value) - count))
+        elif change == 'remove' and count > 0 and self.isAttached(node):
+            self.spliceRows(node, *node.childSplice(start, count, 0, len(node.value) + count))
+        elif change == 'reset':
+            self.syncArrayLength(node)
+            for child in node.children:
+                if not child.isRange:
+                    self.syncNode(child)
+                    continue
+
+                child.invalidateDisplayText()
+                self.notifyDataChanged(child)
+                if child.isMaterialized:
+                    for element in child.children:
+                        self.syncNode(element)
+
+    def startPolling(self: Self, interval: int = 16, budget: Optional[float] = 0.004) -> None:
+        self._refreshBudget = budget
+        self._pollTimer.start(interval)
+
+    def stopPolling(self: Self) -> None:
+        self._pollTimer.stop()
+
+    @property
+    def isPolling(self: Self) -> bool:
+        return self._pollTimer.isActive()
+
+    def refresh(self: Self, budget: Optional[float] = None) -> bool:
+        deadline: Optional[float] = None if budget is None else perf_counter() + budget
+        if len(self._refreshQueue) == 0:
+            self._refreshQueue.append(self._rootNode)
+
+        while len(self._refreshQueue) > 0:
+            if deadline is not None and perf_counter() >= deadline:
+                break
+
+            node: Node = self._refreshQueue.pop()
+            if not node.nodeIndex.hasNode(node):
+                continue
+            self.syncNode(node)
+            if node.isMaterialized:
+                self._refreshQueue.extend(reversed(node.children))
+
+        if not self.inTransaction:
+            self.flushDataChanged()
+
+        return len(self._refreshQueue) == 0
+
+    def syncNode(self: Self, node: Node) -> None:
+        try:
+            value: Any = node.liveValue
+        except (AttributeError, IndexError, KeyError):
+            return
+
+        if value is not node.value:
+            if node.isObject or node.isMapping or node.isArray or node.isBuffer or node.isLink or Node.kindOf(value) is not node.kind:
+                self.rebuildNode(node, value)
+                return
+
+            changed: bool = type(value) is not node.type or value != node.value
+            node.updateValue(value)
+            if changed:
+                self.notifyDataChanged(node)
+            return
+
+        if not node.isMaterialized:
+            return
+
+        if node.isArray or node.isBuffer:
+            self.syncArrayLength(node)
+        elif (node.isObject or node.isMapping) and node.fieldNames != list(map(lambda child: child.name, node.children)):
+            self.rebuildNode(node, value)
+
+    def syncArrayLength(self: Self, node: Node) -> None:
+        elementCount: int = node.elementCount
+        length: int = len(node.value)
+        if elementCount == length or not self.isAttached(node):
+            return
+
+        if length > elementCount:
+            self.spliceRows(node, *node.childSplice(elementCount, 0, length - elementCount, elementCount))
+        else:
+            self.spliceRows(node, *node.childSplice(length, elementCount - length, 0, elementCount))
+
+    def spliceRows(
+        self: Self,
+        node: Node,
+        row: int,
+        removedRows: int,
+        insertedRows: int,
+        splice: Optional[Callable[[], Any]] = None,
+    ) -> Any:
+        parent: QModelIndex = self.indexOfNode(node)
+        self.closeValueBatch()
+        if removedRows > 0:
+            self.beginRemoveRows(parent, row, row + removedRows - 1)
+            node.removeChildren(row, removedRows)
+            self.endRemoveRows()
+
+        result: Any = None if splice is None else splice()
+
+        if insertedRows > 0:
+            self.beginInsertRows(parent, row, row + insertedRows - 1)
+            node.insertChildren(row, insertedRows)
+            self.endInsertRows()
+            for child in node.children[row:row + insertedRows]:
+                self.watch(child)
+
+        self.promoteLinks()
+        self._colorMap.fitDepth(self.maxDepth)
+        return result
+
+    def rebuildNode(self: Self, node: Node, value: Any) -> None:
+        if not self.isAttached(node):
+            return
+
+        parent: QModelIndex = self.indexOfNode(node)
+        self.closeValueBatch()
+        if node.isMaterialized and len(node.children) > 0:
+            self.beginRemoveRows(parent, 0, len(node.children) - 1)
+            node.releaseChildren()
+            self.endRemoveRows()
+        else:
+            node.releaseChildren()
+
+        node.updateValue(value)
+        if not self._lazy or node.parent is None:
+            if node.hasChildren:
+                self.beginInsertRows(parent, 0, node.childCount - 1)
+                node.updateChildren()
+                self.endInsertRows()
+            else:
+                node.updateChildren()
+
+        self.notifyDataChanged(node)
+        self._colorMap.fitDepth(self.maxDepth)
+        self.watch(node)
+        self.promoteLinks()
+
+    def promoteLinks(self: Self) -> None:
+        for node in self._rootNode.nodeIndex.takePromoted():
+            if not self.isAttached(node):
+                continue
+
+            if not self._lazy and node.hasChildren:
+                self.beginInsertRows(self.indexOfNode(node), 0, node.childCount - 1)
+                node.updateChildren()
+                self.endInsertRows()
+                self._colorMap.fitDepth(self.maxDepth)
+            self.notifyDataChanged(node)
+            self.watch(node)
+
+    def isAttached(self: Self, node: Node) -> bool:
+        while node.parent is not None:
+            if not node.parent.isMaterialized:
+                return False
+            siblings: List[Node] = node.parent.children
+            if node.row >= len(siblings) or siblings[node.row] is not node:
+                return False
+            node = node.parent
+
+        return node is self._rootNode
+
     def indexWithPath(self: Self, path: str) -> QModelIndex:
-        return list(filter(
-            lambda index: index.internalPointer().path == path,
-            self.match(self.createIndex(0, 0, self._rootNode), Qt.ItemDataRole.DisplayRole, path.split('.')[-1], -1, Qt.MatchFlag.MatchRecursive),
-        ))[0]
+        return self.indexOfNode(self.nodeWithPath(path))
+
+    def nodeWithPath(self: Self, path: str) -> Optional[Node]:
+        node: Optional[Node] = self._rootNode.nodeIndex.get(path)
+        if node is None:
+            node = self.fetchPath(path)
+
+        return node
+
+    def indexOfNode(self: Self, node: Optional[Node], column: int = 0) -> QModelIndex:
+        if node is None or node is self._rootNode:
+            return QModelIndex()
+
+        return self.createIndex(node.row, column, node)
+
+    def fetchPath(self: Self, path: str) -> Optional[Node]:
+        pathComponents: List[str] = NodePath.split(path)
+        if pathComponents[0] != self._rootNode.pathName:
+            return None
+
+        node: Node = self._rootNode
+        for pathComponent in pathComponents[1:]:
+            self.fetchMore(self.indexOfNode(node))
+            group: Optional[Node] = node.rangeForElement(pathComponent)
+            if group is not None:
+                self.fetchMore(self.indexOfNode(group))
+                node = group
+            node = node.childWithName(pathComponent)
+            if node is None:
+                return None
+
+        return node
 
     def flags(self: Self, index: QModelIndex) -> Qt.ItemFlag:
         _flags = super().flags(index)
-        if index.column() == 1:
+        if index.column() == 1 and self.isEditable(index.internalPointer()):
             _flags = _flags | Qt.ItemFlag.ItemIsEditable
         return _flags
 
+    def isEditable(self: Self, node: Node) -> bool:
+        if node.isRange or node.isBuffer:
+            return False
+
+        container: Optional[Node] = node.container
+        if container is None:
+            return True
+        if container.handler.readOnly:
+            return False
+        if container.isBuffer:
+            return BufferAccess.isWritable(container.value)
+        return not container.isObject or not container.layout.readOnly
+
     def headerData(
         self: Self,
         section: int,
@@ -172,15 +896,8 @@ class ObjectModel(QAbstractItemModel):
         if not index.isValid():
             return
 
-        parentNode: Node = self.parentNode(index)
-        if parentNode is None:
-            return
-
-        self.beginInsertRows(index.parent(), index.row(), index.row())
-        index.parent().internalPointer().insertArrayElement(index.row(), index.internalPointer().type() if value is None else value)
-        self.endInsertRows()
-
-        self.rowsInserted.emit(index.parent(), index.row(), index.row())
+        node: Node = index.internalPointer()
+        self.insertArrayElements(self.indexOfNode(node.container), node.index, [node.type() if value is None else value])
 
     def removeArrayElementAt(
         self: Self,
@@ -189,12 +906,112 @@ class ObjectModel(QAbstractItemModel):
         if not index.isValid():
             return
 
-        parentNode: Node = self.parentNode(index)
-        if parentNode is None:
+        node: Node = index.internalPointer()
+        self.removeArrayElements(self.indexOfNode(node.container), node.index, 1)
+
+    def insertArrayElements(
+        self: Self,
+        parent: QModelIndex,
+        row: int,
+        values: List[Any],
+    ) -> None:
+        parentNode: Node = self.parentNode(parent)
+        if not parentNode.isArray or len(values) == 0:
+            return
+
+        if self.isRecording:
+            self.record(UndoArrayInsert(parent, row, values, self))
+            return
+
+        if not parentNode.isMaterialized:
+            self.closeValueBatch()
+            parentNode.insertArrayElements(row, values)
             return
 
-        self.beginRemoveRows(index.parent(), index.row(), index.row())
-        index.parent().internalPointer().removeArrayElement(index.row())
+        self.spliceRows(
+            parentNode,
+            *parentNode.childSplice(row, 0, len(values), len(parentNode.value)),
+            lambda: parentNode.spliceValue(row, 0, values),
+        )
+
+    def removeArrayElements(
+        self: Self,
+        parent: QModelIndex,
+        row: int,
+        count: int,
+    ) -> List[Any]:
+        parentNode: Node = self.parentNode(parent)
+        if not parentNode.isArray or count <= 0:
+            return []
+
+        if self.isRecording:
+            command: UndoArrayRemove = UndoArrayRemove(parent, row, count, self)
+            self.record(command)
+            return command.values
+
+        if not parentNode.isMaterialized:
+            self.closeValueBatch()
+            return parentNode.removeArrayElements(row, count)
+
+        return self.spliceRows(
+            parentNode,
+            *parentNode.childSplice(row, count, 0, len(parentNode.value)),
+            lambda: parentNode.spliceValue(row, count, []),
+        )
+
+    def insertMappingItem(
+        self: Self,
+        parent: QModelIndex,
+        key: Any,
+        value: Any,
+        row: Optional[int] = None,
+    ) -> bool:
+        parentNode: Node = self.parentNode(parent)
+        if not parentNode.isMapping or key in parentNode.value:
+            return False
+
+        if self.isRecording:
+            command: UndoMappingInsert = UndoMappingInsert(parent, key, value, self, row)
+            self.record(command)
+            return command.inserted
+
+        self.closeValueBatch()
+        if not parentNode.isMaterialized:
+            parentNode.insertMappingItem(key, value, row)
+            return True
+
+        at: int = len(parentNode.value) if row is None else min(row, len(parentNode.value))
+        self.beginInsertRows(parent, at, at)
+        parentNode.insertMappingItem(key, value, at)
+        self.endInsertRows()
+
+        self._colorMap.fitDepth(self.maxDepth)
+        self.watch(parentNode.children[at])
+        return True
+
+    def removeMappingItem(
+        self: Self,
+        parent: QModelIndex,
+        key: Any,
+    ) -> Tuple[int, Any]:
+        parentNode: Node = self.parentNode(parent)
+        if not parentNode.isMapping or key not in parentNode.value:
+            return -1, None
+
+        if self.isRecording:
+            command: UndoMappingRemove = UndoMappingRemove(parent, key, self)
+            self.record(command)
+            return command.row, command.value
+
+        self.closeValueBatch()
+        if not parentNode.isMaterialized:
+            return parentNode.removeMappingItem(key)
+
+        row: int = parentNode.mappingRow(key)
+        self.beginRemoveRows(parent, row, row)
+        result: Tuple[int, Any] = parentNode.removeMappingItem(key)
         self.endRemoveRows()
+        self.promoteLinks()
 
-        self.rowsRemoved.emit(self.parent(index), index.row(), index.row())
+        self._colorMap.fitDepth(self.maxDepth)
+        return result
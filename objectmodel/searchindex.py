@@ -0,0 +1,105 @@
+from typing import (
+    Self,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Callable,
+)
+
+class SearchIndex:
+    GramSize: int = 3
+
+    @staticmethod
+    def textOf(node: Any) -> str:
+        if node.isObject or node.isMapping or node.isArray or node.isBuffer or node.isLink or node.isRange:
+            return node.name.lower()
+
+        formatter: Optional[Callable[[Any], str]] = node.handler.formatter
+        return '\n'.join((node.name, str(node.value) if formatter is None else formatter(node.value))).lower()
+
+    @staticmethod
+    def gramsOf(text: str) -> Set[str]:
+        if len(text) < SearchIndex.GramSize:
+            return {text}
+        gramSize: int = SearchIndex.GramSize
+        return {text[start:start + gramSize] for start in range(len(text) - gramSize + 1)}
+
+    def __init__(self: Self) -> None:
+        self._grams: Dict[str, Set[Any]] = {}
+        self._texts: Dict[Any, str] = {}
+
+    def __len__(self: Self) -> int:
+        return len(self._texts)
+
+    def __contains__(self: Self, node: Any) -> bool:
+        return node in self._texts
+
+    def add(self: Self, node: Any) -> None:
+        text: str = SearchIndex.textOf(node)
+        if self._texts.get(node) == text:
+            return
+
+        if node in self._texts:
+            self.remove(node)
+        self._texts[node] = text
+
+        grams: Dict[str, Set[Any]] = self._grams
+        for gram in SearchIndex.gramsOf(text):
+            nodes: Optional[Set[Any]] = grams.get(gram)
+            if nodes is None:
+                grams[gram] = {node}
+            else:
+                nodes.add(node)
+
+    def remove(self: Self, node: Any) -> None:
+        text: Optional[str] = self._texts.pop(node, None)
+        if text is None:
+            return
+
+        for gram in SearchIndex.gramsOf(text):
+            nodes: Set[Any] = self._grams[gram]
+            nodes.discard(node)
+            if len(nodes) == 0:
+                del self._grams[gram]
+
+    def clear(self: Self) -> None:
+        self._grams.clear()
+        self._texts.clear()
+
+    def candidates(self: Self, query: str) -> Set[Any]:
+        if len(query) < SearchIndex.GramSize:
+            result: Set[Any] = set()
+            for gram, nodes in self._grams.items():
+                if query in gram:
+                    result.update(nodes)
+            return result
+
+        postings: List[Set[Any]] = sorted(
+            map(lambda gram: self._grams.get(gram, set()), SearchIndex.gramsOf(query)),
+            key=len,
+        )
+        return postings[0].intersection(*postings[1:])
+
+    def search(self: Self, query: str) -> List[Any]:
+        query = query.lower()
+        if '.' not in query:
+            return list(filter(
+                lambda node: query in self._texts[node],
+                self.candidates(query),
+            ))
+
+        query = query.strip('.')
+        components: List[str] = query.split('.')
+        return list(filter(
+            lambda node: components[-1] in node.name.lower() and query in node.path.lower(),
+            self.candidates(components[-1]),
+        ))
+
+    def prefixSearch(self: Self, prefix: str) -> List[Any]:
+        prefix = prefix.lower()
+        return list(filter(
+            lambda node: self._texts[node].startswith(prefix),
+            self.candidates(prefix),
+        ))
@@ -0,0 +1,31 @@
+from typing import (
+    Self,
+    Any,
+)
+from collections.abc import Sequence
+
+class SnapshotArray(Sequence):
+    def __init__(self: Self, snapshot: Any, offset: int, typeId: int) -> None:
+        self._snapshot: Any = snapshot
+        self._offset: int = offset
+        self._typeId: int = typeId
+        self._length: int = snapshot.count(offset)
+
+    @property
+    def typeName(self: Self) -> str:
+        return self._snapshot.typeName(self._typeId)
+
+    def __len__(self: Self) -> int:
+        return self._length
+
+    def __getitem__(self: Self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return list(map(self.__getitem__, range(*index.indices(self._length))))
+        if index < 0:
+            index += self._length
+        if index < 0 or index >= self._length:
+            raise IndexError('Snapshot array index out of range.')
+        return self._snapshot.valueOf(self._snapshot.entry(self._offset, index))
+
+    def __repr__(self: Self) -> str:
+        return '<{} array with {} elements>'.format(self.typeName, self._length)
@@ -0,0 +1,22 @@
+from struct import Struct
+
+class SnapshotFormat:
+    Magic: bytes = b'OMSNAP\x00\x01'
+    Alignment: int = 8
+    NoString: int = 0xFFFFFFFF
+    IntRange: range = range(-2 ** 63, 2 ** 63)
+    BufferFormats: str = 'bBhHiIlLqQfd?'
+
+    Count: Struct = Struct('<I')
+    Entry: Struct = Struct('<IBIq')
+    Buffer: Struct = Struct('<II')
+    Dimension: Struct = Struct('<q')
+    Trailer: Struct = Struct('<8Q')
+
+    @staticmethod
+    def padding(offset: int) -> int:
+        return -offset % SnapshotFormat.Alignment
+
+    @staticmethod
+    def typeKey(cls: type) -> str:
+        return '{}:{}'.format(cls.__module__, cls.__qualname__)
@@ -0,0 +1,43 @@
+from typing import (
+    Self,
+    Any,
+    Dict,
+    Iterator,
+    Optional,
+    Tuple,
+)
+from collections.abc import Mapping
+
+class SnapshotRecord(Mapping):
+    def __init__(self: Self, snapshot: Any, offset: int, typeId: int) -> None:
+        self._snapshot: Any = snapshot
+        self._offset: int = offset
+        self._typeId: int = typeId
+        self._rows: Optional[Dict[str, int]] = None
+
+    @property
+    def typeName(self: Self) -> str:
+        return self._snapshot.typeName(self._typeId)
+
+    def __len__(self: Self) -> int:
+        return self._snapshot.count(self._offset)
+
+    def __iter__(self: Self) -> Iterator[str]:
+        return map(
+            lambda row: self._snapshot.string(self._snapshot.entry(self._offset, row)[0]),
+            range(len(self)),
+        )
+
+    def __getitem__(self: Self, key: str) -> Any:
+        if self._rows is None:
+            self._rows = dict(map(lambda row: (row[1], row[0]), enumerate(self)))
+        return self._snapshot.valueOf(self._snapshot.entry(self._offset, self._rows[key]))
+
+    def items(self: Self) -> Iterator[Tuple[str, Any]]:
+        return map(
+            lambda entry: (self._snapshot.string(entry[0]), self._snapshot.valueOf(entry)),
+            map(lambda row: self._snapshot.entry(self._offset, row), range(len(self))),
+        )
+
+    def __repr__(self: Self) -> str:
+        return '<{} record with {} fields>'.format(self.typeName, len(self))
@@ -0,0 +1,244 @@
+from typing import (
+    Self,
+    Any,
+    BinaryIO,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+from array import array
+from os import (
+    remove,
+    replace,
+)
+from secrets import token_hex
+from enum import (
+    Enum,
+    Flag,
+)
+from PyQt6.QtCore import QFileInfo
+from objectmodel.node import Node
+from objectmodel.nodekind import NodeKind
+from objectmodel.bufferaccess import BufferAccess
+from objectmodel.fieldlayout import FieldLayout
+from objectmodel.typeregistry import TypeRegistry
+from objectmodel.snapshotformat import SnapshotFormat
+from objectmodel.nodepath import NodePath
+
+class SnapshotWriter:
+    ScalarTypes: Dict[NodeKind, type] = {
+        NodeKind.Int: int,
+        NodeKind.Float: float,
+        NodeKind.String: str,
+        NodeKind.Bool: bool,
+        NodeKind.FilePath: QFileInfo,
+        NodeKind.Enum: Enum,
+        NodeKind.Flag: Flag,
+    }
+
+    @staticmethod
+    def save(fileName: str, node: Node, expandedPaths: Iterable[str] = ()) -> None:
+        temporaryName: str = '{}.{}.tmp'.format(fileName, token_hex(4))
+        with open(temporaryName, 'xb') as file:
+            try:
+                SnapshotWriter(file).write(node.name, node.value, expandedPaths)
+            except BaseException:
+                file.close()
+                remove(temporaryName)
+                raise
+        replace(temporaryName, fileName)
+
+    def __init__(self: Self, file: BinaryIO) -> None:
+        self._file: BinaryIO = file
+        self._offset: int = 0
+        self._strings: Dict[str, int] = {}
+        self._ints: array = array('q')
+        self._floats: array = array('d')
+        self._kinds: Dict[type, Optional[Tuple[NodeKind, int]]] = {}
+
+    def put(self: Self, data: Any) -> int:
+        offset: int = self._offset
+        self._file.write(data)
+        self._offset += memoryview(data).nbytes
+        return offset
+
+    def align(self: Self) -> int:
+        self.put(bytes(SnapshotFormat.padding(self._offset)))
+        return self._offset
+
+    def string(self: Self, text: str) -> int:
+        stringId: Optional[int] = self._strings.get(text)
+        if stringId is None:
+            stringId = len(self._strings)
+            self._strings[text] = stringId
+        return stringId
+
+    def typeId(self: Self, value: Any) -> int:
+        return self.string(SnapshotFormat.typeKey(type(value)))
+
+    def text(self: Self, nameId: int, value: Any) -> bytes:
+        return SnapshotFormat.Entry.pack(nameId, NodeKind.String.value, self.typeId(value), self.string(repr(value)))
+
+    def children(self: Self, kind: NodeKind, value: Any) -> Iterator[Tuple[int, str, Any]]:
+        if kind is NodeKind.Object:
+            return map(
+                lambda field: (self.string(field[0]), NodePath.name(field[0]), field[1]),
+                FieldLayout.of(type(value)).fields(value),
+            )
+
+        if kind is NodeKind.Mapping:
+            return map(
+                lambda item: (self.string(item[0] if item[0].__class__ is str else repr(item[0])), NodePath.name(item[0]), item[1]),
+                value.items(),
+            )
+
+        if kind is NodeKind.Buffer:
+            return map(
+                lambda index: (SnapshotFormat.NoString, '[{}]'.format(index), BufferAccess.item(value, index)),
+                range(BufferAccess.length(value)),
+            )
+
+        return map(
+            lambda index: (SnapshotFormat.NoString, '[{}]'.format(index), value[index]),
+            range(len(value)),
+        )
+
+    def buffer(self: Self, value: Any) -> Optional[int]:
+        view: memoryview = memoryview(value)
+        if view.format not in SnapshotFormat.BufferFormats or view.nbytes == 0:
+            return None
+
+        offset: int = self.put(SnapshotFormat.Buffer.pack(self.string(view.format), view.ndim))
+        for dimension in view.shape:
+            self.put(SnapshotFormat.Dimension.pack(dimension))
+        self.align()
+        self.put(view if view.c_contiguous else view.tobytes())
+        return offset
+
+    def kindOf(self: Self, value: Any) -> Optional[Tuple[NodeKind, int]]:
+        cls: type = value.__class__
+        if cls not in self._kinds:
+            handlerKind: NodeKind = TypeRegistry.handler(cls).kind
+            scalarType: Optional[type] = SnapshotWriter.ScalarTypes.get(handlerKind)
+            self._kinds[cls] = None if scalarType is not None and not issubclass(cls, scalarType) else (handlerKind, handlerKind.value)
+
+        kind: Optional[Tuple[NodeKind, int]] = self._kinds[cls]
+        if kind is not None and kind[0] is NodeKind.Buffer and not BufferAccess.isBuffer(value):
+            return (NodeKind.Object, NodeKind.Object.value)
+        return kind
+
+    def visit(
+        self: Self,
+        nameId: int,
+        parentPath: Optional[str],
+        name: str,
+        value: Any,
+        frames: List[List[Any]],
+        seen: Dict[int, Tuple[str, Any]],
+    ) -> Optional[bytes]:
+        kinds: Optional[Tuple[NodeKind, int]] = self.kindOf(value)
+        if kinds is None:
+            return self.text(nameId, value)
+
+        kind, kindValue = kinds
+        pack = SnapshotFormat.Entry.pack
+        noString: int = SnapshotFormat.NoString
+
+        if kind is NodeKind.Int:
+            if value not in SnapshotFormat.IntRange:
+                return self.text(nameId, value)
+            self._ints.append(value)
+            return pack(nameId, kindValue, noString, len(self._ints) - 1)
+        if kind is NodeKind.Float:
+            self._floats.append(value)
+            return pack(nameId, kindValue, noString, len(self._floats) - 1)
+        if kind is NodeKind.String:
+            return pack(nameId, kindValue, noString, self.string(value))
+        if kind is NodeKind.Bool:
+            return pack(nameId, kindValue, noString, int(value))
+        if kind is NodeKind.FilePath:
+            return pack(nameId, kindValue, noString, self.string(value.filePath()))
+        if kind is NodeKind.Enum:
+            return pack(nameId, kindValue, self.typeId(value), self.string(value.name))
+        if kind is NodeKind.Flag:
+            if value.value not in SnapshotFormat.IntRange:
+                return self.text(nameId, value)
+            self._ints.append(value.value)
+            return pack(nameId, kindValue, self.typeId(value), len(self._ints) - 1)
+
+        if kind is NodeKind.Object and not FieldLayout.of(value.__class__).hasFields:
+            return self.text(nameId, value)
+
+        path: str = NodePath.name(name) if parentPath is None else NodePath.append(parentPath, name)
+        if kind is NodeKind.Buffer:
+            offset: Optional[int] = self.buffer(value)
+            if offset is not None:
+                return pack(nameId, kindValue, self.typeId(value), offset)
+            frames.append([nameId, NodeKind.Array, self.typeId(value), path, self.children(kind, value), bytearray()])
+            return None
+
+        target: Optional[Tuple[str, Any]] = seen.get(id(value))
+        if target is not None:
+            return pack(nameId, NodeKind.Link.value, noString, self.string(target[0]))
+        seen[id(value)] = (path, value)
+
+        frames.append([nameId, kind, self.typeId(value), path, self.children(kind, value), bytearray()])
+        return None
+
+    def write(self: Self, name: str, value: Any, expandedPaths: Iterable[str] = ()) -> None:
+        self.put(SnapshotFormat.Magic)
+
+        frames: List[List[Any]] = []
+        seen: Dict[int, Tuple[str, Any]] = {}
+        root: Optional[bytes] = self.visit(self.string(name), None, name, value, frames, seen)
+        while len(frames) > 0:
+            frame: List[Any] = frames[-1]
+            entries: bytearray = frame[5]
+            entered: bool = False
+            for nameId, childName, child in frame[4]:
+                entry: Optional[bytes] = self.visit(nameId, frame[3], childName, child, frames, seen)
+                if entry is None:
+                    entered = True
+                    break
+                entries += entry
+            if entered:
+                continue
+
+            frames.pop()
+            offset: int = self.put(SnapshotFormat.Count.pack(len(entries) // SnapshotFormat.Entry.size))
+            self.put(entries)
+            entry = SnapshotFormat.Entry.pack(frame[0], frame[1].value, frame[2], offset)
+            if len(frames) > 0:
+                frames[-1][5] += entry
+            else:
+                root = entry
+
+        expanded: array = array('I', map(self.string, expandedPaths))
+
+        stringData: List[bytes] = list(map(lambda text: text.encode('utf-8'), self._strings))
+        stringOffsets: array = array('Q', [0])
+        for data in stringData:
+            stringOffsets.append(stringOffsets[-1] + len(data))
+
+        stringsOffset: int = self.align()
+        self.put(stringOffsets)
+        for data in stringData:
+            self.put(data)
+        intsOffset: int = self.align()
+        self.put(self._ints)
+        floatsOffset: int = self.align()
+        self.put(self._floats)
+        expandedOffset: int = self.align()
+        self.put(expanded)
+
+        self.put(SnapshotFormat.Trailer.pack(
+            stringsOffset, len(stringData),
+            intsOffset, len(self._ints),
+            floatsOffset, len(self._floats),
+            expandedOffset, len(expanded),
+        ))
+        self.put(root)
+        self.put(SnapshotFormat.Magic)
@@ -1,10 +1,21 @@
 from unittest import (
     TestCase,
     main,
+    skipIf,
 )
 from objectmodel.node import Node
+from objectmodel.nodepath import NodePath
+from objectmodel.fieldlayout import FieldLayout
+from objectmodel.typeregistry import TypeRegistry
+from objectmodel.typehandler import TypeHandler
+from objectmodel.nodekind import NodeKind
+from objectmodel.nodediff import NodeDiff
+from objectmodel.snapshotwriter import SnapshotWriter
+from objectmodel.nodesnapshot import NodeSnapshot
 from typing import (
     Self,
+    Any,
+    Dict,
     List,
 )
 from enum import (
@@ -14,6 +25,17 @@ from enum import (
     auto,
 )
 from PyQt6.QtCore import QFileInfo
+from array import array
+from tempfile import TemporaryDirectory
+from os import listdir
+from os.path import join
+from dataclasses import dataclass
+from collections import namedtuple
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 class AnEnum(StrEnum):
     Option1 = 'foo'
@@ -58,6 +80,23 @@ class DataClass:
     def anotherFunc(self: Self) -> None:
         pass
 
+class Material:
+    def __init__(self: Self) -> None:
+        self.color: str = 'red'
+
+class SceneObject:
+    def __init__(self: Self, material: Material, scene: 'Scene') -> None:
+        self.material: Material = material
+        self.scene: Scene = scene
+
+class Scene:
+    def __init__(self: Self) -> None:
+        material: Material = Material()
+        self.objects: List[SceneObject] = [
+            SceneObject(material, self),
+            SceneObject(material, self),
+        ]
+
 class NodeTest(TestCase):
     def setUp(self) -> None:
         super().setUp()
@@ -79,6 +118,88 @@ class NodeTest(TestCase):
         arrayElementNode: Node = self.node.fromPath('Root.ArrayVariable.[2].AVariable')
         self.assertEqual(arrayElementNode.value, 'baz')
 
+    def testNodeIndex(self: Self) -> None:
+        self.assertIs(self.node.nodeIndex.get('Root.ArrayVariable.[3].AVariable'), self.node.fromPath('Root.ArrayVariable.[3].AVariable'))
+        nodeCount: int = len(self.node.nodeIndex)
+
+        arrayNode: Node = self.node.fromPath('Root.ArrayVariable')
+        arrayNode.removeArrayElement(0)
+        self.assertNotIn('Root.ArrayVariable.[3]', self.node.nodeIndex)
+        self.assertEqual(self.node.fromPath('Root.ArrayVariable.[0].AVariable').value, 'bar')
+
+        arrayNode.insertArrayElement(0, OtherDataClass('qux'))
+        self.assertEqual(self.node.nodeIndex.get('Root.ArrayVariable.[0].AVariable').value, 'qux')
+        self.assertIn('Root.ArrayVariable.[3]', self.node.nodeIndex)
+        self.assertIs(self.node.nodeIndex.get('Root.ArrayVariable.[3].AVariable'), self.node.fromPath('Root.ArrayVariable.[3]').children[0])
+        self.assertEqual(len(self.node.nodeIndex), nodeCount)
+
+    def testDeepPath(self: Self) -> None:
+        value: OtherDataClass = OtherDataClass('leaf')
+        for _ in range(100):
+            value = OtherDataClass(value)
+        node: Node = Node(value=value, name='Root')
+
+        path: str = '.'.join(['Root'] + 101 * ['AVariable'])
+        leafNode: Node = node.nodeIndex.get(path)
+        self.assertEqual(leafNode.value, 'leaf')
+        self.assertEqual(leafNode.path, path)
+        self.assertEqual(node.nodeIndex.maxDepth, 102)
+
+    def testEscapedPath(self: Self) -> None:
+        node: Node = Node(value={'a.b': 1, 'a': {'b': 2}, 'c\\': {'d': 3}}, name='r')
+        dottedNode: Node = node.children[0]
+        self.assertEqual(dottedNode.name, 'a.b')
+        self.assertEqual(dottedNode.path, 'r.a\\.b')
+        self.assertIs(node.nodeIndex.get('r.a\\.b'), dottedNode)
+        self.assertIs(node.fromPath('r.a\\.b'), dottedNode)
+        self.assertEqual(node.nodeIndex.get('r.a.b').value, 2)
+
+        escapedNode: Node = node.fromPath('r.c\\\\.d')
+        self.assertEqual(escapedNode.value, 3)
+        self.assertEqual(escapedNode.path, 'r.c\\\\.d')
+
+    def testArraySplice(self: Self) -> None:
+        arrayNode: Node = self.node.fromPath('Root.ArrayVariable')
+        children: List[Node] = list(arrayNode.children)
+
+        arrayNode.insertArrayElement(1, OtherDataClass('qux'))
+        self.assertIs(arrayNode.children[0], children[0])
+        self.assertEqual(arrayNode.children[1].fromPath('[1].AVariable').value, 'qux')
+        self.assertEqual(list(map(lambda child: child.index, arrayNode.children)), [0, 1, 2, 3, 4])
+        self.assertIs(arrayNode.children[4], children[3])
+        self.assertEqual(children[3].name, '[4]')
+        self.assertIs(self.node.fromPath('Root.ArrayVariable.[4].AVariable'), children[3].children[0])
+
+        arrayNode.removeArrayElement(0)
+        self.assertIs(arrayNode.children[3], children[3])
+        self.assertEqual(children[3].path, 'Root.ArrayVariable.[3]')
+        self.assertNotIn('Root.ArrayVariable.[4]', self.node.nodeIndex)
+        self.assertEqual(list(map(lambda element: element.AVariable, self.node.value.ArrayVariable)), ['qux', 'bar', 'baz', 'bad'])
+
+    def testMaxDepth(self: Self) -> None:
+        self.assertEqual(self.node.nodeIndex.maxDepth, 4)
+        self.assertEqual(self.node.maxDepth, 4)
+
+        arrayNode: Node = self.node.fromPath('Root.ArrayVariable')
+        arrayNode.insertArrayElement(2, OtherDataClass(OtherDataClass('deep')))
+        self.assertEqual(self.node.nodeIndex.maxDepth, 5)
+
+        arrayNode.removeArrayElement(2)
+        self.assertEqual(self.node.nodeIndex.maxDepth, 4)
+
+    def testValueChange(self: Self) -> None:
+        node: Node = self.node.fromPath('Root.InstanceVariable')
+        node.value = 2.5
+        self.assertTrue(node.isFloat)
+        self.assertFalse(node.isInt)
+        self.assertEqual(self.node.value.InstanceVariable, 2.5)
+
+        arrayElementNode: Node = self.node.fromPath('Root.ArrayVariable.[1]')
+        otherDataClass: OtherDataClass = OtherDataClass('qux')
+        arrayElementNode.value = otherDataClass
+        self.assertIs(self.node.value.ArrayVariable[1], otherDataClass)
+        self.assertEqual(arrayElementNode.name, '[1]')
+
     def testIntEnumVariable(self: Self) -> None:
         enumNode: Node = self.node.fromPath('Root.IntEnumVariable')
         self.assertTrue(enumNode.isEnum)
@@ -199,5 +320,421 @@ class NodeTest(TestCase):
         self.assertFalse(node.isBool)
         self.assertTrue(node.isFilePath)
 
+class NodeHashTest(TestCase):
+    def testEqualTrees(self: Self) -> None:
+        node: Node = Node(value=DataClass(), name='Root')
+        self.assertEqual(node.subtreeHash, Node(value=DataClass(), name='Saved').subtreeHash)
+        self.assertEqual(node.subtreeHash, Node(value=DataClass(), name='Root', lazy=True).subtreeHash)
+        self.assertEqual(
+            Node(value=list(range(25)), name='Root', chunkSize=10).subtreeHash,
+            Node(value=list(range(25)), name='Root', chunkSize=10, lazy=True).subtreeHash,
+        )
+
+    def testEditInvalidatesParents(self: Self) -> None:
+        node: Node = Node(value=DataClass(), name='Root')
+        arrayNode: Node = node.fromPath('Root.ArrayVariable')
+        floatHash: int = node.fromPath('Root.FloatVariable').subtreeHash
+        rootHash: int = node.subtreeHash
+        arrayHash: int = arrayNode.subtreeHash
+
+        node.fromPath('Root.ArrayVariable.[2].AVariable').value = 'qux'
+        self.assertNotEqual(node.subtreeHash, rootHash)
+        self.assertNotEqual(arrayNode.subtreeHash, arrayHash)
+        self.assertEqual(node.fromPath('Root.FloatVariable').subtreeHash, floatHash)
+
+        node.fromPath('Root.ArrayVariable.[2].AVariable').value = 'baz'
+        self.assertEqual(node.subtreeHash, rootHash)
+
+    def testDiff(self: Self) -> None:
+        saved: Node = Node(value=DataClass(), name='Root')
+        live: Node = Node(value=DataClass(), name='Root', lazy=True)
+        self.assertEqual(NodeDiff.diff(saved, live), [])
+
+        live.value.FloatVariable = 2.5
+        live.value.ArrayVariable.pop()
+        live.value.ArrayVariable[0].AVariable = 'qux'
+        live.updateChildren()
+        changes = list(map(
+            lambda change: (change[0], None if change[1] is None else change[1].path, None if change[2] is None else change[2].path),
+            NodeDiff.diff(saved, live),
+        ))
+        self.assertEqual(changes, [
+            (NodeDiff.Changed, 'Root.FloatVariable', 'Root.FloatVariable'),
+            (NodeDiff.Removed, 'Root.ArrayVariable.[3]', None),
+            (NodeDiff.Changed, 'Root.ArrayVariable.[0].AVariable', 'Root.ArrayVariable.[0].AVariable'),
+        ])
+
+    def testDiffHashCollisions(self: Self) -> None:
+        for left, right in ((-1, -2), (2 ** 61 - 1, 0), (1, 1.0), (1, True)):
+            changes = NodeDiff.diff(Node(value=OtherDataClass(left), name='Root'), Node(value=OtherDataClass(right), name='Root'))
+            self.assertEqual(list(map(lambda change: change[1].path, changes)), ['Root.AVariable'])
+
+class SharedReferenceNodeTest(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.node: Node = Node(value=Scene(), name='Root')
+
+    def testLinks(self: Self) -> None:
+        self.assertEqual(len(self.node.nodeIndex), 9)
+
+        materialNode: Node = self.node.fromPath('Root.objects.[0].material')
+        self.assertTrue(materialNode.isObject)
+        self.assertEqual(materialNode.children[0].value, 'red')
+
+        sharedMaterialNode: Node = self.node.fromPath('Root.objects.[1].material')
+        self.assertTrue(sharedMaterialNode.isLink)
+        self.assertFalse(sharedMaterialNode.isObject)
+        self.assertFalse(sharedMaterialNode.hasChildren)
+        self.assertIs(sharedMaterialNode.linkTarget, materialNode)
+
+        sceneNode: Node = self.node.fromPath('Root.objects.[0].scene')
+        self.assertTrue(sceneNode.isLink)
+        self.assertIs(sceneNode.linkTarget, self.node)
+
+    def testLinkFollowsValue(self: Self) -> None:
+        sharedMaterialNode: Node = self.node.fromPath('Root.objects.[1].material')
+        sharedMaterialNode.value = Material()
+        self.assertTrue(sharedMaterialNode.isObject)
+        self.assertIs(self.node.nodeIndex.nodeForObject(sharedMaterialNode.value), sharedMaterialNode)
+
+    def testRemovedOwnerPromotesLink(self: Self) -> None:
+        material: Material = Material()
+        node: Node = Node(value=[material, material, material], name='Root')
+        node.removeArrayElement(0)
+
+        promotedNode: Node = node.children[0]
+        self.assertTrue(promotedNode.isObject)
+        self.assertIs(node.nodeIndex.nodeForObject(material), promotedNode)
+        self.assertEqual(promotedNode.children[0].value, 'red')
+        self.assertTrue(node.children[1].isLink)
+        self.assertIs(node.children[1].linkTarget, promotedNode)
+
+        node.removeArrayElement(0)
+        self.assertTrue(node.children[0].isObject)
+        self.assertEqual(node.fromPath('Root.[0].color').value, 'red')
+
+    def testFieldlessValuesAreNotLinked(self: Self) -> None:
+        node: Node = Node(value={'a': None, 'b': None, 'c': (), 'd': (), 'e': 1j, 'f': 1j}, name='r')
+        self.assertFalse(any(map(lambda child: child.isLink, node.children)))
+        self.assertIsNone(node.nodeIndex.nodeForObject(None))
+        self.assertIs(node.nodeIndex.nodeForObject(node.value), node)
+        self.assertNotEqual(
+            Node(value=[1j], name='r').subtreeHash,
+            Node(value=[2j], name='r').subtreeHash,
+        )
+
+class LazyNodeTest(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.node: Node = Node(value=DataClass(), name='Root', lazy=True)
+
+    def testChildrenAreDeferred(self: Self) -> None:
+        self.assertFalse(self.node.isMaterialized)
+        self.assertTrue(self.node.hasChildren)
+        self.assertEqual(self.node.childCount, 9)
+        self.assertFalse(self.node.isMaterialized)
+
+        arrayNode: Node = self.node.children[4]
+        self.assertTrue(self.node.isMaterialized)
+        self.assertFalse(arrayNode.isMaterialized)
+        self.assertEqual(arrayNode.childCount, 4)
+
+    def testFromPath(self: Self) -> None:
+        arrayElementNode: Node = self.node.fromPath('Root.ArrayVariable.[2].AVariable')
+        self.assertEqual(arrayElementNode.value, 'baz')
+        self.assertFalse(self.node.fromPath('Root.FloatVariable').hasChildren)
+
+class ChunkedArrayNodeTest(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.node: Node = Node(value=list(range(25)), name='Root', chunkSize=10)
+
+    def testRanges(self: Self) -> None:
+        self.assertEqual(list(map(lambda child: child.name, self.node.children)), ['[0..9]', '[10..19]', '[20..24]'])
+        self.assertFalse(self.node.children[1].isMaterialized)
+        self.assertEqual(self.node.children[2].childCount, 5)
+
+        elementNode: Node = self.node.fromPath('Root.[12]')
+        self.assertEqual(elementNode.value, 12)
+        self.assertEqual(elementNode.row, 2)
+        self.assertEqual(elementNode.path, 'Root.[12]')
+        self.assertIs(elementNode.parent, self.node.children[1])
+
+        elementNode.value = 42
+        self.assertEqual(self.node.value[12], 42)
+
+    def testSplice(self: Self) -> None:
+        firstRange: Node = self.node.children[0]
+        self.node.insertArrayElements(15, [100, 101, 102, 103, 104, 105])
+        self.assertIs(self.node.children[0], firstRange)
+        self.assertEqual(list(map(lambda child: child.name, self.node.children)), ['[0..9]', '[10..19]', '[20..29]', '[30..30]'])
+        self.assertEqual(self.node.fromPath('Root.[16]').value, 101)
+
+        self.assertEqual(self.node.removeArrayElements(0, 21), list(range(15)) + [100, 101, 102, 103, 104, 105])
+        self.assertEqual(list(map(lambda child: child.name, self.node.children)), ['[0]', '[1]', '[2]', '[3]', '[4]', '[5]', '[6]', '[7]', '[8]', '[9]'])
+        self.assertEqual(self.node.fromPath('Root.[0]').value, 15)
+
+class SlotVertex:
+    __slots__ = (
+        'position',
+        'normal',
+        '__weight',
+    )
+
+    def __init__(self: Self, position: float, normal: float) -> None:
+        self.position: float = position
+        self.normal: float = normal
+        self.__weight: float = 1.
+
+@dataclass(slots=True)
+class SlotColor:
+    red: float = 0.
+    green: float = 0.5
+    blue: float = 1.
+
+Extent = namedtuple('Extent', ['width', 'height'])
+
+@dataclass(frozen=True)
+class FrozenPath:
+    points: List[int]
+
+class FieldLayoutNodeTest(TestCase):
+    def testSlots(self: Self) -> None:
+        node: Node = Node(value=SlotVertex(1., 2.), name='Root')
+        self.assertEqual(node.fieldNames, ['position', 'normal', '_SlotVertex__weight'])
+        self.assertEqual(node.fromPath('Root.normal').value, 2.)
+
+        node.fromPath('Root.position').value = 3.
+        self.assertEqual(node.value.position, 3.)
+        self.assertIs(FieldLayout.of(SlotVertex), node.layout)
+
+    def testUnsetSlot(self: Self) -> None:
+        vertex: SlotVertex = SlotVertex(1., 2.)
+        del vertex.normal
+        self.assertEqual(Node(value=vertex, name='Root').fieldNames, ['position', '_SlotVertex__weight'])
+
+    def testDataClass(self: Self) -> None:
+        node: Node = Node(value=SlotColor(), name='Root')
+        self.assertEqual(list(map(lambda child: (child.name, child.value), node.children)), [('red', 0.), ('green', .5), ('blue', 1.)])
+
+    def testNamedTuple(self: Self) -> None:
+        node: Node = Node(value=Extent(640, 480), name='Root')
+        self.assertTrue(node.layout.readOnly)
+        self.assertEqual(node.fromPath('Root.height').value, 480)
+
+class Inventory:
+    def __init__(self: Self) -> None:
+        self.items: dict = {
+            'sword': OtherDataClass('steel'),
+            'shield': OtherDataClass('wood'),
+            3: 'three',
+        }
+
+class MappingNodeTest(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.node: Node = Node(value=Inventory(), name='Root')
+
+    def testChildren(self: Self) -> None:
+        mappingNode: Node = self.node.fromPath('Root.items')
+        self.assertTrue(mappingNode.isMapping)
+        self.assertEqual(mappingNode.fieldNames, ['sword', 'shield', '3'])
+        self.assertEqual(self.node.fromPath('Root.items.shield.AVariable').value, 'wood')
+        self.assertIsNone(mappingNode.childWithName('3'))
+        self.assertEqual(mappingNode.childWithName(NodePath.name(3)).key, 3)
+        self.assertEqual(mappingNode.childWithName(NodePath.name(3)).path, 'Root.items.\\#3')
+
+        mappingNode.childWithName(NodePath.name(3)).value = 'drei'
+        self.assertEqual(self.node.value.items[3], 'drei')
+
+    def testInsertRemove(self: Self) -> None:
+        mappingNode: Node = self.node.fromPath('Root.items')
+        self.assertEqual(mappingNode.removeMappingItem('sword')[0], 0)
+        self.assertIsNone(mappingNode.childWithName('sword'))
+        self.assertNotIn('Root.items.sword.AVariable', self.node.nodeIndex)
+        self.assertEqual(mappingNode.childWithName('shield').index, 0)
+
+        mappingNode.insertMappingItem('bow', OtherDataClass('yew'), 1)
+        self.assertEqual(list(self.node.value.items), ['shield', 'bow', 3])
+        self.assertEqual(self.node.fromPath('Root.items.bow.AVariable').value, 'yew')
+        self.assertEqual(list(map(lambda child: child.index, mappingNode.children)), [0, 1, 2])
+
+    def testInsertRemoveKeepsNames(self: Self) -> None:
+        mappingNode: Node = self.node.fromPath('Root.items')
+        shield: Node = mappingNode.childWithName('shield')
+        self.assertEqual(mappingNode.mappingRow(3), 2)
+
+        mappingNode.insertMappingItem(4, 'vier')
+        mappingNode.removeMappingItem('sword')
+        self.assertIs(mappingNode.childWithName('shield'), shield)
+        self.assertIsNone(mappingNode.childWithName('sword'))
+        self.assertEqual(mappingNode.childWithName(NodePath.name(4)).value, 'vier')
+        self.assertEqual(mappingNode.mappingRow(4), 2)
+        self.assertEqual(mappingNode.mappingRow('shield'), 0)
+
+class TypeRegistryTest(TestCase):
+    def testResolution(self: Self) -> None:
+        self.assertIs(Node.kindOf(AnIntEnum.A), NodeKind.Enum)
+        self.assertIs(Node.kindOf(AFlag.First | AFlag.Third), NodeKind.Flag)
+        self.assertIs(Node.kindOf(True), NodeKind.Bool)
+        self.assertIs(TypeRegistry.handler(AnIntEnum), TypeRegistry.handler(AnEnum))
+
+    def testRegister(self: Self) -> None:
+        TypeRegistry.register(Extent, TypeHandler(
+            kind=NodeKind.String,
+            formatter=lambda value: '{}x{}'.format(*value),
+        ))
+        try:
+            node: Node = Node(value=Extent(640, 480), name='Root')
+            self.assertTrue(node.isString)
+            self.assertFalse(node.hasChildren)
+            self.assertEqual(node.handler.formatter(node.value), '640x480')
+        finally:
+            TypeRegistry.unregister(Extent)
+
+        self.assertIs(Node.kindOf(Extent(640, 480)), NodeKind.Object)
+
+class BufferNodeTest(TestCase):
+    def testArray(self: Self) -> None:
+        values: array = array('d', [1.5, 2.5, 3.5])
+        node: Node = Node(value=values, name='Root')
+        self.assertTrue(node.isBuffer)
+        self.assertEqual(node.typeName, 'array d 3')
+        self.assertTrue(node.children[1].isFloat)
+
+        node.children[1].value = 4.5
+        self.assertEqual(values[1], 4.5)
+
+    def testMemoryView(self: Self) -> None:
+        values: bytearray = bytearray(range(6))
+        node: Node = Node(value=memoryview(values).cast('B', (2, 3)), name='Root')
+        self.assertEqual(node.typeName, 'memoryview B 2x3')
+        self.assertEqual(node.fromPath('Root.[1].[2]').value, 5)
+
+        node.fromPath('Root.[1].[0]').value = 42
+        self.assertEqual(values[3], 42)
+
+    @skipIf(numpy is None, 'numpy is not installed')
+    def testNumpyArray(self: Self) -> None:
+        texture = numpy.zeros((4, 3), dtype=numpy.float32)
+        node: Node = Node(value=texture, name='Root')
+        self.assertEqual(node.typeName, 'ndarray float32 4x3')
+
+        rowNode: Node = node.fromPath('Root.[2]')
+        self.assertTrue(rowNode.isBuffer)
+        self.assertTrue(numpy.shares_memory(rowNode.value, texture))
+
+        elementNode: Node = node.fromPath('Root.[2].[1]')
+        self.assertIs(type(elementNode.value), float)
+        elementNode.value = 0.1
+        self.assertEqual(texture[2, 1], numpy.float32(0.1))
+        self.assertEqual(elementNode.value, float(numpy.float32(0.1)))
+
+class SnapshotNodeTest(TestCase):
+    def setUp(self: Self) -> None:
+        super().setUp()
+
+        self.directory: TemporaryDirectory = TemporaryDirectory()
+        self.fileName: str = join(self.directory.name, 'root.snapshot')
+
+    def tearDown(self: Self) -> None:
+        self.directory.cleanup()
+        super().tearDown()
+
+    def testRoundTrip(self: Self) -> None:
+        dataClass: DataClass = DataClass()
+        dataClass.FileVariable = QFileInfo('/tmp/texture.png')
+        dataClass.Inventory = {'apples': 3, 7: 'seven'}
+        dataClass.Samples = array('h', [1, -2, 3])
+        SnapshotWriter.save(self.fileName, Node(value=dataClass, name='Root'), ['Root.ArrayVariable'])
+
+        snapshot: NodeSnapshot = NodeSnapshot(self.fileName)
+        self.assertEqual(snapshot.name, 'Root')
+        self.assertEqual(snapshot.expandedPaths, ['Root.ArrayVariable'])
+
+        root = snapshot.root
+        self.assertEqual(root['InstanceVariable'], 1)
+        self.assertEqual(root['StringVariable'], 'hello, world!')
+        self.assertEqual(root['FloatVariable'], 1.337)
+        self.assertIs(root['BoolVariable'], False)
+        self.assertIs(root['EnumVariable'], AnEnum.Option2)
+        self.assertIs(root['IntEnumVariable'], AnIntEnum.B)
+        self.assertEqual(root['FlagVariable'], AFlag.Second | AFlag.Third)
+        self.assertEqual(root['FileVariable'].filePath(), '/tmp/texture.png')
+        self.assertEqual(dict(root['Inventory']), {'apples': 3, '7': 'seven'})
+        self.assertEqual(root['Samples'].tolist(), [1, -2, 3])
+        self.assertEqual(list(map(lambda element: element['AVariable'], root['ArrayVariable'])), ['foo', 'bar', 'baz', 'bad'])
+        self.assertIs(snapshot.valueAt('Root.ArrayVariable.[2]'), root['ArrayVariable'][2])
+        snapshot.close()
+
+    def testNode(self: Self) -> None:
+        scene: Scene = Scene()
+        SnapshotWriter.save(self.fileName, Node(value=scene, name='Scene'))
+
+        snapshot: NodeSnapshot = NodeSnapshot(self.fileName)
+        node: Node = Node(value=snapshot.root, name=snapshot.name, lazy=True)
+        self.assertEqual(node.typeName, 'Scene')
+        self.assertEqual(node.fromPath('Scene.objects.[0].material.color').value, 'red')
+        self.assertEqual(node.fromPath('Scene.objects.[1].material').typeName, 'Material')
+        self.assertTrue(node.fromPath('Scene.objects.[1].material').isLink)
+        self.assertTrue(node.fromPath('Scene.objects.[0].scene').isLink)
+
+    def testUnsupportedScalars(self: Self) -> None:
+        values: Dict[str, Any] = {
+            'big': 2 ** 64,
+            'negative': -2 ** 70,
+            'none': None,
+            'empty': (),
+            'pair': (1, 'a'),
+            'complex': 1 - 2j,
+            'other': None,
+        }
+        SnapshotWriter.save(self.fileName, Node(value=values, name='Root'))
+
+        snapshot: NodeSnapshot = NodeSnapshot(self.fileName)
+        self.assertEqual(dict(snapshot.root), values)
+        snapshot.close()
+
+    def testRegisteredScalarTypes(self: Self) -> None:
+        TypeRegistry.register(Extent, TypeHandler(kind=NodeKind.String))
+        TypeRegistry.register(Material, TypeHandler(kind=NodeKind.Float))
+        try:
+            SnapshotWriter.save(self.fileName, Node(value={'extent': Extent(640, 480), 'material': Material(), 'name': 'box'}, name='Root'))
+        finally:
+            TypeRegistry.unregister(Extent)
+            TypeRegistry.unregister(Material)
+
+        snapshot: NodeSnapshot = NodeSnapshot(self.fileName)
+        self.assertEqual(snapshot.root['extent'], 'Extent(width=640, height=480)')
+        self.assertTrue(snapshot.root['material'].startswith('<'))
+        self.assertEqual(snapshot.root['name'], 'box')
+        snapshot.close()
+
+    def testFailedSaveKeepsFile(self: Self) -> None:
+        SnapshotWriter.save(self.fileName, Node(value=DataClass(), name='Root'))
+        with open(self.fileName, 'rb') as file:
+            saved: bytes = file.read()
+
+        class Unreadable:
+            @property
+            def __dict__(self: Self) -> Dict[str, Any]:
+                raise RuntimeError('unreadable')
+
+        with self.assertRaises(RuntimeError):
+            SnapshotWriter.save(self.fileName, Node(value=Unreadable(), name='Root', lazy=True))
+        with open(self.fileName, 'rb') as file:
+            self.assertEqual(file.read(), saved)
+        self.assertEqual(listdir(self.directory.name), ['root.snapshot'])
+
+    def testUnsupportedFile(self: Self) -> None:
+        with open(self.fileName, 'wb') as file:
+            file.write(b'not a snapshot, just some bytes that are long enough to have a trailer' * 2)
+        with self.assertRaises(ValueError):
+            NodeSnapshot(self.fileName)
+
 if __name__ == '__main__':
     main()
@@ -0,0 +1,893 @@
+from unittest import (
+    TestCase,
+    main,
+)
+from objectmodel.objectmodel import ObjectModel
+from objectmodel.undoarrayinsert import UndoArrayInsert
+from objectmodel.undoarrayremove import UndoArrayRemove
+from objectmodel.undomappinginsert import UndoMappingInsert
+from objectmodel.undomappingremove import UndoMappingRemove
+from objectmodel.objectfilterproxymodel import ObjectFilterProxyModel
+from objectmodel.modelprofiler import ModelProfiler
+from objectmodel.nodebuilder import NodeBuilder
+from objectmodel.node import Node
+from objectmodel.testnode import (
+    DataClass,
+    OtherDataClass,
+    AnEnum,
+    Scene,
+    Inventory,
+    Extent,
+    FrozenPath,
+)
+from typing import (
+    Self,
+    Any,
+    Dict,
+    List,
+)
+from array import array
+from tempfile import TemporaryDirectory
+from os.path import join
+from time import perf_counter
+from itertools import count
+from unittest.mock import patch
+from PyQt6.QtCore import (
+    QCoreApplication,
+    QModelIndex,
+    QPersistentModelIndex,
+    QFileInfo,
+    Qt,
+)
+from PyQt6.QtGui import QBrush
+
+class ObjectModelTest(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.application: QCoreApplication = QCoreApplication.instance() or QCoreApplication([])
+        self.model: ObjectModel = ObjectModel()
+        self.model.load('Root', DataClass())
+
+    def testIndexWithPath(self: Self) -> None:
+        index: QModelIndex = self.model.indexWithPath('Root.ArrayVariable.[2].AVariable')
+        self.assertTrue(index.isValid())
+        self.assertEqual(index.row(), 0)
+        self.assertEqual(index.parent().row(), 2)
+        self.assertEqual(index.internalPointer().value, 'baz')
+
+        self.assertFalse(self.model.indexWithPath('Root').isValid())
+        self.assertFalse(self.model.indexWithPath('Root.UnknownVariable').isValid())
+
+    def testUndoValueChange(self: Self) -> None:
+        index: QModelIndex = self.model.indexWithPath('Root.FloatVariable')
+        self.model.setData(index, 2.5)
+        self.assertEqual(self.model.indexWithPath('Root.FloatVariable').internalPointer().value, 2.5)
+
+        self.model.undoStack.undo()
+        self.assertEqual(self.model.indexWithPath('Root.FloatVariable').internalPointer().value, 1.337)
+
+        self.model.undoStack.redo()
+        self.assertEqual(self.model.indexWithPath('Root.FloatVariable').internalPointer().value, 2.5)
+
+    def testSetContainerValue(self: Self) -> None:
+        signals: List[Any] = []
+        self.model.rowsInserted.connect(lambda parent, first, last: signals.append(('inserted', parent.internalPointer().path, first, last)))
+        self.model.rowsRemoved.connect(lambda parent, first, last: signals.append(('removed', parent.internalPointer().path, first, last)))
+
+        self.assertTrue(self.model.setValue('Root.ArrayVariable.[0]', OtherDataClass('qux')))
+        self.assertEqual(self.model.nodeWithPath('Root.ArrayVariable.[0].AVariable').value, 'qux')
+        self.assertTrue(self.model.setValue('Root.ArrayVariable', [OtherDataClass('a'), OtherDataClass('b')]))
+        self.assertEqual(self.model.rowCount(self.model.indexWithPath('Root.ArrayVariable')), 2)
+        self.assertEqual(signals, [
+            ('removed', 'Root.ArrayVariable.[0]', 0, 0),
+            ('inserted', 'Root.ArrayVariable.[0]', 0, 0),
+            ('removed', 'Root.ArrayVariable', 0, 3),
+            ('inserted', 'Root.ArrayVariable', 0, 1),
+        ])
+
+        self.model.undoStack.undo()
+        self.assertEqual(self.model.rowCount(self.model.indexWithPath('Root.ArrayVariable')), 4)
+        self.assertEqual(self.model.nodeWithPath('Root.ArrayVariable.[0].AVariable').value, 'qux')
+        self.model.undoStack.undo()
+        self.assertEqual(self.model.nodeWithPath('Root.ArrayVariable.[0].AVariable').value, 'foo')
+
+        with self.model.transaction():
+            self.model.setValue('Root.ArrayVariable', [OtherDataClass('c')])
+        self.assertEqual(self.model.rowCount(self.model.indexWithPath('Root.ArrayVariable')), 1)
+        self.model.undoStack.undo()
+        self.assertEqual(self.model.rowCount(self.model.indexWithPath('Root.ArrayVariable')), 4)
+        self.model.undoStack.redo()
+        self.assertEqual(self.model.nodeWithPath('Root.ArrayVariable.[0].AVariable').value, 'c')
+
+    def testArrayInsertKeepsPersistentIndexes(self: Self) -> None:
+        elementIndex: QPersistentModelIndex = QPersistentModelIndex(self.model.indexWithPath('Root.ArrayVariable.[2].AVariable'))
+        elementNode = QModelIndex(elementIndex).internalPointer()
+
+        self.model.addArrayElementAt(self.model.indexWithPath('Root.ArrayVariable.[1]'), OtherDataClass('qux'))
+        self.assertTrue(elementIndex.isValid())
+        self.assertEqual(elementIndex.parent().row(), 3)
+        self.assertIs(QModelIndex(elementIndex).internalPointer(), elementNode)
+        self.assertEqual(elementNode.path, 'Root.ArrayVariable.[3].AVariable')
+
+        self.model.removeArrayElementAt(self.model.indexWithPath('Root.ArrayVariable.[0]'))
+        self.assertEqual(elementIndex.parent().row(), 2)
+        self.assertIs(self.model.indexWithPath('Root.ArrayVariable.[2].AVariable').internalPointer(), elementNode)
+
+    def testDisplayTextCache(self: Self) -> None:
+        formattedValues = []
+        def formatFloat(value: float) -> str:
+            formattedValues.append(value)
+            return '{:.1f}'.format(value)
+        self.model.setFormatter(float, formatFloat)
+
+        index: QModelIndex = self.model.indexWithPath('Root.FloatVariable').siblingAtColumn(1)
+        self.assertEqual(self.model.data(index), '1.3')
+        self.assertEqual(self.model.data(index), '1.3')
+        self.assertEqual(formattedValues, [1.337])
+
+        self.model.setData(index, 2.25)
+        self.assertEqual(self.model.data(index), '2.2')
+        self.assertEqual(formattedValues, [1.337, 2.25])
+
+        self.model.setFormatter(float, None)
+        self.assertEqual(self.model.data(index), '2.25')
+
+    def testRefresh(self: Self) -> None:
+        dataChanged = []
+        rows = []
+        self.model.dataChanged.connect(lambda topLeft, bottomRight, roles: dataChanged.append((topLeft.internalPointer().path, bottomRight.row())))
+        self.model.rowsInserted.connect(lambda parent, first, last: rows.append(('inserted', parent.internalPointer().path, first, last)))
+        self.model.rowsRemoved.connect(lambda parent, first, last: rows.append(('removed', parent.internalPointer().path, first, last)))
+
+        self.assertTrue(self.model.refresh())
+        self.assertEqual(dataChanged, [])
+        self.assertEqual(rows, [])
+
+        rootObject: DataClass = self.model.indexWithPath('Root.InstanceVariable').internalPointer().parent.value
+        rootObject.InstanceVariable = 5
+        rootObject.FloatVariable = 1.337
+        rootObject.ArrayVariable[2].AVariable = 'qux'
+        rootObject.ArrayVariable.append(OtherDataClass('appended'))
+        rootObject.ArrayVariable[0] = OtherDataClass('replaced')
+        self.assertTrue(self.model.refresh())
+
+        self.assertEqual(sorted(dataChanged), [
+            ('Root.ArrayVariable.[0]', 0),
+            ('Root.ArrayVariable.[2].AVariable', 0),
+            ('Root.InstanceVariable', 0),
+        ])
+        self.assertEqual(rows, [
+            ('inserted', 'Root.ArrayVariable', 4, 4),
+            ('removed', 'Root.ArrayVariable.[0]', 0, 0),
+            ('inserted', 'Root.ArrayVariable.[0]', 0, 0),
+        ])
+        self.assertEqual(self.model.data(self.model.indexWithPath('Root.InstanceVariable').siblingAtColumn(1)), '5')
+        self.assertEqual(self.model.indexWithPath('Root.ArrayVariable.[0].AVariable').internalPointer().value, 'replaced')
+        self.assertEqual(self.model.indexWithPath('Root.ArrayVariable.[4].AVariable').internalPointer().value, 'appended')
+
+        del rootObject.ArrayVariable[1:]
+        self.assertFalse(self.model.refresh(0.0))
+        self.assertTrue(self.model.refresh())
+        self.assertEqual(rows[-1], ('removed', 'Root.ArrayVariable', 1, 4))
+
+    def testInstrumentation(self: Self) -> None:
+        dataChanged = []
+        rows = []
+        self.model.dataChanged.connect(lambda topLeft, bottomRight, roles: dataChanged.append(topLeft.internalPointer().path))
+        self.model.rowsInserted.connect(lambda parent, first, last: rows.append((parent.internalPointer().path, first, last)))
+
+        rootObject: DataClass = self.model.indexWithPath('Root.InstanceVariable').internalPointer().parent.value
+        self.model.instrument(lists=True)
+        try:
+            self.assertIn('__setattr__', DataClass.__dict__)
+
+            rootObject.InstanceVariable = 7
+            rootObject.ArrayVariable[1].AVariable = 'qux'
+            self.application.processEvents()
+            self.assertEqual(dataChanged, ['Root.InstanceVariable', 'Root.ArrayVariable.[1].AVariable'])
+            self.assertEqual(self.model.data(self.model.indexWithPath('Root.InstanceVariable').siblingAtColumn(1)), '7')
+
+            rootObject.ArrayVariable.append(OtherDataClass('appended'))
+            rootObject.ArrayVariable.insert(0, OtherDataClass('inserted'))
+            self.assertEqual(rows, [('Root.ArrayVariable', 4, 4), ('Root.ArrayVariable', 0, 0)])
+            self.assertEqual(self.model.indexWithPath('Root.ArrayVariable.[0].AVariable').internalPointer().value, 'inserted')
+            rootObject.ArrayVariable[5].AVariable = 'changed'
+            self.assertEqual(self.model.indexWithPath('Root.ArrayVariable.[5].AVariable').internalPointer().value, 'changed')
+
+            del rootObject.ArrayVariable[0:2]
+            self.assertEqual(self.model.rowCount(self.model.indexWithPath('Root.ArrayVariable')), 4)
+            self.assertEqual(self.model.indexWithPath('Root.ArrayVariable.[3].AVariable').internalPointer().value, 'changed')
+        finally:
+            self.model.load('Root', DataClass())
+
+        self.assertFalse(self.model.isInstrumented)
+        self.assertNotIn('__setattr__', DataClass.__dict__)
+        self.assertIs(type(rootObject.ArrayVariable), list)
+
+    def testInstrumentationReadOnlyContainers(self: Self) -> None:
+        extent: Extent = Extent([1, 2], [3])
+        frozenPath: FrozenPath = FrozenPath([4, 5])
+        lists: List[List[int]] = [[6]]
+        self.model.load('Root', {'extent': extent, 'path': frozenPath, 'lists': lists})
+
+        self.model.instrument(lists=True)
+        self.assertTrue(self.model.isInstrumented)
+        self.assertIs(type(extent.width), list)
+        self.assertIs(type(frozenPath.points), list)
+        self.assertIs(self.model.indexWithPath('Root.path.points').internalPointer().value, frozenPath.points)
+        self.assertIs(type(lists[0]), list)
+        self.assertFalse(self.model.flags(self.model.indexWithPath('Root.path.points').siblingAtColumn(1)) & Qt.ItemFlag.ItemIsEditable)
+
+        self.model.removeInstrumentation()
+        self.assertFalse(self.model.isInstrumented)
+
+    def testReload(self: Self) -> None:
+        signals = []
+        self.model.modelAboutToBeReset.connect(lambda: signals.append('reset'))
+        self.model.dataChanged.connect(lambda topLeft, bottomRight, roles: signals.append(('dataChanged', topLeft.internalPointer().path, bottomRight.row())))
+        self.model.rowsInserted.connect(lambda parent, first, last: signals.append(('inserted', parent.internalPointer().path, first, last)))
+        self.model.rowsRemoved.connect(lambda parent, first, last: signals.append(('removed', parent.internalPointer().path, first, last)))
+
+        arrayElementIndex: QPersistentModelIndex = QPersistentModelIndex(self.model.indexWithPath('Root.ArrayVariable.[3]'))
+        arrayElementNode = QModelIndex(arrayElementIndex).internalPointer()
+
+        nextObject: DataClass = DataClass()
+        nextObject.FloatVariable = 2.5
+        nextObject.ArrayVariable[3].AVariable = 'qux'
+        nextObject.ArrayVariable.append(OtherDataClass('appended'))
+        nextObject.EnumVariable = 'no longer an enum'
+        nextObject.FileVariable = QFileInfo('/tmp/file.txt')
+        self.model.reload(nextObject)
+
+        self.assertEqual(sorted(signals, key=str), sorted([
+            ('dataChanged', 'Root.FloatVariable', 2),
+            ('dataChanged', 'Root.EnumVariable', 5),
+            ('dataChanged', 'Root.FileVariable', 8),
+            ('dataChanged', 'Root.ArrayVariable.[3].AVariable', 0),
+            ('inserted', 'Root.ArrayVariable', 4, 4),
+        ], key=str))
+        self.assertTrue(arrayElementIndex.isValid())
+        self.assertIs(QModelIndex(arrayElementIndex).internalPointer(), arrayElementNode)
+        self.assertIs(arrayElementNode.value, nextObject.ArrayVariable[3])
+        self.assertEqual(self.model.data(self.model.indexWithPath('Root.EnumVariable').siblingAtColumn(2)), 'str')
+        self.assertEqual(self.model.indexWithPath('Root.ArrayVariable.[4].AVariable').internalPointer().value, 'appended')
+
+        self.model.setData(self.model.indexWithPath('Root.FloatVariable'), 3.5)
+        self.assertEqual(nextObject.FloatVariable, 3.5)
+
+    def testLoadAsync(self: Self) -> None:
+        finished = []
+        progress = []
+        self.model.loadFinished.connect(lambda: finished.append(self.model.indexWithPath('Next.StringVariable').internalPointer().value))
+        self.model.loadProgress.connect(progress.append)
+
+        cancelledObject: DataClass = DataClass()
+        cancelledObject.StringVariable = 'cancelled'
+        self.model.loadAsync('Next', cancelledObject)
+        nextObject: DataClass = DataClass()
+        nextObject.StringVariable = 'next'
+        self.model.loadAsync('Next', nextObject)
+        self.assertTrue(self.model.isLoading)
+
+        deadline: float = perf_counter() + 5.0
+        while self.model.isLoading and perf_counter() < deadline:
+            self.application.processEvents()
+
+        self.assertFalse(self.model.isLoading)
+        self.assertEqual(finished, ['next'])
+        self.assertEqual(progress[-1], 18)
+        self.assertEqual(self.model.maxDepth, 4)
+        self.assertEqual(self.model.rowCount(self.model.indexWithPath('Next.ArrayVariable')), 4)
+
+    def testReloadCancelsLoadAsync(self: Self) -> None:
+        finished = []
+        self.model.loadFinished.connect(lambda: finished.append(True))
+
+        self.model.loadAsync('Root', list(map(OtherDataClass, range(20000))))
+        reloadedObject: DataClass = DataClass()
+        reloadedObject.StringVariable = 'reloaded'
+        self.model.reload(reloadedObject)
+        self.assertFalse(self.model.isLoading)
+
+        deadline: float = perf_counter() + 5.0
+        while len(NodeBuilder.Running) > 0 and perf_counter() < deadline:
+            self.application.processEvents()
+
+        self.assertEqual(NodeBuilder.Running, set())
+        self.assertEqual(finished, [])
+        self.assertEqual(self.model.indexWithPath('Root.StringVariable').internalPointer().value, 'reloaded')
+
+    def testColorMapGrowsOnInsert(self: Self) -> None:
+        self.assertEqual(self.model.maxDepth, 4)
+        self.model.addArrayElementAt(
+            self.model.indexWithPath('Root.ArrayVariable.[0]'),
+            OtherDataClass(OtherDataClass(OtherDataClass('deep'))),
+        )
+
+        index: QModelIndex = self.model.indexWithPath('Root.ArrayVariable.[0].AVariable.AVariable.AVariable')
+        self.assertEqual(index.internalPointer().depth, 6)
+        self.assertEqual(self.model.maxDepth, 6)
+        self.assertIsInstance(self.model.data(index, Qt.ItemDataRole.BackgroundRole), QBrush)
+        self.assertIsInstance(self.model.data(index, Qt.ItemDataRole.ForegroundRole), QBrush)
+        self.assertNotEqual(
+            self.model.data(self.model.index(0, 0), Qt.ItemDataRole.BackgroundRole),
+            self.model.data(self.model.index(1, 0), Qt.ItemDataRole.BackgroundRole),
+        )
+
+        self.model.removeArrayElementAt(self.model.indexWithPath('Root.ArrayVariable.[0]'))
+        self.assertEqual(self.model.maxDepth, 4)
+
+    def testArrayRangeUndo(self: Self) -> None:
+        arrayIndex: QModelIndex = self.model.indexWithPath('Root.ArrayVariable')
+        signals = []
+        self.model.rowsInserted.connect(lambda parent, first, last: signals.append(('inserted', first, last)))
+        self.model.rowsRemoved.connect(lambda parent, first, last: signals.append(('removed', first, last)))
+
+        self.model.undoStack.push(UndoArrayInsert(
+            arrayIndex,
+            1,
+            list(map(OtherDataClass, ['a', 'b', 'c'])),
+        ))
+        self.assertEqual(self.model.rowCount(arrayIndex), 7)
+        self.assertEqual(self.model.indexWithPath('Root.ArrayVariable.[3].AVariable').internalPointer().value, 'c')
+
+        self.model.undoStack.push(UndoArrayRemove(arrayIndex, 0, 5))
+        self.assertEqual(list(map(lambda element: element.AVariable, self.model.indexWithPath('Root.ArrayVariable').internalPointer().value)), ['baz', 'bad'])
+        self.assertEqual(self.model.undoStack.count(), 2)
+
+        self.model.undoStack.undo()
+        self.model.undoStack.undo()
+        self.assertEqual(list(map(lambda element: element.AVariable, self.model.indexWithPath('Root.ArrayVariable').internalPointer().value)), ['foo', 'bar', 'baz', 'bad'])
+        self.assertEqual(signals, [
+            ('inserted', 1, 3),
+            ('removed', 0, 4),
+            ('inserted', 0, 4),
+            ('removed', 1, 3),
+        ])
+
+    def testArrayRemoveUndo(self: Self) -> None:
+        arrayIndex: QModelIndex = self.model.indexWithPath('Root.ArrayVariable')
+        array: List[OtherDataClass] = arrayIndex.internalPointer().value
+        self.model.setValue('Root.ArrayVariable.[3].AVariable', 'qux')
+        self.model.removeArrayElements(arrayIndex, 1, 2)
+        self.model.addArrayElementAt(self.model.indexWithPath('Root.ArrayVariable.[0]'), OtherDataClass('first'))
+        self.assertEqual(self.model.undoStack.count(), 3)
+
+        self.model.undoStack.undo()
+        self.model.undoStack.undo()
+        self.assertEqual(list(map(lambda element: element.AVariable, array)), ['foo', 'bar', 'baz', 'qux'])
+        self.model.undoStack.undo()
+        self.assertEqual(list(map(lambda element: element.AVariable, array)), ['foo', 'bar', 'baz', 'bad'])
+        self.assertEqual(self.model.nodeWithPath('Root.ArrayVariable.[3].AVariable').value, 'bad')
+
+    def testArrayInsertUndoAtEnds(self: Self) -> None:
+        arrayIndex: QModelIndex = self.model.indexWithPath('Root.ArrayVariable')
+        array: List[OtherDataClass] = arrayIndex.internalPointer().value
+        self.model.removeArrayElements(arrayIndex, 0, 4)
+
+        self.model.undoStack.push(UndoArrayInsert(arrayIndex, 0, [OtherDataClass('a')]))
+        self.model.undoStack.push(UndoArrayInsert(arrayIndex, 1, [OtherDataClass('b'), OtherDataClass('c')]))
+        self.assertEqual(list(map(lambda element: element.AVariable, array)), ['a', 'b', 'c'])
+        self.assertEqual(self.model.rowCount(arrayIndex), 3)
+
+        self.model.undoStack.undo()
+        self.assertEqual(list(map(lambda element: element.AVariable, array)), ['a'])
+        self.model.undoStack.undo()
+        self.assertEqual(array, [])
+        self.assertEqual(self.model.rowCount(arrayIndex), 0)
+
+    def testValueChangeSignals(self: Self) -> None:
+        dataChanged = []
+        layoutChanged = []
+        self.model.dataChanged.connect(lambda topLeft, bottomRight, roles: dataChanged.append((topLeft.row(), topLeft.column(), bottomRight.row(), bottomRight.column())))
+        self.model.layoutChanged.connect(lambda: layoutChanged.append(True))
+
+        self.model.setData(self.model.indexWithPath('Root.InstanceVariable'), 2)
+        self.model.setData(self.model.indexWithPath('Root.StringVariable'), 'foo')
+        self.model.setData(self.model.indexWithPath('Root.FloatVariable'), 2.5)
+        self.model.setData(self.model.indexWithPath('Root.InstanceVariable'), 3)
+        self.model.setData(self.model.indexWithPath('Root.EnumVariable'), AnEnum.Option1)
+        self.model.setData(self.model.indexWithPath('Root.ArrayVariable.[1].AVariable'), 'qux')
+        self.assertEqual(dataChanged, [])
+
+        self.application.processEvents()
+        self.assertEqual(sorted(dataChanged), [
+            (0, 1, 0, 2),
+            (0, 1, 2, 2),
+            (5, 1, 5, 2),
+        ])
+        self.assertEqual(layoutChanged, [])
+
+        self.model.undoStack.undo()
+        self.model.undoStack.undo()
+        self.application.processEvents()
+        self.assertEqual(len(dataChanged), 5)
+        self.assertEqual(layoutChanged, [])
+
+    def testTransaction(self: Self) -> None:
+        dataChanged = []
+        self.model.dataChanged.connect(lambda topLeft, bottomRight, roles: dataChanged.append((topLeft.row(), bottomRight.row())))
+
+        with self.model.transaction('Preset'):
+            self.model.setValue('Root.InstanceVariable', 2)
+            self.model.setValue('Root.ArrayVariable.[3].AVariable', 'qux')
+            self.model.insertArrayElements(self.model.indexWithPath('Root.ArrayVariable'), 0, [OtherDataClass('first')])
+            self.model.setValue('Root.ArrayVariable.[4].AVariable', 'quux')
+            self.model.setData(self.model.indexWithPath('Root.StringVariable'), 'foo')
+            self.application.processEvents()
+            self.assertEqual(dataChanged, [])
+
+        self.assertEqual(sorted(dataChanged), [(0, 0), (0, 1)])
+        self.assertEqual(self.model.undoStack.count(), 1)
+        self.assertEqual(self.model.undoStack.text(0), 'Preset')
+
+        rootObject: DataClass = self.model.indexWithPath('Root.InstanceVariable').internalPointer().parent.value
+        names = lambda: list(map(lambda element: element.AVariable, rootObject.ArrayVariable))
+        self.assertEqual(names(), ['first', 'foo', 'bar', 'baz', 'quux'])
+
+        self.model.undoStack.undo()
+        self.assertEqual(rootObject.InstanceVariable, 1)
+        self.assertEqual(rootObject.StringVariable, 'hello, world!')
+        self.assertEqual(names(), ['foo', 'bar', 'baz', 'bad'])
+        self.assertEqual(self.model.rowCount(self.model.indexWithPath('Root.ArrayVariable')), 4)
+
+        self.model.undoStack.redo()
+        self.assertEqual(rootObject.InstanceVariable, 2)
+        self.assertEqual(rootObject.StringVariable, 'foo')
+        self.assertEqual(names(), ['first', 'foo', 'bar', 'baz', 'quux'])
+        self.assertEqual(self.model.indexWithPath('Root.ArrayVariable.[4].AVariable').internalPointer().value, 'quux')
+
+    def testTransactionRemove(self: Self) -> None:
+        rootObject: DataClass = self.model.indexWithPath('Root.InstanceVariable').internalPointer().parent.value
+        names = lambda: list(map(lambda element: element.AVariable, rootObject.ArrayVariable))
+        arrayIndex: QModelIndex = self.model.indexWithPath('Root.ArrayVariable')
+
+        with self.model.transaction():
+            self.model.setValue('Root.ArrayVariable.[0].AVariable', 'qux')
+            removed: List[OtherDataClass] = self.model.removeArrayElements(arrayIndex, 1, 2)
+            self.model.setValue('Root.ArrayVariable.[1].AVariable', 'quux')
+            self.model.removeArrayElementAt(self.model.indexWithPath('Root.ArrayVariable.[0]'))
+        self.assertEqual(list(map(lambda element: element.AVariable, removed)), ['bar', 'baz'])
+        self.assertEqual(names(), ['quux'])
+        self.assertEqual(self.model.undoStack.count(), 1)
+
+        self.model.undoStack.undo()
+        self.assertEqual(names(), ['foo', 'bar', 'baz', 'bad'])
+        self.model.undoStack.redo()
+        self.assertEqual(names(), ['quux'])
+
+    def testEmptyTransaction(self: Self) -> None:
+        with self.model.transaction():
+            with self.model.transaction():
+                pass
+        self.assertEqual(self.model.undoStack.count(), 0)
+
+        with self.model.transaction('Outer'):
+            with self.model.transaction('Inner'):
+                self.model.setValue('Root.InstanceVariable', 2)
+        self.assertEqual(self.model.undoStack.count(), 1)
+        self.assertEqual(self.model.undoStack.text(0), 'Outer')
+
+    def testFailedTransaction(self: Self) -> None:
+        rootObject: DataClass = self.model.indexWithPath('Root.InstanceVariable').internalPointer().parent.value
+        names = lambda: list(map(lambda element: element.AVariable, rootObject.ArrayVariable))
+        arrayIndex: QModelIndex = self.model.indexWithPath('Root.ArrayVariable')
+
+        with self.assertRaises(ValueError):
+            with self.model.transaction():
+                self.model.setValue('Root.InstanceVariable', 2)
+                self.model.removeArrayElements(arrayIndex, 1, 2)
+                self.model.setValue('Root.ArrayVariable.[1].AVariable', 'qux')
+                raise ValueError()
+
+        self.assertEqual(rootObject.InstanceVariable, 1)
+        self.assertEqual(names(), ['foo', 'bar', 'baz', 'bad'])
+        self.assertEqual(self.model.rowCount(arrayIndex), 4)
+        self.assertEqual(self.model.indexWithPath('Root.ArrayVariable.[3].AVariable').internalPointer().value, 'bad')
+        self.assertEqual(self.model.undoStack.count(), 0)
+
+class CompareTest(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.application: QCoreApplication = QCoreApplication.instance() or QCoreApplication([])
+        self.saved: ObjectModel = ObjectModel()
+        self.saved.load('Root', DataClass())
+        self.live: ObjectModel = ObjectModel(lazy=True)
+        self.live.load('Root', DataClass())
+
+    def testCompareWith(self: Self) -> None:
+        self.assertEqual(self.saved.diff(self.live), [])
+
+        self.live.setValue('Root.ArrayVariable.[1].AVariable', 'qux')
+        self.saved.compareWith(self.live)
+        changedIndex: QModelIndex = self.saved.indexWithPath('Root.ArrayVariable.[1].AVariable')
+        self.assertTrue(self.saved.data(changedIndex, ObjectModel.ChangedRole))
+        self.assertIs(self.saved.data(changedIndex, Qt.ItemDataRole.BackgroundRole), ObjectModel.ChangedBrush)
+        self.assertFalse(self.saved.data(self.saved.indexWithPath('Root.ArrayVariable.[0].AVariable'), ObjectModel.ChangedRole))
+
+        self.live.undoStack.undo()
+        self.saved.compareWith(self.live)
+        self.assertFalse(self.saved.data(changedIndex, ObjectModel.ChangedRole))
+
+class SnapshotObjectModelTest(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.application: QCoreApplication = QCoreApplication.instance() or QCoreApplication([])
+        self.directory: TemporaryDirectory = TemporaryDirectory()
+        self.fileName: str = join(self.directory.name, 'root.snapshot')
+
+        model: ObjectModel = ObjectModel()
+        model.load('Root', DataClass())
+        model.saveSnapshot(self.fileName, ['Root.ArrayVariable'])
+        self.model: ObjectModel = ObjectModel(lazy=True)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+        super().tearDown()
+
+    def testBrowse(self: Self) -> None:
+        snapshot = self.model.loadSnapshot(self.fileName)
+        self.assertIs(self.model.snapshot, snapshot)
+        self.assertEqual(snapshot.expandedPaths, ['Root.ArrayVariable'])
+
+        index: QModelIndex = self.model.indexWithPath('Root.ArrayVariable.[1].AVariable')
+        self.assertEqual(self.model.data(index.siblingAtColumn(1)), 'bar')
+        self.assertEqual(self.model.data(index.parent().siblingAtColumn(2)), 'OtherDataClass')
+        self.assertEqual(self.model.data(self.model.indexWithPath('Root.EnumVariable').siblingAtColumn(1)), 'Option2')
+        self.assertFalse(self.model.flags(index.siblingAtColumn(1)) & Qt.ItemFlag.ItemIsEditable)
+
+        self.assertFalse(snapshot.closed)
+        self.model.load('Root', DataClass())
+        self.assertIsNone(self.model.snapshot)
+        self.assertTrue(snapshot.closed)
+
+    def testReloadSnapshot(self: Self) -> None:
+        snapshot = self.model.loadSnapshot(self.fileName)
+        self.model.fetchMore(self.model.indexWithPath('Root.ArrayVariable'))
+        reloaded = self.model.loadSnapshot(self.fileName)
+        self.assertTrue(snapshot.closed)
+        self.assertFalse(reloaded.closed)
+        self.assertEqual(self.model.data(self.model.indexWithPath('Root.ArrayVariable.[1].AVariable').siblingAtColumn(1)), 'bar')
+
+class ProfilingTest(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.application: QCoreApplication = QCoreApplication.instance() or QCoreApplication([])
+        self.model: ObjectModel = ObjectModel()
+        self.model.load('Root', DataClass())
+
+    def tearDown(self) -> None:
+        self.model.disableProfiling()
+        super().tearDown()
+
+    def testStats(self: Self) -> None:
+        profiler: ModelProfiler = self.model.enableProfiling()
+        index: QModelIndex = self.model.indexWithPath('Root.StringVariable')
+        self.model.data(index)
+        self.model.data(index.siblingAtColumn(1))
+        self.model.data(index.siblingAtColumn(1), Qt.ItemDataRole.BackgroundRole)
+        self.model.setValue('Root.InstanceVariable', 2)
+        self.model.undoStack.undo()
+        self.model.insertArrayElements(self.model.indexWithPath('Root.ArrayVariable'), 0, [OtherDataClass('qux')])
+
+        stats = profiler.stats()
+        self.assertEqual(stats['methods']['data']['count'], 3)
+        self.assertEqual(stats['columns']['data'][1]['count'], 2)
+        self.assertEqual(stats['roles']['data']['DisplayRole']['count'], 2)
+        self.assertEqual(stats['roles']['data']['BackgroundRole']['count'], 1)
+        self.assertEqual(stats['methods']['undoStack.undo']['count'], 1)
+        self.assertEqual(stats['signals']['rowsInserted'], 1)
+        self.assertEqual(stats['signals']['undoStack.indexChanged'], 3)
+        self.assertEqual(stats['nodes'], 2)
+        self.assertIn('nodes constructed: 2', profiler.report())
+
+        profiler.reset()
+        self.assertEqual(profiler.stats()['methods'], {})
+
+    def testDisabled(self: Self) -> None:
+        self.model.enableProfiling(1000)
+        self.model.disableProfiling()
+        self.assertFalse(self.model.isProfiling)
+        self.assertNotIn('data', vars(self.model))
+        self.assertNotIn('undo', vars(self.model.undoStack))
+        self.assertIs(Node.__init__, ModelProfiler.NodeInit)
+
+class SearchTest(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.application: QCoreApplication = QCoreApplication.instance() or QCoreApplication([])
+        self.model: ObjectModel = ObjectModel()
+        self.model.load('Root', DataClass())
+        self.model.enableSearch()
+
+    def testSearch(self: Self) -> None:
+        self.assertEqual(list(map(lambda node: node.path, self.model.search('floatvar'))), ['Root.FloatVariable'])
+        self.assertEqual(sorted(map(lambda node: node.path, self.model.search('ba'))), ['Root.ArrayVariable.[1].AVariable', 'Root.ArrayVariable.[2].AVariable', 'Root.ArrayVariable.[3].AVariable'])
+        self.assertEqual(list(map(lambda node: node.path, self.model.search('ArrayVariable.[2]'))), ['Root.ArrayVariable.[2]'])
+        self.assertEqual(list(map(lambda node: node.path, self.model.prefixSearch('bool'))), ['Root.BoolVariable'])
+
+    def testIncrementalUpdates(self: Self) -> None:
+        self.model.setValue('Root.StringVariable', 'needle')
+        self.assertEqual(list(map(lambda node: node.path, self.model.search('needle'))), ['Root.StringVariable'])
+
+        self.model.undoStack.undo()
+        self.assertEqual(self.model.search('needle'), [])
+
+        self.model.insertArrayElements(self.model.indexWithPath('Root.ArrayVariable'), 0, [OtherDataClass('needle')])
+        self.assertEqual(list(map(lambda node: node.path, self.model.search('needle'))), ['Root.ArrayVariable.[0].AVariable'])
+        self.assertEqual(list(map(lambda node: node.path, self.model.search('ArrayVariable.[4]'))), ['Root.ArrayVariable.[4]'])
+
+    def testFilterProxy(self: Self) -> None:
+        proxy: ObjectFilterProxyModel = ObjectFilterProxyModel()
+        proxy.setSourceModel(self.model)
+        self.assertEqual(proxy.rowCount(), 9)
+
+        proxy.setSearchText('baz')
+        self.assertEqual(proxy.rowCount(), 1)
+        arrayIndex: QModelIndex = proxy.index(0, 0)
+        self.assertEqual(proxy.data(arrayIndex), 'ArrayVariable')
+        self.assertEqual(proxy.rowCount(arrayIndex), 1)
+        self.assertEqual(proxy.data(proxy.index(0, 0, arrayIndex)), '[2]')
+
+        proxy.setSearchText('')
+        self.assertEqual(proxy.rowCount(), 9)
+
+class SharedReferenceObjectModelTest(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.application: QCoreApplication = QCoreApplication.instance() or QCoreApplication([])
+        self.model: ObjectModel = ObjectModel()
+        self.model.load('Root', Scene())
+
+    def testLinkDisplay(self: Self) -> None:
+        index: QModelIndex = self.model.indexWithPath('Root.objects.[1].material')
+        self.assertEqual(self.model.rowCount(index), 0)
+        self.assertEqual(self.model.data(index.siblingAtColumn(1)), '-> Root.objects.[0].material')
+        self.assertEqual(self.model.data(self.model.indexWithPath('Root.objects.[1].scene').siblingAtColumn(1)), '-> Root')
+
+    def testRemovedOwnerPromotesLink(self: Self) -> None:
+        insertedRows: List[Any] = []
+        self.model.rowsInserted.connect(lambda parent, first, last: insertedRows.append((parent.internalPointer().path, first, last)))
+        self.model.removeArrayElements(self.model.indexWithPath('Root.objects'), 0, 1)
+
+        index: QModelIndex = self.model.indexWithPath('Root.objects.[0].material')
+        self.assertEqual(insertedRows, [('Root.objects.[0].material', 0, 0)])
+        self.assertEqual(self.model.rowCount(index), 1)
+        self.assertIsNone(self.model.data(index.siblingAtColumn(1)))
+        self.assertEqual(self.model.data(self.model.indexWithPath('Root.objects.[0].material.color').siblingAtColumn(1)), 'red')
+
+        self.model.undoStack.undo()
+        self.assertEqual(self.model.rowCount(self.model.indexWithPath('Root.objects')), 2)
+        self.assertEqual(self.model.data(self.model.indexWithPath('Root.objects.[0].material').siblingAtColumn(1)), '-> Root.objects.[1].material')
+
+    def testFieldlessDisplay(self: Self) -> None:
+        self.model.load('r', {'a': None, 'b': None, 'c': 1j})
+        self.assertEqual(self.model.data(self.model.indexWithPath('r.b').siblingAtColumn(1)), 'None')
+        self.assertEqual(self.model.data(self.model.indexWithPath('r.c').siblingAtColumn(1)), '1j')
+
+class MappingObjectModelTest(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.application: QCoreApplication = QCoreApplication.instance() or QCoreApplication([])
+        self.model: ObjectModel = ObjectModel()
+        self.inventory: Inventory = Inventory()
+        self.model.load('Root', self.inventory)
+
+    def testMappingUndo(self: Self) -> None:
+        mappingIndex: QModelIndex = self.model.indexWithPath('Root.items')
+        shieldIndex: QPersistentModelIndex = QPersistentModelIndex(self.model.indexWithPath('Root.items.shield'))
+        self.assertIsNone(self.model.data(mappingIndex.siblingAtColumn(1)))
+
+        insertedRows = []
+        self.model.rowsInserted.connect(lambda parent, first, last: insertedRows.append((first, last)))
+        self.model.undoStack.push(UndoMappingInsert(mappingIndex, 'bow', OtherDataClass('yew')))
+        self.assertEqual(insertedRows, [(3, 3)])
+        self.assertEqual(self.model.indexWithPath('Root.items.bow.AVariable').internalPointer().value, 'yew')
+
+        self.model.undoStack.push(UndoMappingRemove(mappingIndex, 'sword'))
+        self.assertEqual(list(self.inventory.items), ['shield', 3, 'bow'])
+        self.assertEqual(shieldIndex.row(), 0)
+
+        self.model.undoStack.undo()
+        self.assertEqual(list(self.inventory.items), ['sword', 'shield', 3, 'bow'])
+        self.assertEqual(shieldIndex.row(), 1)
+        self.assertEqual(self.model.indexWithPath('Root.items.sword.AVariable').internalPointer().value, 'steel')
+
+        self.model.undoStack.undo()
+        self.assertNotIn('bow', self.inventory.items)
+        self.assertFalse(self.model.indexWithPath('Root.items.bow').isValid())
+
+    def testNonStringKeyUndo(self: Self) -> None:
+        values: Dict[Any, str] = {1: 'int', '1': 'str'}
+        self.model.load('r', values)
+        intIndex: QModelIndex = self.model.index(0, 1)
+        strIndex: QModelIndex = self.model.index(1, 1)
+        self.assertEqual(self.model.indexWithPath('r.\\#1'), intIndex.siblingAtColumn(0))
+        self.assertEqual(self.model.indexWithPath('r.1'), strIndex.siblingAtColumn(0))
+
+        self.model.setData(intIndex, 'EDITED')
+        self.assertEqual(values, {1: 'EDITED', '1': 'str'})
+        self.model.setData(strIndex, 'CHANGED')
+        self.assertEqual(values, {1: 'EDITED', '1': 'CHANGED'})
+
+        self.model.undoStack.undo()
+        self.assertEqual(values, {1: 'EDITED', '1': 'str'})
+        self.model.undoStack.undo()
+        self.assertEqual(values, {1: 'int', '1': 'str'})
+        self.model.undoStack.redo()
+        self.assertEqual(values, {1: 'EDITED', '1': 'str'})
+
+    def testDottedKeyUndo(self: Self) -> None:
+        values: Dict[str, Any] = {'a.b': 1, 'a': {'b': 2}}
+        self.model.load('r', values)
+        index: QModelIndex = self.model.index(0, 1)
+        self.assertEqual(self.model.data(index.siblingAtColumn(0)), 'a.b')
+        self.assertEqual(self.model.indexWithPath('r.a\\.b'), index.siblingAtColumn(0))
+
+        self.model.setData(index, 5)
+        self.model.undoStack.undo()
+        self.model.undoStack.redo()
+        self.assertEqual(values, {'a.b': 5, 'a': {'b': 2}})
+
+    def testTransaction(self: Self) -> None:
+        mappingIndex: QModelIndex = self.model.indexWithPath('Root.items')
+        with self.model.transaction():
+            self.model.insertMappingItem(mappingIndex, 'bow', OtherDataClass('yew'), 0)
+            self.model.setValue('Root.items.bow.AVariable', 'elm')
+            self.assertEqual(self.model.removeMappingItem(mappingIndex, 'sword')[0], 1)
+        self.assertEqual(list(self.inventory.items), ['bow', 'shield', 3])
+
+        self.model.undoStack.undo()
+        self.assertEqual(list(self.inventory.items), ['sword', 'shield', 3])
+        self.assertEqual(self.inventory.items['sword'].AVariable, 'steel')
+
+        self.model.undoStack.redo()
+        self.assertEqual(list(self.inventory.items), ['bow', 'shield', 3])
+        self.assertEqual(self.inventory.items['bow'].AVariable, 'elm')
+
+    def testRefresh(self: Self) -> None:
+        self.inventory.items['sword'] = OtherDataClass('bronze')
+        self.inventory.items['axe'] = OtherDataClass('iron')
+        self.model.refresh()
+        self.assertEqual(self.model.indexWithPath('Root.items.sword.AVariable').internalPointer().value, 'bronze')
+        self.assertEqual(self.model.indexWithPath('Root.items.axe.AVariable').internalPointer().value, 'iron')
+
+    def testRefreshRemovedKey(self: Self) -> None:
+        with patch('objectmodel.objectmodel.perf_counter', side_effect=count().__next__):
+            self.assertFalse(self.model.refresh(3))
+        del self.inventory.items['shield']
+        self.assertTrue(self.model.refresh())
+        self.assertTrue(self.model.refresh())
+        self.assertFalse(self.model.indexWithPath('Root.items.shield').isValid())
+
+class LazyObjectModelTest(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.application: QCoreApplication = QCoreApplication.instance() or QCoreApplication([])
+        self.model: ObjectModel = ObjectModel(lazy=True)
+        self.model.load('Root', DataClass())
+
+    def testFetchMore(self: Self) -> None:
+        self.assertEqual(self.model.rowCount(), 9)
+
+        arrayIndex: QModelIndex = self.model.index(4, 0)
+        self.assertTrue(self.model.hasChildren(arrayIndex))
+        self.assertTrue(self.model.canFetchMore(arrayIndex))
+        self.assertEqual(self.model.rowCount(arrayIndex), 0)
+
+        insertedRows = []
+        self.model.rowsInserted.connect(lambda parent, first, last: insertedRows.append((first, last)))
+        self.model.fetchMore(arrayIndex)
+
+        self.assertEqual(insertedRows, [(0, 3)])
+        self.assertFalse(self.model.canFetchMore(arrayIndex))
+        self.assertEqual(self.model.rowCount(arrayIndex), 4)
+        self.assertTrue(self.model.canFetchMore(self.model.index(0, 0, arrayIndex)))
+
+    def testIndexWithPathFetchesParents(self: Self) -> None:
+        index: QModelIndex = self.model.indexWithPath('Root.ArrayVariable.[2].AVariable')
+        self.assertEqual(index.internalPointer().value, 'baz')
+        self.assertFalse(self.model.canFetchMore(self.model.index(4, 0)))
+        self.assertEqual(self.model.rowCount(self.model.index(4, 0)), 4)
+
+    def testScalarHasNoChildren(self: Self) -> None:
+        floatIndex: QModelIndex = self.model.index(2, 0)
+        self.assertFalse(self.model.hasChildren(floatIndex))
+        self.assertFalse(self.model.canFetchMore(floatIndex))
+
+class ChunkedArrayObjectModelTest(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.application: QCoreApplication = QCoreApplication.instance() or QCoreApplication([])
+        self.model: ObjectModel = ObjectModel(chunkSize=10)
+        self.values = list(range(100, 125))
+        self.model.load('Root', self.values)
+
+    def testRanges(self: Self) -> None:
+        self.assertEqual(self.model.rowCount(), 3)
+        rangeIndex: QModelIndex = self.model.index(1, 0)
+        self.assertEqual(self.model.data(rangeIndex), '[10..19]')
+        self.assertEqual(self.model.data(rangeIndex.siblingAtColumn(1)), 'len 10, min 110, max 119')
+        self.assertTrue(self.model.canFetchMore(rangeIndex))
+
+        index: QModelIndex = self.model.indexWithPath('Root.[12]')
+        self.assertEqual(index.row(), 2)
+        self.assertEqual(index.parent(), rangeIndex)
+        self.assertEqual(self.model.rowCount(rangeIndex), 10)
+
+        self.model.setData(index.siblingAtColumn(1), 500)
+        self.assertEqual(self.values[12], 500)
+        self.assertEqual(self.model.data(rangeIndex.siblingAtColumn(1)), 'len 10, min 110, max 500')
+
+    def testReleaseRanges(self: Self) -> None:
+        limit: int = ObjectModel.MaterializedRangeLimit
+        ObjectModel.MaterializedRangeLimit = 2
+        try:
+            for row in range(3):
+                self.model.fetchMore(self.model.index(row, 0))
+        finally:
+            ObjectModel.MaterializedRangeLimit = limit
+
+        self.assertTrue(self.model.canFetchMore(self.model.index(0, 0)))
+        self.assertEqual(self.model.rowCount(self.model.index(0, 0)), 0)
+        self.assertEqual(self.model.rowCount(self.model.index(2, 0)), 5)
+
+        self.model.releaseRanges()
+        for row in range(3):
+            self.assertTrue(self.model.canFetchMore(self.model.index(row, 0)))
+
+    def testReleasedRangeStaysReleased(self: Self) -> None:
+        rangeIndex: QModelIndex = self.model.index(0, 0)
+        self.model.fetchMore(rangeIndex)
+        element: Node = self.model.index(3, 0, rangeIndex).internalPointer()
+        self.model.releaseRanges()
+
+        self.model.notifyDataChanged(element)
+        self.model.flushDataChanged()
+        self.assertFalse(self.model.isAttached(element))
+        self.assertTrue(self.model.canFetchMore(rangeIndex))
+        self.assertEqual(self.model.rowCount(rangeIndex), 0)
+
+    def testUngroupedByDefault(self: Self) -> None:
+        model: ObjectModel = ObjectModel()
+        model.load('Root', list(range(1500)))
+        self.assertIsNone(model.chunkSize)
+        self.assertEqual(model.rowCount(), 1500)
+        self.assertEqual(model.indexWithPath('Root.[1234]').row(), 1234)
+
+    def testBufferRanges(self: Self) -> None:
+        values: array = array('i', range(25))
+        self.model.load('Root', values)
+        self.assertEqual(self.model.data(self.model.index(0, 2)), 'range')
+        self.assertEqual(self.model.data(self.model.index(2, 1)), 'len 5, min 20, max 24')
+
+        index: QModelIndex = self.model.indexWithPath('Root.[21]').siblingAtColumn(1)
+        self.assertTrue(self.model.flags(index) & Qt.ItemFlag.ItemIsEditable)
+        self.model.setData(index, -1)
+        self.assertEqual(values[21], -1)
+        self.model.undoStack.undo()
+        self.assertEqual(values[21], 21)
+
+    def testInsertUndo(self: Self) -> None:
+        firstRange: QPersistentModelIndex = QPersistentModelIndex(self.model.index(0, 0))
+        self.model.undoStack.push(UndoArrayInsert(QModelIndex(), 15, list(range(6)), self.model))
+        self.assertEqual(self.model.rowCount(), 4)
+        self.assertTrue(firstRange.isValid())
+        self.assertEqual(self.model.indexWithPath('Root.[30]').internalPointer().value, 124)
+
+        self.model.undoStack.undo()
+        self.assertEqual(self.values, list(range(100, 125)))
+        self.assertEqual(self.model.rowCount(), 3)
+        self.assertEqual(self.model.data(self.model.index(2, 0)), '[20..24]')
+
+if __name__ == '__main__':
+    main()
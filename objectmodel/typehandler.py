@@ -0,0 +1,61 @@
+from typing import (
+    Self,
+    Any,
+    Callable,
+    Optional,
+)
+from PyQt6.QtWidgets import QWidget
+from objectmodel.nodekind import NodeKind
+
+class TypeHandler:
+    def __init__(
+        self: Self,
+        kind: NodeKind = NodeKind.Object,
+        formatter: Optional[Callable[[Any], str]] = None,
+        editorFactory: Optional[Callable[[QWidget, Any], QWidget]] = None,
+        editorSetter: Optional[Callable[[QWidget, Any], None]] = None,
+        parser: Optional[Callable[[QWidget, Any], Any]] = None,
+        inherited: bool = True,
+        typeFormatter: Optional[Callable[[Any], str]] = None,
+        readOnly: bool = False,
+    ) -> None:
+        self._kind: NodeKind = kind
+        self._formatter: Optional[Callable[[Any], str]] = formatter
+        self._editorFactory: Optional[Callable[[QWidget, Any], QWidget]] = editorFactory
+        self._editorSetter: Optional[Callable[[QWidget, Any], None]] = editorSetter
+        self._parser: Optional[Callable[[QWidget, Any], Any]] = parser
+        self._inherited: bool = inherited
+        self._typeFormatter: Optional[Callable[[Any], str]] = typeFormatter
+        self._readOnly: bool = readOnly
+
+    @property
+    def kind(self: Self) -> NodeKind:
+        return self._kind
+
+    @property
+    def formatter(self: Self) -> Optional[Callable[[Any], str]]:
+        return self._formatter
+
+    @property
+    def editorFactory(self: Self) -> Optional[Callable[[QWidget, Any], QWidget]]:
+        return self._editorFactory
+
+    @property
+    def editorSetter(self: Self) -> Optional[Callable[[QWidget, Any], None]]:
+        return self._editorSetter
+
+    @property
+    def parser(self: Self) -> Optional[Callable[[QWidget, Any], Any]]:
+        return self._parser
+
+    @property
+    def inherited(self: Self) -> bool:
+        return self._inherited
+
+    @property
+    def typeFormatter(self: Self) -> Optional[Callable[[Any], str]]:
+        return self._typeFormatter
+
+    @property
+    def readOnly(self: Self) -> bool:
+        return self._readOnly
@@ -0,0 +1,161 @@
+from typing import (
+    Any,
+    Dict,
+    Optional,
+)
+from enum import (
+    Enum,
+    Flag,
+)
+from array import array
+from PyQt6.QtWidgets import (
+    QWidget,
+    QComboBox,
+    QFileDialog,
+)
+from PyQt6.QtCore import QFileInfo
+from objectmodel.nodekind import NodeKind
+from objectmodel.typehandler import TypeHandler
+from objectmodel.bufferaccess import BufferAccess
+from objectmodel.snapshotrecord import SnapshotRecord
+from objectmodel.snapshotarray import SnapshotArray
+
+try:
+    from numpy import ndarray
+except ImportError:
+    ndarray = None
+
+class TypeRegistry:
+    Handlers: Dict[type, TypeHandler] = {}
+    Resolved: Dict[type, TypeHandler] = {}
+    Fallback: TypeHandler = TypeHandler(NodeKind.Object)
+
+    @staticmethod
+    def register(cls: type, handler: TypeHandler) -> None:
+        TypeRegistry.Handlers[cls] = handler
+        TypeRegistry.Resolved.clear()
+
+    @staticmethod
+    def unregister(cls: type) -> None:
+        TypeRegistry.Handlers.pop(cls, None)
+        TypeRegistry.Resolved.clear()
+
+    @staticmethod
+    def handler(cls: type) -> TypeHandler:
+        handler: Optional[TypeHandler] = TypeRegistry.Resolved.get(cls)
+        if handler is None:
+            handler = TypeRegistry.resolve(cls)
+            TypeRegistry.Resolved[cls] = handler
+        return handler
+
+    @staticmethod
+    def kindOf(value: Any) -> NodeKind:
+        kind: NodeKind = TypeRegistry.handler(type(value)).kind
+        if kind is NodeKind.Buffer and not BufferAccess.isBuffer(value):
+            return NodeKind.Object
+        return kind
+
+    @staticmethod
+    def resolve(cls: type) -> TypeHandler:
+        handler: Optional[TypeHandler] = TypeRegistry.Handlers.get(cls)
+        if handler is not None:
+            return handler
+
+        for base in cls.__mro__[1:]:
+            handler = TypeRegistry.Handlers.get(base)
+            if handler is not None and handler.inherited:
+                return handler
+
+        return TypeRegistry.Fallback
+
+    @staticmethod
+    def comboBox(parent: QWidget, items: Any) -> QComboBox:
+        comboBox = QComboBox(parent)
+        comboBox.addItems(items)
+        return comboBox
+
+    @staticmethod
+    def filePathEditor(parent: QWidget, node: Any) -> QFileDialog:
+        dialog = QFileDialog()
+        dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+        dialog.setDirectory(node.value.path())
+        dialog.setWindowTitle('Change {}'.format(node.name))
+        return dialog
+
+    @staticmethod
+    def filePath(editor: QFileDialog, node: Any) -> QFileInfo:
+        if editor.result() == QFileDialog.DialogCode.Rejected:
+            raise ValueError('File selection was rejected.')
+        return QFileInfo(editor.selectedFiles()[0])
+
+    @staticmethod
+    def formatFilePath(value: QFileInfo) -> str:
+        return '/'.join(map(lambda component: component[0] if len(component) > 0 else '', value.path().split('/'))) + '/' + value.fileName()
+
+    @staticmethod
+    def registerDefaults() -> None:
+        TypeRegistry.register(int, TypeHandler(
+            kind=NodeKind.Int,
+            parser=lambda editor, node: int(editor.text()),
+            inherited=False,
+        ))
+        TypeRegistry.register(float, TypeHandler(
+            kind=NodeKind.Float,
+            parser=lambda editor, node: float(editor.text()),
+            inherited=False,
+        ))
+        TypeRegistry.register(str, TypeHandler(
+            kind=NodeKind.String,
+            inherited=False,
+        ))
+        TypeRegistry.register(bool, TypeHandler(
+            kind=NodeKind.Bool,
+            editorFactory=lambda parent, node: TypeRegistry.comboBox(parent, ['True', 'False']),
+            editorSetter=lambda editor, node: editor.setCurrentText(str(node.value)),
+            parser=lambda editor, node: editor.currentText() == 'True',
+            inherited=False,
+        ))
+        TypeRegistry.register(Enum, TypeHandler(
+            kind=NodeKind.Enum,
+            formatter=lambda value: value.name,
+            editorFactory=lambda parent, node: TypeRegistry.comboBox(parent, [enumKey.name for enumKey in node.type]),
+            editorSetter=lambda editor, node: editor.setCurrentText(node.value.name),
+            parser=lambda editor, node: getattr(node.type, editor.currentText()),
+        ))
+        TypeRegistry.register(Flag, TypeHandler(
+            kind=NodeKind.Flag,
+        ))
+        TypeRegistry.register(list, TypeHandler(
+            kind=NodeKind.Array,
+        ))
+        TypeRegistry.register(dict, TypeHandler(
+            kind=NodeKind.Mapping,
+        ))
+        TypeRegistry.register(QFileInfo, TypeHandler(
+            kind=NodeKind.FilePath,
+            formatter=TypeRegistry.formatFilePath,
+            editorFactory=TypeRegistry.filePathEditor,
+            parser=TypeRegistry.filePath,
+        ))
+        TypeRegistry.register(array, TypeHandler(
+            kind=NodeKind.Buffer,
+        ))
+        TypeRegistry.register(memoryview, TypeHandler(
+            kind=NodeKind.Buffer,
+        ))
+        TypeRegistry.register(SnapshotRecord, TypeHandler(
+            kind=NodeKind.Mapping,
+            typeFormatter=lambda value: value.typeName,
+            readOnly=True,
+        ))
+        TypeRegistry.register(SnapshotArray, TypeHandler(
+            kind=NodeKind.Array,
+            typeFormatter=lambda value: value.typeName,
+            readOnly=True,
+        ))
+        if ndarray is not None:
+            TypeRegistry.register(ndarray, TypeHandler(
+                kind=NodeKind.Buffer,
+            ))
+
+TypeRegistry.registerDefaults()
@@ -1,33 +1,33 @@
 from PyQt6.QtGui import QUndoCommand
-from PyQt6.QtCore import (
-    QModelIndex,
-    Qt,
-)
+from PyQt6.QtCore import QModelIndex
 from typing import (
     Self,
     Any,
-)
-from copy import (
-    deepcopy,
+    List,
+    Optional,
 )
 
 class UndoArrayInsert(QUndoCommand):
     def __init__(
         self: Self,
-        index: QModelIndex,
+        parent: QModelIndex,
+        row: int,
+        values: List[Any],
+        model: Optional[Any] = None,
     ) -> None:
         super().__init__()
 
-        self._path = index.internalPointer().path
-        self._oldValue = index.internalPointer().value
-        self._model = index.model()
+        self._model = parent.model() if model is None else model
+        self._parentPath = self._model.parentNode(parent).path
+        self._row = row
+        self._values = list(values)
 
-        self.setText("ValueChange")
+        self.setText("ArrayInsert")
 
     def redo(self: Self) -> None:
-        index: QModelIndex = self._model.indexWithPath(self._path)
-        self._model.addArrayElementAt(index)
+        parent: QModelIndex = self._model.indexWithPath(self._parentPath)
+        self._model.replay(lambda: self._model.insertArrayElements(parent, self._row, self._values))
 
     def undo(self: Self) -> None:
-        index: QModelIndex = self._model.indexWithPath(self._path)
-        self._model.removeArrayElementAt(index)
+        parent: QModelIndex = self._model.indexWithPath(self._parentPath)
+        self._model.replay(lambda: self._model.removeArrayElements(parent, self._row, len(self._values)))
@@ -1,33 +1,38 @@
 from PyQt6.QtGui import QUndoCommand
-from PyQt6.QtCore import (
-    QModelIndex,
-    Qt,
-)
+from PyQt6.QtCore import QModelIndex
 from typing import (
     Self,
     Any,
-)
-from copy import (
-    deepcopy,
+    List,
+    Optional,
 )
 
 class UndoArrayRemove(QUndoCommand):
     def __init__(
         self: Self,
-        index: QModelIndex,
+        parent: QModelIndex,
+        row: int,
+        count: int = 1,
+        model: Optional[Any] = None,
     ) -> None:
         super().__init__()
 
-        self._path = index.internalPointer().path
-        self._oldValue = index.internalPointer().value
-        self._model = index.model()
+        self._model = parent.model() if model is None else model
+        self._parentPath = self._model.parentNode(parent).path
+        self._row = row
+        self._count = count
+        self._values: List[Any] = []
+
+        self.setText("ArrayRemove")
 
-        self.setText("ValueChange")
+    @property
+    def values(self: Self) -> List[Any]:
+        return self._values
 
     def redo(self: Self) -> None:
-        index: QModelIndex = self._model.indexWithPath(self._path)
-        self._model.removeArrayElementAt(index)
+        parent: QModelIndex = self._model.indexWithPath(self._parentPath)
+        self._values = self._model.replay(lambda: self._model.removeArrayElements(parent, self._row, self._count))
 
     def undo(self: Self) -> None:
-        index: QModelIndex = self._model.indexWithPath(self._path)
-        self._model.addArrayElementAt(index, self._oldValue)
+        parent: QModelIndex = self._model.indexWithPath(self._parentPath)
+        self._model.replay(lambda: self._model.insertArrayElements(parent, self._row, self._values))
@@ -0,0 +1,42 @@
+from PyQt6.QtGui import QUndoCommand
+from PyQt6.QtCore import QModelIndex
+from typing import (
+    Self,
+    Any,
+    Optional,
+)
+
+class UndoMappingInsert(QUndoCommand):
+    def __init__(
+        self: Self,
+        parent: QModelIndex,
+        key: Any,
+        value: Any,
+        model: Optional[Any] = None,
+        row: Optional[int] = None,
+    ) -> None:
+        super().__init__()
+
+        self._model = parent.model() if model is None else model
+        self._parentPath = self._model.parentNode(parent).path
+        self._key = key
+        self._value = value
+        self._row = row
+        self._inserted = False
+
+        self.setText("MappingInsert")
+
+    @property
+    def inserted(self: Self) -> bool:
+        return self._inserted
+
+    def redo(self: Self) -> None:
+        parent: QModelIndex = self._model.indexWithPath(self._parentPath)
+        self._inserted = self._model.replay(lambda: self._model.insertMappingItem(parent, self._key, self._value, self._row))
+
+    def undo(self: Self) -> None:
+        if not self._inserted:
+            return
+
+        parent: QModelIndex = self._model.indexWithPath(self._parentPath)
+        self._model.replay(lambda: self._model.removeMappingItem(parent, self._key))
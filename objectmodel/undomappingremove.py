@@ -0,0 +1,43 @@
+from PyQt6.QtGui import QUndoCommand
+from PyQt6.QtCore import QModelIndex
+from typing import (
+    Self,
+    Any,
+    Optional,
+)
+
+class UndoMappingRemove(QUndoCommand):
+    def __init__(
+        self: Self,
+        parent: QModelIndex,
+        key: Any,
+        model: Optional[Any] = None,
+    ) -> None:
+        super().__init__()
+
+        self._model = parent.model() if model is None else model
+        self._parentPath = self._model.parentNode(parent).path
+        self._key = key
+        self._row = -1
+        self._value: Any = None
+
+        self.setText("MappingRemove")
+
+    @property
+    def row(self: Self) -> int:
+        return self._row
+
+    @property
+    def value(self: Self) -> Any:
+        return self._value
+
+    def redo(self: Self) -> None:
+        parent: QModelIndex = self._model.indexWithPath(self._parentPath)
+        self._row, self._value = self._model.replay(lambda: self._model.removeMappingItem(parent, self._key))
+
+    def undo(self: Self) -> None:
+        if self._row < 0:
+            return
+
+        parent: QModelIndex = self._model.indexWithPath(self._parentPath)
+        self._model.replay(lambda: self._model.insertMappingItem(parent, self._key, self._value, self._row))
@@ -0,0 +1,44 @@
+from PyQt6.QtGui import QUndoCommand
+from typing import (
+    Self,
+    Any,
+    List,
+    Tuple,
+    Optional,
+)
+
+class UndoValueBatch(QUndoCommand):
+    def __init__(
+        self: Self,
+        model: Any,
+        text: str = "ValueChange",
+    ) -> None:
+        super().__init__()
+
+        self._model = model
+        self._changes: List[Tuple[str, Any, Any]] = []
+
+        self.setText(text)
+
+    def __len__(self: Self) -> int:
+        return len(self._changes)
+
+    def append(
+        self: Self,
+        node: Any,
+        newValue: Any,
+        path: Optional[str] = None,
+    ) -> None:
+        self._changes.append((node.path if path is None else path, node.value, newValue))
+        self._model.assignValue(node, newValue)
+
+    def redo(self: Self) -> None:
+        for path, _, newValue in self._changes:
+            self.apply(path, newValue)
+
+    def undo(self: Self) -> None:
+        for path, oldValue, _ in reversed(self._changes):
+            self.apply(path, oldValue)
+
+    def apply(self: Self, path: str, value: Any) -> None:
+        self._model.assignValue(self._model.nodeWithPath(path), value)
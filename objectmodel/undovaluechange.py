@@ -1,15 +1,9 @@
 from PyQt6.QtGui import QUndoCommand
-from PyQt6.QtCore import (
-    QModelIndex,
-    Qt,
-)
+from PyQt6.QtCore import QModelIndex
 from typing import (
     Self,
     Any,
 )
-from copy import (
-    deepcopy,
-)
 
 class UndoValueChange(QUndoCommand):
     def __init__(
@@ -27,13 +21,11 @@ class UndoValueChange(QUndoCommand):
         self.setText("ValueChange")
 
     def redo(self: Self) -> None:
-        index: QModelIndex = self._model.indexWithPath(self._path)
-        index.internalPointer().value = self._newValue
-        self._model.dataChanged.emit(index, index, [Qt.ItemDataRole.EditRole])
-        self._model.layoutChanged.emit()
+        self.apply(self._newValue)
 
     def undo(self: Self) -> None:
-        index: QModelIndex = self._model.indexWithPath(self._path)
-        index.internalPointer().value = self._oldValue
-        self._model.dataChanged.emit(index, index, [Qt.ItemDataRole.EditRole])
-        self._model.layoutChanged.emit()
+        self.apply(self._oldValue)
+
+    def apply(self: Self, value: Any) -> None:
+        self._model.closeValueBatch()
+        self._model.assignValue(self._model.nodeWithPath(self._path), value)